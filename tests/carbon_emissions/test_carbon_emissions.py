@@ -29,6 +29,7 @@ async def test_carbon_emission_should_run_to_convert_watt_hours_to_co2g_on_mac(m
         cpu_energy_usage=energy_usage,
         memory_energy_usage=energy_usage,
         gpu_energy_usage=energy_usage,
+        duration_in_seconds=1.0,
     )
     name_alpha_iso_2 = "fr"
     mocker.patch.object(Country, "get_latest_co2g_kwh", return_value=co2g_per_kwh)
@@ -52,7 +53,7 @@ async def test_carbon_emission_should_run_to_convert_watt_hours_to_co2g_on_linux
         host_carbon_usage=0.0003333333333333334,
     )
     name_alpha_iso_2 = "fr"
-    energy_usage = EnergyUsage(host_energy_usage=60.0)
+    energy_usage = EnergyUsage(host_energy_usage=60.0, duration_in_seconds=1.0)
     mocker.patch.object(Country, "get_latest_co2g_kwh", return_value=co2g_per_kwh)
     mocker.patch.object(LinuxEnergyConsumption, "get_energy_usage", return_value=energy_usage)
     carbon_emission = CarbonEmission(
@@ -64,6 +65,25 @@ async def test_carbon_emission_should_run_to_convert_watt_hours_to_co2g_on_linux
     assert co2g == co2_expected
 
 
+@pytest.mark.asyncio
+async def test_carbon_emission_should_convert_the_increase_of_the_energy_totals_to_co2g(mocker):
+    co2g_per_kwh = 20.0
+    energy_usages = [
+        EnergyUsage(host_energy_usage=1.0, duration_in_seconds=1.0, energy_totals_in_joules={UsageType.HOST: 3600.0}),
+        EnergyUsage(host_energy_usage=1.0, duration_in_seconds=1.0, energy_totals_in_joules={UsageType.HOST: 10800.0}),
+    ]
+    mocker.patch.object(Country, "get_latest_co2g_kwh", return_value=co2g_per_kwh)
+    mocker.patch.object(CarbonEmission, "get_energy_usage", side_effect=energy_usages)
+    carbon_emission = CarbonEmission(location=Country(name="fr", co2g_kwh=co2g_per_kwh))
+
+    first_carbon_usage = await carbon_emission.get_co2_usage()
+    second_carbon_usage = await carbon_emission.get_co2_usage()
+
+    assert first_carbon_usage.host_carbon_usage == pytest.approx(0.02)
+    assert second_carbon_usage.host_carbon_usage == pytest.approx(0.04)
+    assert second_carbon_usage.cpu_carbon_usage is None
+
+
 def test_carbon_usage_with_type_and_conversion():
     host_carbon_usage = 12.4
     cpu_carbon_usage = 8.4
@@ -6,6 +6,7 @@ from tracarbon import EnergyUsage
 from tracarbon import Kubernetes
 from tracarbon import MacEnergyConsumption
 from tracarbon.cli import get_exporter
+from tracarbon.cli import list_exporters
 from tracarbon.cli import run_metrics
 from tracarbon.exporters import DatadogExporter
 from tracarbon.exporters import StdoutExporter
@@ -21,6 +22,13 @@ def test_get_exporter_by_name():
     assert isinstance(datadadog_exporter, DatadogExporter) is True
 
 
+def test_list_exporters_should_not_list_the_multi_exporter():
+    exporters = list_exporters(displayed=False)
+
+    assert "Stdout" in exporters
+    assert "Multi" not in exporters
+
+
 def test_get_exporter_by_name_should_raise_error():
     with pytest.raises(ValueError) as exception:
         get_exporter(exporter_name="unknown", metric_generators=[])
@@ -1,13 +1,23 @@
+import asyncio
 import sys
+import time
+from array import array
+from typing import AsyncGenerator
 
 import psutil
 import pytest
 
 from tracarbon import Country
 from tracarbon import MetricGenerator
+from tracarbon.exporters import ExportQueue
 from tracarbon.exporters import Metric
+from tracarbon.exporters import MetricBatch
+from tracarbon.exporters import MetricSpool
+from tracarbon.exporters import MetricType
+from tracarbon.exporters import OverflowPolicy
 from tracarbon.exporters import StdoutExporter
 from tracarbon.exporters import Tag
+from tracarbon.exporters.exporter import MetricAggregator
 
 
 def test_exporters_should_run_and_print_the_metrics(mocker, caplog):
@@ -35,15 +45,15 @@ def test_exporters_should_run_and_print_the_metrics(mocker, caplog):
     assert memory_metric.name in caplog.text
     assert str(memory_metric.value) in caplog.text
     assert str(memory_metric.tags) in caplog.text
-    assert exporter.metric_report["test_metric_1"].exporter_name == StdoutExporter.get_name()
-    assert exporter.metric_report["test_metric_1"].metric == memory_metric
-    assert exporter.metric_report["test_metric_1"].total > 0
-    assert exporter.metric_report["test_metric_1"].average > 0
-    assert exporter.metric_report["test_metric_1"].minimum < sys.float_info.max
-    assert exporter.metric_report["test_metric_1"].maximum > 0
-    assert exporter.metric_report["test_metric_1"].call_count == 1
-    assert exporter.metric_report["test_metric_1"].last_report_time is not None
-    assert exporter.metric_report["test_metric_1"].average_interval_in_seconds is None
+    assert exporter.metric_report[memory_metric.series_key].exporter_name == StdoutExporter.get_name()
+    assert exporter.metric_report[memory_metric.series_key].metric == memory_metric
+    assert exporter.metric_report[memory_metric.series_key].total > 0
+    assert exporter.metric_report[memory_metric.series_key].average > 0
+    assert exporter.metric_report[memory_metric.series_key].minimum < sys.float_info.max
+    assert exporter.metric_report[memory_metric.series_key].maximum > 0
+    assert exporter.metric_report[memory_metric.series_key].call_count == 1
+    assert exporter.metric_report[memory_metric.series_key].last_report_time is not None
+    assert exporter.metric_report[memory_metric.series_key].average_interval_in_seconds is None
 
 
 def test_metric_name_and_tags_format():
@@ -83,3 +93,374 @@ async def test_metric_generator_generate():
     metric_generated = await MetricGenerator(metrics=metrics).generate().__anext__()
 
     assert metric_generated.name == "test_metric_2"
+
+
+def test_exporter_should_run_the_metric_generators_concurrently():
+    async def get_value() -> float:
+        return 1.0
+
+    class SlowMetricGenerator(MetricGenerator):
+        async def generate(self) -> AsyncGenerator[Metric, None]:
+            await asyncio.sleep(0.2)
+            for metric in self.metrics:
+                yield metric
+
+    metric_generators = [
+        SlowMetricGenerator(metrics=[Metric(name=f"slow_metric_{index}", value=get_value)]) for index in range(3)
+    ]
+    exporter = StdoutExporter(metric_generators=metric_generators)
+
+    start = time.monotonic()
+    exporter.start(interval_in_seconds=60)
+    duration = time.monotonic() - start
+    exporter.stop()
+
+    assert duration < 0.5
+    assert set(exporter.metric_report) == {"slow_metric_0", "slow_metric_1", "slow_metric_2"}
+
+
+def test_exporter_should_isolate_failing_and_timed_out_metric_generators(caplog):
+    async def get_value() -> float:
+        return 1.0
+
+    class FailingMetricGenerator(MetricGenerator):
+        async def generate(self) -> AsyncGenerator[Metric, None]:
+            raise ValueError("sensor failure")
+            yield
+
+    class HangingMetricGenerator(MetricGenerator):
+        async def generate(self) -> AsyncGenerator[Metric, None]:
+            await asyncio.sleep(60)
+            yield
+
+    metric_generators = [
+        FailingMetricGenerator(metrics=[]),
+        HangingMetricGenerator(metrics=[]),
+        MetricGenerator(metrics=[Metric(name="healthy_metric", value=get_value)]),
+    ]
+    exporter = StdoutExporter(metric_generators=metric_generators, metric_generator_timeout_in_seconds=0.1)
+
+    exporter.start(interval_in_seconds=60)
+    exporter.stop()
+
+    assert exporter.metric_report["healthy_metric"].call_count == 1
+    assert "MetricGenerator[HangingMetricGenerator] timed out after 0.1s" in caplog.text
+
+
+def test_metric_report_should_be_kept_per_series_with_a_bounded_cardinality():
+    async def get_value() -> float:
+        return 1.0
+
+    exporter = StdoutExporter(metric_generators=[], metric_report_max_series=2)
+    exporter.reset_metric_report()
+    metrics = [
+        Metric(name="energy_consumption_kubernetes_total", value=get_value, tags=[Tag(key="pod_name", value=pod)])
+        for pod in ("a", "b", "c")
+    ]
+
+    asyncio.run(exporter.add_metric_to_report(metric=metrics[0], value=1.0))
+    asyncio.run(exporter.add_metric_to_report(metric=metrics[1], value=2.0))
+    asyncio.run(exporter.add_metric_to_report(metric=metrics[0], value=3.0))
+    asyncio.run(exporter.add_metric_to_report(metric=metrics[2], value=4.0))
+
+    assert list(exporter.metric_report) == [
+        "energy_consumption_kubernetes_total{pod_name=a}",
+        "energy_consumption_kubernetes_total{pod_name=c}",
+    ]
+    assert exporter.metric_report[metrics[0].series_key].total == 4.0
+    assert exporter.metric_report.evicted_series_count == 1
+
+
+def test_metric_report_should_evict_the_idle_series(mocker):
+    async def get_value() -> float:
+        return 1.0
+
+    monotonic = mocker.patch("tracarbon.exporters.exporter.time.monotonic", return_value=0.0)
+    exporter = StdoutExporter(metric_generators=[], metric_report_idle_timeout_in_seconds=60)
+    exporter.reset_metric_report()
+    idle_metric = Metric(name="idle_metric", value=get_value)
+    active_metric = Metric(name="active_metric", value=get_value)
+
+    asyncio.run(exporter.add_metric_to_report(metric=idle_metric, value=1.0))
+    monotonic.return_value = 30.0
+    asyncio.run(exporter.add_metric_to_report(metric=active_metric, value=1.0))
+    monotonic.return_value = 61.0
+    asyncio.run(exporter.add_metric_to_report(metric=active_metric, value=1.0))
+
+    assert list(exporter.metric_report) == ["active_metric"]
+    assert exporter.metric_report.evicted_series_count == 1
+
+
+@pytest.mark.asyncio
+async def test_metric_generator_should_generate_a_batch_of_the_metrics():
+    async def get_value() -> float:
+        return 3.0
+
+    async def get_none() -> float | None:
+        return None
+
+    async def get_error() -> float:
+        raise ValueError("sensor error")
+
+    metrics = [
+        Metric(name="value", value=get_value),
+        Metric(name="none", value=get_none),
+        Metric(name="error", value=get_error),
+    ]
+
+    batch = await MetricGenerator(metrics=metrics).generate_batch()
+
+    assert len(batch) == 3
+    assert list(batch) == [(metrics[0], 3.0), (metrics[1], None), (metrics[2], None)]
+    replayed_metrics = [metric async for metric in batch.to_metric_generator().generate()]
+    assert [await metric.value() for metric in replayed_metrics] == [3.0, None, None]
+    assert [metric.series_key for metric in replayed_metrics] == ["value", "none", "error"]
+
+
+def test_exporter_overriding_launch_only_should_be_launched_per_metric():
+    launched = []
+
+    async def get_value() -> float:
+        return 1.0
+
+    class LegacyExporter(StdoutExporter):
+        async def launch(self, metric_generator: MetricGenerator) -> None:
+            async for metric in metric_generator.generate():
+                launched.append((metric.name, await metric.value()))
+
+    exporter = LegacyExporter(metric_generators=[MetricGenerator(metrics=[Metric(name="legacy", value=get_value)])])
+    exporter.start(interval_in_seconds=60)
+    exporter.stop()
+
+    assert not LegacyExporter.launches_batches()
+    assert StdoutExporter.launches_batches()
+    assert launched == [("legacy", 1.0)]
+
+
+def test_exporter_should_aggregate_the_samples_between_two_exports():
+    samples = []
+
+    async def get_value() -> float:
+        samples.append(len(samples) + 1.0)
+        return samples[-1]
+
+    metric = Metric(name="sampled_metric", value=get_value)
+    exporter = StdoutExporter(metric_generators=[MetricGenerator(metrics=[metric])])
+
+    exporter.start(interval_in_seconds=0.05, export_interval_in_seconds=60)
+    time.sleep(0.3)
+    exporter.stop()
+
+    metric_report = exporter.metric_report[metric.series_key]
+    assert len(samples) > 2
+    assert metric_report.call_count == 1
+    assert min(samples) < metric_report.total < max(samples)
+
+
+def test_counters_should_keep_their_cumulative_total_through_aggregation_and_spooling():
+    metric_generator = MetricGenerator(metrics=[])
+    aggregator = MetricAggregator()
+    for now, increase in ((1.0, 5.0), (2.0, None), (3.0, 2.0)):
+        batch = MetricBatch()
+        metric_generator.append_series_counter(batch=batch, name="energy_joules_total", tags=(), increase=increase)
+        aggregator.add(batch=batch, now=now)
+
+    aggregated_batch = aggregator.flush(now=4.0)
+
+    assert [(metric.metric_type, value) for metric, value in aggregated_batch] == [(MetricType.COUNTER, 7.0)]
+    replayed_batch = MetricBatch.from_record(aggregated_batch.to_record())
+    assert [(metric.metric_type, value) for metric, value in replayed_batch] == [(MetricType.COUNTER, 7.0)]
+    legacy_record = {"timestamp": 0.0, "metrics": [["energy", [], 1.0]]}
+    assert [metric.metric_type for metric, _ in MetricBatch.from_record(legacy_record)] == [MetricType.GAUGE]
+
+
+def test_exporter_should_hold_the_last_values_of_a_slower_metric_generator():
+    fast_samples = []
+    slow_samples = []
+
+    async def get_fast_value() -> float:
+        fast_samples.append(1.0)
+        return 1.0
+
+    async def get_slow_value() -> float:
+        slow_samples.append(2.0)
+        return 2.0
+
+    fast_metric = Metric(name="fast_metric", value=get_fast_value)
+    slow_metric = Metric(name="slow_metric", value=get_slow_value)
+    exporter = StdoutExporter(
+        metric_generators=[
+            MetricGenerator(metrics=[fast_metric]),
+            MetricGenerator(metrics=[slow_metric], interval_in_seconds=60),
+        ]
+    )
+
+    exporter.start(interval_in_seconds=0.05)
+    time.sleep(0.3)
+    exporter.stop()
+
+    slow_report = exporter.metric_report[slow_metric.series_key]
+    assert len(slow_samples) == 1
+    assert slow_report.call_count > 1
+    assert exporter.metric_report[fast_metric.series_key].call_count > 1
+    assert slow_report.average == 2.0
+
+
+def test_exporter_should_not_delay_the_sampling_with_a_slow_exporter():
+    samples = []
+    exported = []
+
+    async def get_value() -> float:
+        samples.append(len(samples) + 1.0)
+        return samples[-1]
+
+    class SlowExporter(StdoutExporter):
+        async def launch_batch(self, batch: MetricBatch) -> None:
+            await asyncio.sleep(0.1)
+            exported.extend(value for _, value in batch)
+
+    metric = Metric(name="sampled_metric", value=get_value)
+    exporter = SlowExporter(
+        metric_generators=[MetricGenerator(metrics=[metric])],
+        export_queue_size=1,
+        export_overflow_policy=OverflowPolicy.COALESCE,
+    )
+
+    exporter.start(interval_in_seconds=0.02)
+    time.sleep(0.3)
+    exporter.stop()
+
+    assert exporter.export_queue is not None
+    assert exporter.export_queue.coalesced_batch_count > 0
+    assert len(samples) > 2 * len(exported)
+    assert len(exporter.export_queue) == 0
+
+
+def batch_of(**values: float) -> MetricBatch:
+    async def get_value() -> float:
+        return 0.0
+
+    return MetricBatch(
+        metrics=[Metric(name=name, value=get_value) for name in values],
+        values=array("d", values.values()),
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_queue_should_drop_the_oldest_batch_when_full():
+    export_queue = ExportQueue(maximum_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    first, second, third = batch_of(a=1.0), batch_of(a=2.0), batch_of(a=3.0)
+
+    for batch in (first, second, third):
+        await export_queue.put(batch)
+
+    assert export_queue.dropped_batch_count == 1
+    assert await export_queue.get() is second
+    assert await export_queue.get() is third
+    await export_queue.task_done()
+    await export_queue.task_done()
+    await asyncio.wait_for(export_queue.join(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_export_queue_should_coalesce_to_the_latest_values_when_full():
+    export_queue = ExportQueue(maximum_size=1, overflow_policy=OverflowPolicy.COALESCE)
+
+    await export_queue.put(batch_of(a=1.0, b=1.0))
+    await export_queue.put(batch_of(a=2.0, b=float("nan"), c=2.0))
+    batch = await export_queue.get()
+
+    assert export_queue.coalesced_batch_count == 1
+    assert [(metric.name, value) for metric, value in batch] == [("a", 2.0), ("b", 1.0), ("c", 2.0)]
+
+
+@pytest.mark.asyncio
+async def test_export_queue_should_block_until_a_batch_is_exported_when_full():
+    export_queue = ExportQueue(maximum_size=1, overflow_policy=OverflowPolicy.BLOCK)
+    await export_queue.put(batch_of(a=1.0))
+
+    put = asyncio.ensure_future(export_queue.put(batch_of(a=2.0)))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+    await export_queue.get()
+    await asyncio.wait_for(put, timeout=1)
+
+    assert export_queue.blocked_batch_count == 1
+    assert len(export_queue) == 1
+
+
+def test_export_queue_should_have_a_positive_size():
+    with pytest.raises(ValueError):
+        ExportQueue(maximum_size=0)
+
+
+def test_exporter_should_spool_the_undelivered_batches_and_replay_them(tmp_path):
+    delivered = []
+    reachable = False
+
+    class UnreliableExporter(StdoutExporter):
+        async def launch_batch(self, batch: MetricBatch) -> None:
+            if not reachable:
+                raise ConnectionError("unreachable")
+            delivered.extend((metric.name, metric.tags, value) for metric, value in batch)
+
+    async def get_value() -> float:
+        return 1.0
+
+    metric = Metric(name="spooled_metric", value=get_value, tags=[Tag(key="key", value="value")])
+    exporter = UnreliableExporter(metric_generators=[], spool=MetricSpool(path=str(tmp_path)))
+    batch = MetricBatch()
+    batch.append(metric=metric, value=1.0)
+
+    asyncio.run(exporter.export_batch(batch=batch))
+    assert exporter.spool is not None and not exporter.spool.is_empty
+    reachable = True
+    asyncio.run(exporter.export_batch(batch=batch))
+
+    assert delivered == [("spooled_metric", metric.tags, 1.0)] * 2
+    assert exporter.spool.is_empty
+    assert exporter.spool.replayed_record_count == 1
+
+
+def test_exporter_should_prime_the_metric_generators_and_sample_them_on_stop():
+    events = []
+
+    class IntervalMetricGenerator(MetricGenerator):
+        async def prime(self) -> None:
+            events.append("prime")
+
+        async def generate_batch(self) -> MetricBatch:
+            events.append("sample")
+            return MetricBatch()
+
+    exporter = StdoutExporter(
+        metric_generators=[IntervalMetricGenerator(metrics=[]), MetricGenerator(metrics=[])],
+    )
+    exporter.start(interval_in_seconds=60)
+    exporter.stop()
+
+    assert IntervalMetricGenerator.needs_priming()
+    assert not MetricGenerator.needs_priming()
+    assert events == ["prime", "sample", "sample"]
+
+
+def test_exporter_should_start_when_a_metric_generator_hangs_priming(caplog):
+    events = []
+
+    class HangingMetricGenerator(MetricGenerator):
+        async def prime(self) -> None:
+            await asyncio.sleep(3600)
+
+        async def generate_batch(self) -> MetricBatch:
+            events.append("sample")
+            return MetricBatch()
+
+    exporter = StdoutExporter(
+        metric_generators=[HangingMetricGenerator(metrics=[])],
+        metric_generator_prime_timeout_in_seconds=0.1,
+    )
+    exporter.start(interval_in_seconds=60)
+    exporter.stop()
+
+    assert events == ["sample", "sample"]
+    assert "MetricGenerator[HangingMetricGenerator] timed out after 0.1s priming in the Stdout exporter." in caplog.text
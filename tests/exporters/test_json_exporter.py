@@ -13,7 +13,7 @@ from tracarbon.exporters import Tag
 
 
 def test_json_exporter_should_write_well_formatted_metrics_in_json_file(mocker, tmpdir):
-    mock = mocker.patch("tracarbon.exporters.json_exporter.datetime")
+    mock = mocker.patch("tracarbon.exporters.exporter.datetime")
     fixed_timestamp = datetime(2021, 12, 21, tzinfo=timezone.utc)
     mock.now.return_value = fixed_timestamp
     test_json_file = tmpdir.mkdir("data").join("test.json")
@@ -63,10 +63,10 @@ def test_json_exporter_should_write_well_formatted_metrics_in_json_file(mocker,
     with open(test_json_file, "rb") as file:
         assert orjson.loads(file.read()) == expected
 
-    assert exporter.metric_report["test_metric_1"].exporter_name == JSONExporter.get_name()
-    assert exporter.metric_report["test_metric_1"].metric == memory_metric
-    assert exporter.metric_report["test_metric_1"].total > 0
-    assert exporter.metric_report["test_metric_1"].average > 0
-    assert exporter.metric_report["test_metric_1"].minimum < sys.float_info.max
-    assert exporter.metric_report["test_metric_1"].maximum > 0
-    assert exporter.metric_report["test_metric_1"].call_count == 1
+    assert exporter.metric_report[memory_metric.series_key].exporter_name == JSONExporter.get_name()
+    assert exporter.metric_report[memory_metric.series_key].metric == memory_metric
+    assert exporter.metric_report[memory_metric.series_key].total > 0
+    assert exporter.metric_report[memory_metric.series_key].average > 0
+    assert exporter.metric_report[memory_metric.series_key].minimum < sys.float_info.max
+    assert exporter.metric_report[memory_metric.series_key].maximum > 0
+    assert exporter.metric_report[memory_metric.series_key].call_count == 1
@@ -0,0 +1,93 @@
+import asyncio
+
+import orjson
+
+from tracarbon import MetricGenerator
+from tracarbon.exporters import Exporter
+from tracarbon.exporters import JSONExporter
+from tracarbon.exporters import Metric
+from tracarbon.exporters import MultiExporter
+from tracarbon.exporters import StdoutExporter
+from tracarbon.exporters import Tag
+
+
+def test_multi_exporter_should_sample_once_and_dispatch_to_every_exporter(tmpdir):
+    calls = []
+
+    async def get_value() -> float:
+        calls.append(1)
+        return 42.0
+
+    metric = Metric(name="test_metric", value=get_value, tags=[Tag(key="test", value="tags")])
+    test_json_file = tmpdir.mkdir("data").join("test.json")
+    stdout_exporter = StdoutExporter(metric_generators=[])
+    json_exporter = JSONExporter(metric_generators=[], path=str(test_json_file))
+    exporter = MultiExporter(
+        exporters=[stdout_exporter, json_exporter],
+        metric_generators=[MetricGenerator(metrics=[metric])],
+    )
+
+    exporter.start(interval_in_seconds=60)
+    exporter.stop()
+    json_exporter.flush()
+
+    assert len(calls) == 1
+    assert exporter.metric_report[metric.series_key].exporter_name == MultiExporter.get_name()
+    assert stdout_exporter.metric_report[metric.series_key].total == 42.0
+    assert json_exporter.metric_report[metric.series_key].total == 42.0
+    with open(test_json_file, "rb") as file:
+        assert orjson.loads(file.read())[0]["metric_value"] == 42.0
+
+
+def test_multi_exporter_should_not_be_stalled_by_a_slow_exporter(caplog):
+    async def get_value() -> float:
+        return 1.0
+
+    class SlowExporter(StdoutExporter):
+        async def launch(self, metric_generator: MetricGenerator) -> None:
+            await asyncio.sleep(60)
+
+        @classmethod
+        def get_name(cls) -> str:
+            return "Slow"
+
+    stdout_exporter = StdoutExporter(metric_generators=[])
+    exporter = MultiExporter(
+        exporters=[SlowExporter(metric_generators=[]), stdout_exporter],
+        metric_generators=[MetricGenerator(metrics=[Metric(name="test_metric", value=get_value)])],
+        exporter_timeout_in_seconds=0.1,
+    )
+
+    exporter.start(interval_in_seconds=60)
+    exporter.stop()
+
+    assert stdout_exporter.metric_report["test_metric"].call_count == 1
+    assert "Exporter[Slow] timed out after 0.1s." in caplog.text
+    assert isinstance(exporter, Exporter)
+
+
+def test_multi_exporter_should_not_wait_for_a_hanging_exporter_to_tick(caplog):
+    async def get_value() -> float:
+        return 1.0
+
+    class HangingExporter(StdoutExporter):
+        async def launch(self, metric_generator: MetricGenerator) -> None:
+            await asyncio.sleep(3600)
+
+        @classmethod
+        def get_name(cls) -> str:
+            return "Hanging"
+
+    stdout_exporter = StdoutExporter(metric_generators=[])
+    exporter = MultiExporter(
+        exporters=[HangingExporter(metric_generators=[]), stdout_exporter],
+        metric_generators=[MetricGenerator(metrics=[Metric(name="test_metric", value=get_value)])],
+        export_queue_drain_timeout_in_seconds=0.1,
+    )
+
+    exporter.start(interval_in_seconds=60)
+    exporter.stop()
+
+    assert exporter.exporter_timeout_in_seconds == 30.0
+    assert stdout_exporter.metric_report["test_metric"].call_count == 1
+    assert "queued batch(es) not exported by the Hanging exporter after 0.1s." in caplog.text
@@ -1,10 +1,15 @@
 import sys
 
+import prometheus_client
 import psutil
+import pytest
 
 from tracarbon import Country
 from tracarbon import MetricGenerator
 from tracarbon.exporters import Metric
+from tracarbon.exporters import MetricBatch
+from tracarbon.exporters import MetricType
+from tracarbon.exporters import MetricValue
 from tracarbon.exporters import PrometheusExporter
 from tracarbon.exporters import Tag
 
@@ -49,15 +54,19 @@ def test_prometheus_exporter(mocker):
     exporter.stop()
 
     assert str(exporter.prometheus_metrics["tracarbon_test_metric_1"]) == expected_metric_1
-    assert exporter.metric_report["test_metric_1"].exporter_name == PrometheusExporter.get_name()
-    assert exporter.metric_report["test_metric_1"].metric == memory_metric
-    assert exporter.metric_report["test_metric_1"].total > 0
-    assert exporter.metric_report["test_metric_1"].average > 0
-    assert exporter.metric_report["test_metric_1"].minimum < sys.float_info.max
-    assert exporter.metric_report["test_metric_1"].maximum > 0
-    assert exporter.metric_report["test_metric_1"].call_count == 1
-    assert exporter.metric_report["zero_metric"].total == zero_value
-    assert exporter.metric_report["zero_metric"].call_count == 1
+    assert exporter.metric_report[memory_metric.series_key].exporter_name == PrometheusExporter.get_name()
+    assert exporter.metric_report[memory_metric.series_key].metric == memory_metric
+    assert exporter.metric_report[memory_metric.series_key].total > 0
+    assert exporter.metric_report[memory_metric.series_key].average > 0
+    assert exporter.metric_report[memory_metric.series_key].minimum < sys.float_info.max
+    assert exporter.metric_report[memory_metric.series_key].maximum > 0
+    assert exporter.metric_report[memory_metric.series_key].call_count == 1
+    assert exporter.metric_report[memory_metric.series_key].p99 == pytest.approx(memory_value, rel=0.01)
+    assert prometheus_client.REGISTRY.get_sample_value(
+        "tracarbon_test_metric_1_quantile", {"test": "tags", "quantile": "0.99"}
+    ) == pytest.approx(memory_value, rel=0.01)
+    assert exporter.metric_report[zero_metric.series_key].total == zero_value
+    assert exporter.metric_report[zero_metric.series_key].call_count == 1
 
 
 def test_prometheus_exporter_can_be_initialized_more_than_once(mocker):
@@ -65,3 +74,75 @@ def test_prometheus_exporter_can_be_initialized_more_than_once(mocker):
 
     PrometheusExporter(quit=True, metric_generators=[], address="127.0.0.1", port=0)
     PrometheusExporter(quit=True, metric_generators=[], address="127.0.0.1", port=0)
+
+
+@pytest.mark.asyncio
+async def test_prometheus_exporter_should_expose_the_counters_as_counters(mocker):
+    mocker.patch("tracarbon.exporters.prometheus_exporter.start_http_server")
+    exporter = PrometheusExporter(quit=True, metric_generators=[], metric_prefix_name="tracarbon", port=0)
+    metric = Metric(
+        name="test_counter_joules_total",
+        value=MetricValue(),
+        tags=[Tag(key="test", value="tags")],
+        metric_type=MetricType.COUNTER,
+    )
+
+    for total in (5.0, 8.0, 3.0):
+        batch = MetricBatch()
+        batch.append(metric=metric, value=total)
+        await exporter.launch_batch(batch=batch)
+
+    assert str(exporter.prometheus_metrics["tracarbon_test_counter_joules_total"]) == (
+        "counter:tracarbon_test_counter_joules"
+    )
+    assert prometheus_client.REGISTRY.get_sample_value(
+        "tracarbon_test_counter_joules_total", {"test": "tags"}
+    ) == pytest.approx(11.0)
+
+
+@pytest.mark.asyncio
+async def test_prometheus_exporter_should_remove_the_evicted_series_from_the_collectors(mocker):
+    mocker.patch("tracarbon.exporters.prometheus_exporter.start_http_server")
+    exporter = PrometheusExporter(
+        quit=True, metric_generators=[], metric_prefix_name="tracarbon", port=0, metric_report_max_series=1
+    )
+    metrics = [
+        Metric(name="test_evicted_metric", value=MetricValue(), tags=[Tag(key="pod", value=pod)])
+        for pod in ("pod-1", "pod-2")
+    ]
+
+    for metric in metrics:
+        batch = MetricBatch()
+        batch.append(metric=metric, value=1.0)
+        await exporter.launch_batch(batch=batch)
+
+    assert prometheus_client.REGISTRY.get_sample_value("tracarbon_test_evicted_metric", {"pod": "pod-1"}) is None
+    assert (
+        prometheus_client.REGISTRY.get_sample_value(
+            "tracarbon_test_evicted_metric_quantile", {"pod": "pod-1", "quantile": "0.99"}
+        )
+        is None
+    )
+    assert prometheus_client.REGISTRY.get_sample_value("tracarbon_test_evicted_metric", {"pod": "pod-2"}) == 1.0
+    assert list(exporter._prometheus_children) == [metrics[1].series_key]
+
+
+@pytest.mark.asyncio
+async def test_prometheus_exporter_should_evict_the_least_recently_updated_series(mocker):
+    mocker.patch("tracarbon.exporters.prometheus_exporter.start_http_server")
+    exporter = PrometheusExporter(
+        quit=True, metric_generators=[], metric_prefix_name="tracarbon", port=0, metric_report_max_series=2
+    )
+    metrics = {
+        pod: Metric(name="test_lru_metric", value=MetricValue(), tags=[Tag(key="pod", value=pod)])
+        for pod in ("pod-1", "pod-2", "pod-3")
+    }
+
+    for pod in ("pod-1", "pod-2", "pod-1", "pod-3"):
+        batch = MetricBatch()
+        batch.append(metric=metrics[pod], value=1.0)
+        await exporter.launch_batch(batch=batch)
+
+    assert list(exporter._prometheus_children) == [metrics["pod-1"].series_key, metrics["pod-3"].series_key]
+    assert prometheus_client.REGISTRY.get_sample_value("tracarbon_test_lru_metric", {"pod": "pod-1"}) == 1.0
+    assert prometheus_client.REGISTRY.get_sample_value("tracarbon_test_lru_metric", {"pod": "pod-2"}) is None
@@ -0,0 +1,58 @@
+import pytest
+
+from tracarbon.exporters import MetricSpool
+
+
+@pytest.mark.asyncio
+async def test_spool_should_replay_the_records_in_batches_and_delete_the_delivered_segments(tmp_path):
+    spool = MetricSpool(path=str(tmp_path), segment_size_in_bytes=16, replay_batch_size=3)
+    spool.append([{"value": value} for value in range(5)])
+    spool.append([{"value": value} for value in range(5, 10)])
+    replayed = []
+
+    async def send(records):
+        replayed.append([record["value"] for record in records])
+
+    assert len(spool.segments()) == 2
+    assert spool.size_in_bytes > 0
+    assert await spool.replay(send=send)
+    assert replayed == [[0, 1, 2], [3, 4], [5, 6, 7], [8, 9]]
+    assert spool.is_empty
+    assert spool.spooled_record_count == spool.replayed_record_count == 10
+    assert spool.replay_throughput is not None
+
+
+@pytest.mark.asyncio
+async def test_spool_should_keep_the_records_when_the_replay_fails(tmp_path):
+    spool = MetricSpool(path=str(tmp_path))
+    spool.append([{"value": 1.0}])
+
+    async def send(records):
+        raise ConnectionError("unreachable")
+
+    assert not await spool.replay(send=send)
+    assert not spool.is_empty
+    assert MetricSpool(path=str(tmp_path)).read(spool.segments()[0]) == [{"value": 1.0}]
+
+
+def test_spool_should_count_the_pending_segments_without_listing_the_directory(tmp_path, mocker):
+    spool = MetricSpool(path=str(tmp_path), segment_size_in_bytes=16)
+    assert spool.is_empty
+    spool.append([{"value": value} for value in range(5)])
+    spool.append([{"value": value} for value in range(5, 10)])
+    assert MetricSpool(path=str(tmp_path))._pending_segment_count == 2
+    listdir = mocker.patch("tracarbon.exporters.spool.os.listdir")
+
+    assert not spool.is_empty
+    assert spool._pending_segment_count == 2
+    listdir.assert_not_called()
+
+
+def test_spool_should_drop_the_oldest_segments_to_stay_bounded(tmp_path):
+    spool = MetricSpool(path=str(tmp_path), segment_size_in_bytes=10, max_size_in_bytes=30)
+    for value in range(10):
+        spool.append([{"value": "x" * 10, "index": value}])
+
+    assert spool.size_in_bytes <= 30 + 10 * 3
+    assert spool.dropped_segment_count > 0
+    assert MetricSpool.read(spool.segments()[-1]) == [{"value": "x" * 10, "index": 9}]
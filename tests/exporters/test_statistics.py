@@ -0,0 +1,113 @@
+import math
+import random
+import statistics
+
+import pytest
+
+from tracarbon.exporters.statistics import QuantileSketch
+from tracarbon.exporters.statistics import RunningStatistics
+from tracarbon.exporters.statistics import SeriesAggregate
+
+
+def test_running_statistics_should_match_the_batch_statistics():
+    values = [10.0, 12.0, 8.0, 15.0, 11.0]
+    running_statistics = RunningStatistics()
+
+    for index, value in enumerate(values):
+        running_statistics.add(value=value, now=float(index))
+
+    assert running_statistics.count == len(values)
+    assert running_statistics.total == sum(values)
+    assert running_statistics.mean == pytest.approx(statistics.mean(values))
+    assert running_statistics.variance == pytest.approx(statistics.variance(values))
+    assert running_statistics.standard_deviation == pytest.approx(statistics.stdev(values))
+    assert running_statistics.minimum == 8.0
+    assert running_statistics.maximum == 15.0
+    assert running_statistics.average_interval_in_seconds == 1.0
+
+
+def test_running_statistics_should_weight_the_mean_by_the_interval():
+    running_statistics = RunningStatistics()
+
+    running_statistics.add(value=100.0, now=0.0)
+    running_statistics.add(value=10.0, now=9.0)
+    running_statistics.add(value=100.0, now=10.0)
+
+    assert running_statistics.mean == 70.0
+    assert running_statistics.time_weighted_mean == pytest.approx(19.0)
+    assert running_statistics.average_interval_in_seconds == 5.0
+
+
+def test_running_statistics_without_enough_values():
+    running_statistics = RunningStatistics()
+
+    assert running_statistics.time_weighted_mean is None
+    assert running_statistics.variance is None
+
+    running_statistics.add(value=5.0, now=1.0)
+
+    assert running_statistics.time_weighted_mean == 5.0
+    assert running_statistics.variance is None
+    assert running_statistics.average_interval_in_seconds is None
+
+
+def test_quantile_sketch_should_estimate_the_quantiles_within_the_relative_accuracy():
+    generator = random.Random(42)
+    values = sorted(generator.lognormvariate(3, 1) for _ in range(10000))
+    sketch = QuantileSketch(relative_accuracy=0.01)
+
+    for value in values:
+        sketch.add(value=value)
+
+    for quantile in (0.5, 0.9, 0.95, 0.99):
+        expected = values[round(quantile * (len(values) - 1))]
+        assert sketch.quantile(quantile=quantile) == pytest.approx(expected, rel=0.01)
+    assert sketch.quantile(quantile=0) == values[0]
+    assert sketch.quantile(quantile=1) == values[-1]
+
+
+def test_quantile_sketch_should_merge_without_the_raw_values():
+    first_sketch = QuantileSketch()
+    second_sketch = QuantileSketch()
+    for value in range(1, 501):
+        first_sketch.add(value=float(value))
+    for value in range(501, 1001):
+        second_sketch.add(value=float(value))
+
+    first_sketch.merge(QuantileSketch.from_dict(second_sketch.to_dict()))
+
+    assert first_sketch.count == 1000
+    assert first_sketch.quantile(quantile=0.5) == pytest.approx(500, rel=0.01)
+    assert first_sketch.quantile(quantile=0.99) == pytest.approx(990, rel=0.01)
+    with pytest.raises(ValueError):
+        first_sketch.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_quantile_sketch_should_bound_its_memory():
+    sketch = QuantileSketch(max_bucket_count=10)
+
+    for value in range(-100, 1000):
+        sketch.add(value=float(value))
+
+    assert len(sketch.positive_buckets) <= 10
+    assert len(sketch.negative_buckets) <= 10
+    assert sketch.zero_count == 1
+    assert sketch.quantile(quantile=0.99) == pytest.approx(989, rel=0.01)
+    assert QuantileSketch().quantile(quantile=0.5) is None
+
+
+def test_series_aggregate_should_integrate_the_values_over_the_window():
+    aggregate = SeriesAggregate(start_time=0.0)
+
+    aggregate.add(value=10.0, now=1.0)
+    aggregate.add(value=40.0, now=2.0)
+    aggregate.add(value=20.0, now=4.0)
+
+    assert aggregate.count == 3
+    assert aggregate.total == 70.0
+    assert aggregate.minimum == 10.0
+    assert aggregate.maximum == 40.0
+    assert aggregate.last == 20.0
+    assert aggregate.integral == 90.0
+    assert aggregate.time_weighted_mean == 22.5
+    assert math.isnan(SeriesAggregate(start_time=0.0).time_weighted_mean)
@@ -60,10 +60,10 @@ async def test_get_energy_report_first_call():
 
     energy_report = await amd_rapl.get_energy_report()
 
-    # First call: time delta is 1 second by default
-    # Energy values should be computed from the difference with themselves (0)
+    # First call: the reading is the baseline, no energy is measured yet
     assert energy_report.host_energy_usage == 0.0
     assert energy_report.cpu_energy_usage is None or energy_report.cpu_energy_usage == 0.0
+    assert energy_report.duration_in_seconds == 0.0
 
 
 @pytest.mark.asyncio
@@ -164,3 +164,39 @@ def test_classify_domain():
 
     assert amd_rapl._classify_domain("unknown_label") == "unknown"
     assert amd_rapl._classify_domain("something_else") == "unknown"
+
+
+@pytest.mark.asyncio
+@pytest.mark.linux
+@pytest.mark.darwin
+async def test_get_energy_report_should_time_sub_second_intervals_with_monotonic_timestamps():
+    path = f"{pathlib.Path(__file__).parent.resolve()}/data/amd-energy"
+    amd_rapl = AMDRAPL(amd_energy_path=path)
+    for rapl_result in await amd_rapl.get_amd_rapl_power_usage():
+        rapl_result.energy_uj -= 500_000
+        rapl_result.timestamp_ns -= 500_000_000
+        amd_rapl.rapl_results[rapl_result.name] = rapl_result
+
+    energy_report = await amd_rapl.get_energy_report()
+
+    assert energy_report.host_energy_usage == pytest.approx(1.0, rel=0.05)
+    assert energy_report.duration_in_seconds == pytest.approx(0.5, rel=0.05)
+
+
+@pytest.mark.asyncio
+@pytest.mark.linux
+@pytest.mark.darwin
+async def test_get_energy_report_should_break_down_the_sockets_and_the_cores_on_demand():
+    path = f"{pathlib.Path(__file__).parent.resolve()}/data/amd-energy"
+    amd_rapl = AMDRAPL(amd_energy_path=path)
+    amd_rapl_with_cores = AMDRAPL(amd_energy_path=path, core_breakdown=True)
+
+    energy_report = await amd_rapl.get_energy_report()
+    energy_report_with_cores = await amd_rapl_with_cores.get_energy_report()
+
+    assert list(energy_report.breakdown) == [("Esocket0", "package", "0", 0.0)]
+    assert sorted(energy_report_with_cores.breakdown) == [
+        ("Ecore0", "core", "", 0.0),
+        ("Ecore1", "core", "", 0.0),
+        ("Esocket0", "package", "0", 0.0),
+    ]
@@ -1,14 +1,34 @@
+import asyncio
 import shutil
+from contextlib import suppress
 
 import pytest
 
 from tracarbon.exceptions import HardwareNoGPUDetectedException
 from tracarbon.exceptions import TracarbonException
 from tracarbon.hardwares.gpu import AMDGPU
+from tracarbon.hardwares.gpu import AMDGPUSysfs
 from tracarbon.hardwares.gpu import AppleSiliconGPU
 from tracarbon.hardwares.gpu import AppleSiliconPowerMetrics
 from tracarbon.hardwares.gpu import GPUInfo
 from tracarbon.hardwares.gpu import NvidiaGPU
+from tracarbon.hardwares.gpu import NvidiaGPUSampler
+
+
+@pytest.fixture(autouse=True)
+def no_amd_gpu_sysfs(mocker, tmp_path):
+    mocker.patch.object(AMDGPU, "sysfs_path", str(tmp_path / "no-drm"))
+    yield
+    AMDGPU.close_sysfs()
+
+
+def _write_amd_gpu_card(drm_path, card, vendor="0x1002", power_file="power1_average", power_uw="45000000"):
+    device_path = drm_path / card / "device"
+    hwmon_path = device_path / "hwmon" / "hwmon3"
+    hwmon_path.mkdir(parents=True)
+    (device_path / "vendor").write_text(f"{vendor}\n")
+    (hwmon_path / power_file).write_text(f"{power_uw}\n")
+    return device_path
 
 
 def test_get_nvidia_gpu_power_usage(mocker):
@@ -33,6 +53,28 @@ def test_get_nvidia_gpu_power_usage_multi_gpu(mocker):
     assert gpu_usage == gpu_usage_expected
 
 
+def test_get_nvidia_gpu_devices_multi_gpu(mocker):
+    nvidia_smi_output = (
+        b"0, GPU-aaaa, NVIDIA A100-SXM4-80GB, 310.25, 98, 61000\n"
+        b"1, GPU-bbbb, NVIDIA A100-SXM4-80GB, 62.50, 0, 4\n"
+        b"2, GPU-cccc, NVIDIA A100-SXM4-80GB, 305.00, [N/A], [N/A]\n"
+    )
+    mocker.patch.object(shutil, "which", return_value="/usr/bin/nvidia-smi")
+    mocker.patch.object(NvidiaGPU, "launch_shell_command", return_value=(nvidia_smi_output, 0))
+
+    devices = NvidiaGPU.get_gpu_devices()
+
+    assert [(device.index, device.uuid, device.power) for device in devices] == [
+        (0, "GPU-aaaa", 310.25),
+        (1, "GPU-bbbb", 62.5),
+        (2, "GPU-cccc", 305.0),
+    ]
+    assert devices[0].name == "NVIDIA A100-SXM4-80GB"
+    assert (devices[1].utilization, devices[1].memory_used) == (0.0, 4.0)
+    assert (devices[2].utilization, devices[2].memory_used) == (None, None)
+    assert NvidiaGPU.get_gpu_power_usage() == 677.75
+
+
 def test_get_nvidia_gpu_power_usage_should_throw_error():
     with pytest.raises(TracarbonException) as exception:
         NvidiaGPU.get_gpu_power_usage()
@@ -107,6 +149,110 @@ GPU: 0
     assert gpu_usage == gpu_usage_expected
 
 
+def test_get_amd_gpu_devices_rocm_smi(mocker):
+    rocm_smi_output = b"""
+========================= ROCm System Management Interface =========================
+GPU[0]          : Average Graphics Package Power (W): 45.0
+GPU[1]          : Average Graphics Package Power (W): 52.5
+GPU[0]          : GPU use (%): 87
+GPU[1]          : GPU use (%): 3
+GPU[0]          : Unique ID: 0x18f68e602b8a790f
+GPU[1]          : Unique ID: 0x2c1b8e602b8a7912
+GPU[0]          : Card series: Instinct MI210
+GPU[1]          : Card series: Instinct MI210
+========================= End of ROCm SMI Log =====================================
+"""
+    mocker.patch.object(AMDGPU, "launch_shell_command", return_value=(rocm_smi_output, 0))
+
+    devices = AMDGPU.get_gpu_devices()
+
+    assert [(device.index, device.power, device.utilization) for device in devices] == [(0, 45.0, 87.0), (1, 52.5, 3.0)]
+    assert devices[1].uuid == "0x2c1b8e602b8a7912"
+    assert devices[1].name == "Instinct MI210"
+
+
+def test_get_amd_gpu_devices_amd_smi(mocker):
+    amd_smi_output = b"""
+GPU: 0
+    USAGE:
+        GFX_ACTIVITY: 40 %
+    POWER:
+        SOCKET_POWER: 65.0 W
+
+GPU: 1
+    USAGE:
+        GFX_ACTIVITY: 100 %
+    POWER:
+        SOCKET_POWER: 70.0 W
+"""
+    mocker.patch.object(AMDGPU, "launch_shell_command", return_value=(amd_smi_output, 0))
+
+    devices = AMDGPU.get_gpu_devices()
+
+    assert [(device.index, device.power, device.utilization) for device in devices] == [
+        (0, 65.0, 40.0),
+        (1, 70.0, 100.0),
+    ]
+
+
+def test_amd_gpu_sysfs_should_read_the_power_of_the_amd_cards(tmp_path):
+    drm_path = tmp_path / "drm"
+    device_path = _write_amd_gpu_card(drm_path, "card1", power_uw="45500000")
+    (device_path / "unique_id").write_text("18f68e602b8a790f\n")
+    (device_path / "product_name").write_text("Instinct MI210\n")
+    (device_path / "gpu_busy_percent").write_text("87\n")
+    (device_path / "mem_info_vram_used").write_text(f"{2048 * 1024 * 1024}\n")
+    _write_amd_gpu_card(drm_path, "card2", power_file="power1_input", power_uw="30000000")
+    _write_amd_gpu_card(drm_path, "card0", vendor="0x8086")
+    (drm_path / "card1-DP-1").mkdir()
+    sysfs = AMDGPUSysfs(path=str(drm_path))
+
+    sysfs.discover()
+    (device_path / "hwmon" / "hwmon3" / "power1_average").write_text("50000000\n")
+    devices = sysfs.get_gpu_devices()
+    sysfs.close()
+
+    assert [(device.index, device.power) for device in devices] == [(0, 50.0), (1, 30.0)]
+    assert (devices[0].uuid, devices[0].name, devices[0].utilization, devices[0].memory_used) == (
+        "18f68e602b8a790f",
+        "Instinct MI210",
+        87.0,
+        2048.0,
+    )
+    assert (devices[1].uuid, devices[1].utilization, devices[1].memory_used) == (None, None, None)
+    assert sysfs.cards == []
+
+
+def test_get_amd_gpu_power_usage_should_read_sysfs_without_the_amd_gpu_tools(mocker, tmp_path):
+    drm_path = tmp_path / "drm"
+    _write_amd_gpu_card(drm_path, "card0", power_uw="45000000")
+    _write_amd_gpu_card(drm_path, "card1", power_uw="52500000")
+    mocker.patch.object(AMDGPU, "sysfs_path", str(drm_path))
+    launch_shell_command = mocker.patch.object(AMDGPU, "launch_shell_command")
+
+    assert AMDGPU.get_gpu_power_usage() == 97.5
+    assert AMDGPU.get_gpu_power_usage() == 97.5
+    assert len(AMDGPU.sysfs.cards) == 2
+    launch_shell_command.assert_not_called()
+
+
+def test_get_amd_gpu_power_usage_should_fall_back_to_the_amd_gpu_tools_without_sysfs_cards(mocker, tmp_path):
+    drm_path = tmp_path / "drm"
+    _write_amd_gpu_card(drm_path, "card0", vendor="0x10de")
+    mocker.patch.object(AMDGPU, "sysfs_path", str(drm_path))
+    mocker.patch.object(AMDGPU, "launch_shell_command", return_value=(b"GPU: 0\n    POWER_USAGE: 65.0 W\n", 0))
+
+    assert AMDGPU.get_gpu_power_usage() == 65.0
+    assert AMDGPU.sysfs.cards == []
+
+
+def test_get_vendor_gpu_devices_should_only_query_the_devices_of_nvidia_and_amd(mocker):
+    mocker.patch.object(NvidiaGPU, "launch_shell_command", return_value=(b"0, GPU-aaaa, Tesla T4, 27.5, 10, 300", 0))
+
+    assert [device.power for device in GPUInfo.get_vendor_gpu_devices(vendor="nvidia")] == [27.5]
+    assert GPUInfo.get_vendor_gpu_devices(vendor="apple_silicon") is None
+
+
 def test_get_amd_gpu_power_usage_with_non_zero_return_code(mocker):
     mocker.patch.object(shutil, "which", return_value="/usr/bin/rocm-smi")
     mocker.patch.object(AMDGPU, "launch_shell_command", return_value=(b"error", 1))
@@ -363,3 +509,131 @@ def test_powermetrics_get_combined_power_returns_none_on_failure(mocker):
     combined = AppleSiliconPowerMetrics.get_combined_power()
 
     assert combined is None
+
+
+def test_detect_gpu_vendor_should_detect_the_first_vendor_reporting_the_power(mocker):
+    mocker.patch("tracarbon.hardwares.gpu.platform.system", return_value="Linux")
+    mocker.patch.object(
+        NvidiaGPU, "query_gpu_devices", side_effect=HardwareNoGPUDetectedException("Nvidia GPU not found")
+    )
+    get_amd_gpu_power_usage = mocker.patch.object(AMDGPU, "get_gpu_power_usage", return_value=75.0)
+
+    assert GPUInfo.detect_gpu_vendor() == "amd"
+    assert GPUInfo.get_vendor_gpu_power_usage(vendor="amd") == 75.0
+    assert get_amd_gpu_power_usage.call_count == 2
+
+
+def _write_nvidia_smi(path, script):
+    nvidia_smi = path / "nvidia-smi"
+    nvidia_smi.write_text(f"#!/bin/sh\n{script}\n")
+    nvidia_smi.chmod(0o755)
+    return str(nvidia_smi)
+
+
+async def _wait_stopped(task):
+    if task is not None:
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def _wait_for(condition):
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_nvidia_gpu_sampler_should_ignore_the_unsupported_values():
+    sampler = NvidiaGPUSampler()
+
+    sampler.parse_line(b"0, 120.50\n")
+    sampler.parse_line(b"1, [N/A]\n")
+
+    assert list(sampler.devices) == [0]
+    assert sampler.get_gpu_power_usage() == 120.5
+
+
+@pytest.mark.asyncio
+@pytest.mark.linux
+@pytest.mark.darwin
+async def test_nvidia_gpu_should_read_the_streamed_power_of_the_gpus(mocker, tmp_path):
+    nvidia_smi = _write_nvidia_smi(tmp_path, 'while true; do echo "0, 100.5"; echo "1, 50.0"; sleep 0.05; done')
+    mocker.patch.object(shutil, "which", return_value=nvidia_smi)
+    launch_shell_command = mocker.patch.object(NvidiaGPU, "launch_shell_command")
+
+    NvidiaGPU.start_sampler(interval_in_ms=50)
+    try:
+        await _wait_for(lambda: len(NvidiaGPU.sampler.devices) == 2)
+        gpu_usage = NvidiaGPU.get_gpu_power_usage()
+    finally:
+        await _wait_stopped(NvidiaGPU.stop_sampler())
+
+    assert gpu_usage == 150.5
+    launch_shell_command.assert_not_called()
+
+
+def test_nvidia_gpu_should_miss_the_reading_without_a_recent_sample_of_the_sampler(mocker):
+    sampler = NvidiaGPUSampler()
+    mocker.patch.object(NvidiaGPUSampler, "is_running", new_callable=mocker.PropertyMock, return_value=True)
+    mocker.patch.object(NvidiaGPU, "sampler", sampler)
+    mocker.patch.object(NvidiaGPU, "launch_shell_command", return_value=(b"0, GPU-aaaa, Tesla T4, 27.5, 10, 300", 0))
+
+    assert NvidiaGPU.get_gpu_devices() == []
+    assert NvidiaGPU.get_gpu_power_usage() == 0.0
+    assert GPUInfo.detect_gpu_vendor() == "nvidia"
+
+
+@pytest.mark.asyncio
+async def test_nvidia_gpu_sampler_should_restart_nvidia_smi_when_it_exits(mocker):
+    mocker.patch.object(shutil, "which", return_value="nvidia-smi")
+    sampler = NvidiaGPUSampler(minimum_backoff_in_seconds=0.0, maximum_backoff_in_seconds=0.0)
+    runs = []
+    third_run = asyncio.Event()
+
+    async def run(nvidia_smi_path: str) -> bool:
+        runs.append(nvidia_smi_path)
+        sampler.parse_line(b"0, 80.0\n")
+        if len(runs) == 3:
+            third_run.set()
+            await asyncio.Event().wait()
+        return True
+
+    mocker.patch.object(NvidiaGPUSampler, "_run", side_effect=run)
+
+    sampler.start()
+    try:
+        await third_run.wait()
+    finally:
+        await _wait_stopped(sampler.stop())
+
+    assert len(runs) == 3
+    assert sampler.restart_count == 2
+    assert sampler.get_gpu_power_usage() == 80.0
+
+
+@pytest.mark.asyncio
+async def test_nvidia_gpu_sampler_should_kill_the_child_process_spawned_while_stopping(mocker):
+    spawning = asyncio.Event()
+    spawned = asyncio.Event()
+    process = mocker.MagicMock(returncode=None)
+    process.wait = mocker.AsyncMock(return_value=-9)
+
+    async def create_subprocess_exec(*args, **kwargs):
+        spawning.set()
+        await spawned.wait()
+        return process
+
+    mocker.patch.object(shutil, "which", return_value="nvidia-smi")
+    mocker.patch("tracarbon.hardwares.gpu.asyncio.create_subprocess_exec", side_effect=create_subprocess_exec)
+    sampler = NvidiaGPUSampler()
+
+    sampler.start()
+    await spawning.wait()
+    task = sampler.stop()
+    await asyncio.sleep(0)
+    spawned.set()
+    await _wait_stopped(task)
+
+    assert task.cancelled()
+    process.kill.assert_called_once()
+    process.wait.assert_awaited_once()
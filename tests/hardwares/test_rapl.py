@@ -1,11 +1,15 @@
+import asyncio
 import datetime
 import pathlib
+import shutil
 
 import pytest
 
 from tracarbon import RAPL
 from tracarbon.hardwares import EnergyUsageUnit
 from tracarbon.hardwares import RAPLResult
+from tracarbon.hardwares import RAPLSampler
+from tracarbon.hardwares import UsageType
 
 
 @pytest.mark.linux
@@ -93,6 +97,20 @@ async def test_get_total_uj_one_call():
     assert energy_report.memory_energy_usage is None
 
 
+@pytest.mark.asyncio
+@pytest.mark.linux
+@pytest.mark.darwin
+async def test_get_energy_report_should_not_measure_energy_on_the_first_call():
+    path = f"{pathlib.Path(__file__).parent.resolve()}/data/intel-rapl2"
+    rapl = RAPL(path=path, rapl_separator="T")
+
+    energy_report = await rapl.get_energy_report()
+
+    assert energy_report.host_energy_usage == 0.0
+    assert energy_report.duration_in_seconds == 0.0
+    rapl.close()
+
+
 def test_classify_domain():
     rapl = RAPL()
 
@@ -146,3 +164,96 @@ async def test_results_with_two_packages_are_correctly_computed():
     assert round(energy_report.cpu_energy_usage, 2) == cpu_energy_usage_expected
     assert round(energy_report.memory_energy_usage, 2) == memory_energy_usage_expected
     assert energy_report.gpu_energy_usage is None
+    breakdown = {name: (domain, socket, watts) for name, domain, socket, watts in energy_report.breakdown}
+    assert breakdown.keys() == rapl_results.keys()
+    assert breakdown["T0-package-0"] == ("package", "0", pytest.approx(0.001, rel=0.01))
+    assert breakdown["T1T1-dram"] == ("memory", "1", pytest.approx(0.001, rel=0.01))
+
+
+@pytest.mark.asyncio
+@pytest.mark.linux
+@pytest.mark.darwin
+async def test_get_rapl_power_usage_should_discover_the_domains_once_and_keep_the_counters_open(tmp_path):
+    path = tmp_path / "intel-rapl"
+    shutil.copytree(f"{pathlib.Path(__file__).parent.resolve()}/data/intel-rapl", path)
+    rapl = RAPL(path=str(path), rapl_separator="T")
+    await rapl.get_rapl_power_usage()
+
+    (path / "intel-raplT0" / "energy_uj").write_text("24346753800\n")
+    (path / "intel-raplT0" / "name").write_text("renamed")
+    rapl_results = {rapl_result.name: rapl_result for rapl_result in await rapl.get_rapl_power_usage()}
+
+    assert rapl_results["T0-package-0"].energy_uj == 24346753800.0
+    assert len({rapl_result.timestamp for rapl_result in rapl_results.values()}) == 1
+    rapl.close()
+    rapl_results = {rapl_result.name: rapl_result for rapl_result in await rapl.get_rapl_power_usage()}
+    assert "T0-renamed" in rapl_results
+
+
+@pytest.mark.linux
+@pytest.mark.darwin
+def test_rapl_sampler_should_integrate_every_wrap_around(tmp_path):
+    path = tmp_path / "intel-rapl"
+    shutil.copytree(f"{pathlib.Path(__file__).parent.resolve()}/data/intel-rapl2", path)
+    rapl = RAPL(path=str(path), rapl_separator="T")
+    rapl._discover_domains()
+    sampler = RAPLSampler(domains=rapl._domains, frequency_in_hz=100, buffer_size=2)
+
+    sampler.sample()
+    for package_uj, core_uj in ((60000, 50000), (10000, 30000), (5000, 60000)):
+        (path / "intel-raplT0" / "energy_uj").write_text(f"{package_uj}\n")
+        (path / "intel-raplT0" / "intel-raplT0T0" / "energy_uj").write_text(f"{core_uj}\n")
+        sampler.sample()
+
+    _, energies_uj = sampler.snapshot()
+    assert energies_uj == pytest.approx([59999.998 + 20000 + 65000, 49999.999 + 50000 + 30000])
+    assert sampler.wrap_count == 3
+    assert len(sampler.buffer) == 2
+    oldest_energies_uj = sampler.buffer.samples()[0][1]
+    assert oldest_energies_uj == pytest.approx([59999.998 + 20000, 49999.999 + 50000])
+    assert len(sampler.buffer.power_samples()) == 1
+    with pytest.raises(ValueError):
+        RAPLSampler(domains=rapl._domains, frequency_in_hz=5000)
+    rapl.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.linux
+@pytest.mark.darwin
+async def test_get_energy_report_should_integrate_the_sampled_energy(tmp_path):
+    path = tmp_path / "intel-rapl"
+    shutil.copytree(f"{pathlib.Path(__file__).parent.resolve()}/data/intel-rapl2", path)
+    rapl = RAPL(path=str(path), rapl_separator="T", sampling_frequency_in_hz=1000)
+
+    energy_report = await rapl.get_energy_report()
+    assert energy_report.host_energy_usage == 0
+    (path / "intel-raplT0" / "energy_uj").write_text("1000000.002\n")
+    timestamp_ns, _ = rapl._sampler_snapshot
+    await asyncio.sleep(0.05)
+
+    energy_report = await rapl.get_energy_report()
+    duration_in_seconds = (rapl._sampler_snapshot[0] - timestamp_ns) / 1e9
+    assert rapl.sampler.is_running
+    assert energy_report.host_energy_usage == pytest.approx(1 / duration_in_seconds)
+    rapl.close()
+    assert rapl.sampler is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.linux
+@pytest.mark.darwin
+async def test_get_energy_report_should_time_sub_second_intervals_with_monotonic_timestamps(tmp_path, mocker):
+    path = tmp_path / "intel-rapl"
+    shutil.copytree(f"{pathlib.Path(__file__).parent.resolve()}/data/intel-rapl2", path)
+    monotonic_ns = mocker.patch("tracarbon.hardwares.rapl.time.monotonic_ns", return_value=1_000_000_000)
+    rapl = RAPL(path=str(path), rapl_separator="T")
+    await rapl.get_energy_report()
+    monotonic_ns.return_value = 1_250_000_000
+    (path / "intel-raplT0" / "energy_uj").write_text("250000.002\n")
+
+    energy_report = await rapl.get_energy_report()
+
+    assert energy_report.duration_in_seconds == 0.25
+    assert energy_report.host_energy_usage == pytest.approx(1.0)
+    assert energy_report.get_energy_total_on_type(usage_type=UsageType.HOST) == pytest.approx(0.25)
+    rapl.close()
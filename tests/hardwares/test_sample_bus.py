@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from tracarbon import Country
+from tracarbon import EnergyUsage
+from tracarbon import MacEnergyConsumption
+from tracarbon.exporters import StdoutExporter
+from tracarbon.general_metrics import CarbonEmissionGenerator
+from tracarbon.general_metrics import EnergyConsumptionGenerator
+from tracarbon.hardwares import EnergyUsageUnit
+from tracarbon.hardwares import SampleBus
+from tracarbon.hardwares import TickContext
+
+
+@pytest.mark.asyncio
+async def test_sample_bus_should_read_the_sensor_once_per_tick(mocker):
+    energy_usage = EnergyUsage(host_energy_usage=60.0, cpu_energy_usage=40.0)
+    get_energy_usage = mocker.patch.object(MacEnergyConsumption, "get_energy_usage", return_value=energy_usage)
+    sample_bus = SampleBus(energy_consumption=MacEnergyConsumption())
+
+    with TickContext():
+        energy_usages = await asyncio.gather(*[sample_bus.get_energy_usage() for _ in range(4)])
+    energy_usages[0].convert_unit(EnergyUsageUnit.MILLIWATT)
+
+    assert get_energy_usage.call_count == 1
+    assert energy_usages[0].host_energy_usage == 60000.0
+    assert all(energy_usage == energy_usages[1] for energy_usage in energy_usages[1:])
+    assert energy_usages[1].host_energy_usage == 60.0
+
+
+@pytest.mark.asyncio
+async def test_sample_bus_should_read_the_sensor_on_each_call_outside_a_tick(mocker):
+    get_energy_usage = mocker.patch.object(
+        MacEnergyConsumption, "get_energy_usage", return_value=EnergyUsage(host_energy_usage=60.0)
+    )
+    sample_bus = SampleBus(energy_consumption=MacEnergyConsumption())
+
+    await sample_bus.get_energy_usage()
+    with TickContext():
+        await sample_bus.get_energy_usage()
+    with TickContext():
+        await sample_bus.get_energy_usage()
+
+    assert TickContext.current() is None
+    assert get_energy_usage.call_count == 3
+
+
+def test_generators_sharing_a_sample_bus_should_read_the_sensor_once_per_tick(mocker):
+    location = Country(name="fr", co2g_kwh=50.0)
+    get_energy_usage = mocker.patch.object(
+        MacEnergyConsumption, "get_energy_usage", return_value=EnergyUsage(host_energy_usage=60.0)
+    )
+    sample_bus = SampleBus(energy_consumption=MacEnergyConsumption())
+    exporter = StdoutExporter(
+        metric_generators=[
+            EnergyConsumptionGenerator(location=location, energy_consumption=sample_bus),
+            CarbonEmissionGenerator(location=location, energy_consumption=sample_bus),
+        ]
+    )
+
+    exporter.start(interval_in_seconds=60)
+    exporter.stop()
+
+    # One read for the first tick and one for the final sample of the stop
+    assert get_energy_usage.call_count == 2
+    metric_reports = {metric_report.metric.name: metric_report for metric_report in exporter.metric_report.values()}
+    assert metric_reports["energy_consumption_host"].total == 120.0
+    assert metric_reports["carbon_emission_host"].total > 0
@@ -10,6 +10,7 @@ from tracarbon import TracarbonException
 from tracarbon.exceptions import AzureSensorException
 from tracarbon.exceptions import GCPSensorException
 from tracarbon.hardwares import EnergyUsage
+from tracarbon.hardwares import GPUDevice
 from tracarbon.hardwares import HardwareInfo
 from tracarbon.hardwares import WindowsEnergyConsumption
 from tracarbon.hardwares.cloud_providers import AWS
@@ -18,6 +19,7 @@ from tracarbon.hardwares.cloud_providers import Azure
 from tracarbon.hardwares.cloud_providers import CloudProviders
 from tracarbon.hardwares.gpu import AppleSiliconPowerMetrics
 from tracarbon.hardwares.gpu import GPUInfo
+from tracarbon.hardwares.gpu import NvidiaGPU
 from tracarbon.hardwares.sensors import AzureEnergyConsumption
 from tracarbon.hardwares.sensors import GCPEnergyConsumption
 from tracarbon.hardwares.sensors import MacEnergyConsumption
@@ -246,6 +248,95 @@ async def test_get_platform_should_return_amd_rapl_when_intel_not_available(mock
     assert results == energy_usage
 
 
+@pytest.mark.asyncio
+async def test_linux_energy_consumption_should_probe_the_sensors_once_and_again_on_failure(mocker):
+    is_rapl_compatible = mocker.patch.object(RAPL, "is_rapl_compatible", return_value=True)
+    mocker.patch.object(GPUInfo, "detect_gpu_vendor", return_value="nvidia")
+    start_sampler = mocker.patch.object(NvidiaGPU, "start_sampler")
+    get_vendor_gpu_devices = mocker.patch.object(
+        GPUInfo,
+        "get_vendor_gpu_devices",
+        return_value=[GPUDevice(index=0, power=30.0), GPUDevice(index=1, power=20.0)],
+    )
+    get_energy_report = mocker.patch.object(
+        RAPL,
+        "get_energy_report",
+        side_effect=[EnergyUsage(host_energy_usage=1.8), OSError("counter lost"), EnergyUsage(host_energy_usage=2.0)],
+    )
+    energy_consumption = LinuxEnergyConsumption(rapl=RAPL(), amd_rapl=AMDRAPL(), reprobe_backoff_in_seconds=0.0)
+
+    results = await energy_consumption.get_energy_usage()
+    with pytest.raises(OSError):
+        await energy_consumption.get_energy_usage()
+    assert energy_consumption.plan is not None
+    last_results = await energy_consumption.get_energy_usage()
+
+    assert results.gpu_energy_usage == 50.0
+    assert [device.power for device in results.gpu_devices] == [30.0, 20.0]
+    assert last_results.host_energy_usage == 2.0
+    assert energy_consumption.plan.cpu_sensor == "intel_rapl"
+    assert energy_consumption.plan.gpu_vendor == "nvidia"
+    assert is_rapl_compatible.call_count == 2
+    assert get_energy_report.call_count == 3
+    get_vendor_gpu_devices.assert_called_with(vendor="nvidia")
+    assert start_sampler.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_linux_energy_consumption_should_back_off_the_probes_while_the_sensor_fails(mocker):
+    mocker.patch.object(RAPL, "is_rapl_compatible", return_value=True)
+    detect_gpu_vendor = mocker.patch.object(GPUInfo, "detect_gpu_vendor", return_value=None)
+    mocker.patch.object(RAPL, "get_energy_report", side_effect=OSError("counter lost"))
+    energy_consumption = LinuxEnergyConsumption(rapl=RAPL(), amd_rapl=AMDRAPL(), reprobe_backoff_in_seconds=10.0)
+
+    for _ in range(3):
+        with pytest.raises(OSError):
+            await energy_consumption.get_energy_usage()
+    assert detect_gpu_vendor.call_count == 1
+    assert energy_consumption._reprobe_backoff == 10.0
+    energy_consumption._reprobe_at = 0.0
+    with pytest.raises(OSError):
+        await energy_consumption.get_energy_usage()
+
+    assert detect_gpu_vendor.call_count == 2
+    assert energy_consumption._reprobe_backoff == 20.0
+    assert energy_consumption.plan.cpu_sensor == "intel_rapl"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("gpu_devices", [None, []])
+async def test_linux_energy_consumption_should_fall_back_to_the_gpu_power_usage_without_gpu_devices(
+    mocker, gpu_devices
+):
+    mocker.patch.object(RAPL, "is_rapl_compatible", return_value=True)
+    mocker.patch.object(GPUInfo, "detect_gpu_vendor", return_value="apple_silicon")
+    mocker.patch.object(GPUInfo, "get_vendor_gpu_devices", return_value=gpu_devices)
+    get_vendor_gpu_power_usage = mocker.patch.object(GPUInfo, "get_vendor_gpu_power_usage", return_value=50.0)
+    mocker.patch.object(RAPL, "get_energy_report", return_value=EnergyUsage(host_energy_usage=1.8))
+    energy_consumption = LinuxEnergyConsumption(rapl=RAPL(), amd_rapl=AMDRAPL())
+
+    results = await energy_consumption.get_energy_usage()
+
+    assert results.gpu_energy_usage == 50.0
+    assert results.gpu_devices is None
+    get_vendor_gpu_power_usage.assert_called_once_with(vendor="apple_silicon")
+
+
+@pytest.mark.asyncio
+async def test_linux_energy_consumption_should_probe_the_sensors_again_when_the_plan_expires(mocker):
+    mocker.patch.object(RAPL, "is_rapl_compatible", return_value=True)
+    mocker.patch.object(RAPL, "prime")
+    detect_gpu_vendor = mocker.patch.object(GPUInfo, "detect_gpu_vendor", return_value=None)
+    mocker.patch.object(RAPL, "get_energy_report", side_effect=lambda: EnergyUsage(host_energy_usage=1.8))
+    energy_consumption = LinuxEnergyConsumption(rapl=RAPL(), amd_rapl=AMDRAPL(), reprobe_interval_in_seconds=0.0)
+
+    await energy_consumption.prime()
+    results = await energy_consumption.get_energy_usage()
+
+    assert results.gpu_energy_usage is None
+    assert detect_gpu_vendor.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_get_platform_should_return_the_platform_energy_consumption_windows_error():
     with pytest.raises(TracarbonException) as exception:
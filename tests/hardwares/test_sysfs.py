@@ -0,0 +1,17 @@
+import os
+
+from tracarbon.hardwares.sysfs import read_sysfs_counter
+
+
+def test_read_sysfs_counter_should_read_the_counter_from_the_start_of_its_open_file(tmp_path):
+    counter_path = tmp_path / "energy_uj"
+    counter_path.write_text("1000000\n")
+    fd = os.open(counter_path, os.O_RDONLY)
+    try:
+        first_value = float(read_sysfs_counter(fd))
+        counter_path.write_text("2500000\n")
+        second_value = float(read_sysfs_counter(fd))
+    finally:
+        os.close(fd)
+
+    assert (first_value, second_value) == (1000000.0, 2500000.0)
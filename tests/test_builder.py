@@ -1,10 +1,18 @@
 import pytest
+from pydantic import ValidationError
 
+from tracarbon import AMDRAPL
+from tracarbon import RAPL
+from tracarbon import LinuxEnergyConsumption
+from tracarbon import SampleBus
 from tracarbon.builder import TracarbonBuilder
 from tracarbon.builder import TracarbonConfiguration
+from tracarbon.exporters import MultiExporter
 from tracarbon.exporters import StdoutExporter
 from tracarbon.general_metrics import CarbonEmissionGenerator
+from tracarbon.general_metrics import SelfTelemetryGenerator
 from tracarbon.locations import Country
+from tracarbon.telemetry import TELEMETRY
 
 
 @pytest.mark.darwin
@@ -37,3 +45,61 @@ def test_builder_with_configuration():
     assert tracarbon.location == expected_location
     assert tracarbon.exporter == expected_exporter
     assert tracarbon.report is not None
+
+
+def test_builder_with_exporters_should_fan_out_the_metric_generators():
+    location = Country(name="fr", co2g_kwh=74.0)
+    metric_generator = CarbonEmissionGenerator(location=location)
+    exporters = [
+        StdoutExporter(metric_generators=[metric_generator]),
+        StdoutExporter(metric_generators=[metric_generator]),
+    ]
+
+    tracarbon = TracarbonBuilder().with_exporters(exporters=exporters).with_location(location=location).build()
+
+    assert isinstance(tracarbon.exporter, MultiExporter)
+    assert tracarbon.exporter.exporters == exporters
+    assert tracarbon.exporter.metric_generators == [metric_generator]
+
+
+def test_builder_should_sample_and_close_the_rapl_behind_the_sample_bus_of_the_carbon_emission(mocker):
+    mocker.patch.object(StdoutExporter, "start")
+    mocker.patch.object(StdoutExporter, "stop")
+    close = mocker.patch.object(RAPL, "close")
+    energy_consumption = LinuxEnergyConsumption(rapl=RAPL(), amd_rapl=AMDRAPL())
+    location = Country(name="fr", co2g_kwh=74.0)
+    sample_bus = SampleBus(energy_consumption=energy_consumption)
+    exporter = StdoutExporter(
+        metric_generators=[CarbonEmissionGenerator(location=location, energy_consumption=sample_bus)]
+    )
+    configuration = TracarbonConfiguration(rapl_sampling_frequency_in_hz=100.0)
+    tracarbon = TracarbonBuilder(configuration=configuration).with_exporter(exporter).with_location(location).build()
+
+    tracarbon.start()
+    tracarbon.stop()
+
+    assert energy_consumption.rapl.sampling_frequency_in_hz == 100.0
+    close.assert_called_once()
+
+
+def test_builder_should_enable_the_self_telemetry_between_the_start_and_the_stop(mocker):
+    mocker.patch.object(StdoutExporter, "start")
+    mocker.patch.object(StdoutExporter, "stop")
+    location = Country(name="fr", co2g_kwh=74.0)
+    exporter = StdoutExporter(metric_generators=[])
+    configuration = TracarbonConfiguration(self_telemetry=True)
+    tracarbon = TracarbonBuilder(configuration=configuration).with_exporter(exporter).with_location(location).build()
+
+    assert not TELEMETRY.enabled
+    tracarbon.start()
+    assert TELEMETRY.enabled
+    tracarbon.stop()
+
+    assert not TELEMETRY.enabled
+    assert isinstance(exporter.metric_generators[-1], SelfTelemetryGenerator)
+
+
+@pytest.mark.parametrize("rapl_sampling_frequency_in_hz", [5.0, 2000.0])
+def test_configuration_should_validate_the_rapl_sampling_frequency(rapl_sampling_frequency_in_hz):
+    with pytest.raises(ValidationError):
+        TracarbonConfiguration(rapl_sampling_frequency_in_hz=rapl_sampling_frequency_in_hz)
@@ -1,21 +1,39 @@
+import pathlib
+import shutil
+import threading
+import time
+from array import array
+
 import pytest
 from kubernetes import config
 
+from tracarbon import RAPL
 from tracarbon import CarbonEmission
 from tracarbon import CarbonUsage
+from tracarbon import EnergyBreakdown
 from tracarbon import EnergyConsumption
 from tracarbon import EnergyUsage
+from tracarbon import GPUDevice
+from tracarbon import GPUInfo
 from tracarbon import HardwareInfo
 from tracarbon import Kubernetes
+from tracarbon import LinuxEnergyConsumption
 from tracarbon import MacEnergyConsumption
+from tracarbon import MetricGenerator
+from tracarbon import SampleBus
+from tracarbon.exporters import Metric
+from tracarbon.exporters import MetricType
+from tracarbon.exporters import StdoutExporter
 from tracarbon.exporters import Tag
 from tracarbon.general_metrics import CarbonEmissionGenerator
 from tracarbon.general_metrics import CarbonEmissionKubernetesGenerator
 from tracarbon.general_metrics import EnergyConsumptionGenerator
 from tracarbon.general_metrics import EnergyConsumptionKubernetesGenerator
+from tracarbon.general_metrics import SelfTelemetryGenerator
 from tracarbon.hardwares import Container
 from tracarbon.hardwares import Pod
 from tracarbon.locations.country import Country
+from tracarbon.telemetry import TELEMETRY
 
 
 @pytest.mark.asyncio
@@ -53,6 +71,135 @@ async def test_carbon_emission_metric(mocker):
     assert carbon_emission_metric.tags[3] == Tag(key="units", value="co2g")
 
 
+@pytest.mark.asyncio
+async def test_energy_and_carbon_counters_should_accumulate_since_the_start(mocker):
+    location_name = "fr"
+    energy_usage = EnergyUsage(cpu_energy_usage=12.0, memory_energy_usage=4.0, duration_in_seconds=2.0)
+    mocker.patch.object(EnergyConsumption, "from_platform", return_value=MacEnergyConsumption())
+    mocker.patch.object(Country, "get_current_country", return_value=location_name)
+    mocker.patch.object(MacEnergyConsumption, "get_energy_usage", return_value=energy_usage)
+    mocker.patch.object(CarbonEmission, "get_energy_usage", return_value=energy_usage)
+    location = Country(name=location_name, co2g_kwh=51.1)
+    energy_consumption_generator = EnergyConsumptionGenerator(location=location)
+    carbon_emission_generator = CarbonEmissionGenerator(location=location)
+
+    for _ in range(2):
+        energy_batch = await energy_consumption_generator.generate_batch()
+        carbon_batch = await carbon_emission_generator.generate_batch()
+
+    energy_counters = {metric.name: value for metric, value in energy_batch if metric.metric_type == MetricType.COUNTER}
+    assert energy_counters == {
+        "energy_consumption_host_joules_total": 0.0,
+        "energy_consumption_cpu_joules_total": 48.0,
+        "energy_consumption_memory_joules_total": 16.0,
+        "energy_consumption_gpu_joules_total": None,
+    }
+    carbon_counters = {metric.name: value for metric, value in carbon_batch if metric.metric_type == MetricType.COUNTER}
+    carbon_gauges = {metric.name: value for metric, value in carbon_batch if metric.metric_type == MetricType.GAUGE}
+    assert carbon_counters["carbon_emission_cpu_co2g_total"] > carbon_gauges["carbon_emission_cpu"] > 0
+    assert carbon_batch.metrics[4].tags[-1] == Tag(key="units", value="co2g")
+
+
+@pytest.mark.asyncio
+async def test_energy_consumption_generator_should_generate_the_breakdown_of_the_counters(mocker):
+    breakdown = EnergyBreakdown(
+        names=("package-0", "dram"), domains=("package", "memory"), sockets=("0", "0"), watts=array("d", [3.0, 1.0])
+    )
+    energy_usage = EnergyUsage(host_energy_usage=3.0, memory_energy_usage=1.0, breakdown=breakdown)
+    mocker.patch.object(EnergyConsumption, "from_platform", return_value=MacEnergyConsumption())
+    mocker.patch.object(MacEnergyConsumption, "get_energy_usage", return_value=energy_usage)
+    energy_consumption_generator = EnergyConsumptionGenerator(location=Country(name="fr", co2g_kwh=51.1))
+
+    energy_batch = await energy_consumption_generator.generate_batch()
+
+    domain_metrics = [(metric, value) for metric, value in energy_batch if metric.name == "energy_consumption_domain"]
+    assert [value for _, value in domain_metrics] == [3.0, 1.0]
+    assert domain_metrics[1][0].tags[2:] == [
+        Tag(key="domain", value="memory"),
+        Tag(key="socket", value="0"),
+        Tag(key="counter", value="dram"),
+        Tag(key="units", value="watts"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_energy_consumption_generator_should_generate_the_usage_of_each_gpu(mocker):
+    gpu_devices = [
+        GPUDevice(index=0, uuid="GPU-aaaa", name="NVIDIA H100", power=650.0, utilization=99.0, memory_used=70000.0),
+        GPUDevice(index=1, uuid="GPU-bbbb", name="NVIDIA H100", power=70.0),
+    ]
+    energy_usage = EnergyUsage(host_energy_usage=100.0, gpu_energy_usage=720.0, gpu_devices=gpu_devices)
+    mocker.patch.object(EnergyConsumption, "from_platform", return_value=MacEnergyConsumption())
+    mocker.patch.object(MacEnergyConsumption, "get_energy_usage", return_value=energy_usage)
+    energy_consumption_generator = EnergyConsumptionGenerator(location=Country(name="fr", co2g_kwh=51.1))
+
+    energy_batch = await energy_consumption_generator.generate_batch()
+
+    gauges = {metric.name: value for metric, value in energy_batch if metric.name == "energy_consumption_gpu"}
+    assert gauges == {"energy_consumption_gpu": 720.0}
+    power_metrics = [
+        (metric, value) for metric, value in energy_batch if metric.name == "energy_consumption_gpu_device"
+    ]
+    assert [value for _, value in power_metrics] == [650.0, 70.0]
+    assert power_metrics[1][0].tags[2:] == [
+        Tag(key="gpu_index", value="1"),
+        Tag(key="gpu_uuid", value="GPU-bbbb"),
+        Tag(key="gpu_name", value="NVIDIA H100"),
+        Tag(key="units", value="watts"),
+    ]
+    assert [value for metric, value in energy_batch if metric.name == "gpu_device_utilization"] == [99.0]
+    assert [value for metric, value in energy_batch if metric.name == "gpu_device_memory_used"] == [70000.0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.linux
+@pytest.mark.darwin
+async def test_energy_consumption_generator_should_measure_the_first_interval_once_primed(mocker, tmp_path):
+    path = tmp_path / "intel-rapl"
+    shutil.copytree(f"{pathlib.Path(__file__).parent.resolve()}/hardwares/data/intel-rapl2", path)
+    mocker.patch.object(GPUInfo, "get_gpu_power_usage_or_none", return_value=None)
+    energy_consumption = LinuxEnergyConsumption(rapl=RAPL(path=str(path), rapl_separator="T"))
+    energy_consumption_generator = EnergyConsumptionGenerator(
+        location=Country(name="fr", co2g_kwh=51.1), energy_consumption=energy_consumption
+    )
+
+    await energy_consumption_generator.prime()
+    (path / "intel-raplT0" / "energy_uj").write_text("3000000.002\n")
+    batch = await energy_consumption_generator.generate_batch()
+
+    counters = {metric.name: value for metric, value in batch if metric.metric_type == MetricType.COUNTER}
+    assert counters["energy_consumption_host_joules_total"] == pytest.approx(3.0)
+    energy_consumption.rapl.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.linux
+@pytest.mark.darwin
+async def test_energy_and_carbon_counters_should_count_the_energy_read_by_every_consumer(mocker, tmp_path):
+    path = tmp_path / "intel-rapl"
+    shutil.copytree(f"{pathlib.Path(__file__).parent.resolve()}/hardwares/data/intel-rapl2", path)
+    mocker.patch.object(GPUInfo, "detect_gpu_vendor", return_value=None)
+    energy_consumption = LinuxEnergyConsumption(rapl=RAPL(path=str(path), rapl_separator="T"))
+    sample_bus = SampleBus(energy_consumption=energy_consumption)
+    location = Country(name="fr", co2g_kwh=51.1)
+    energy_consumption_generator = EnergyConsumptionGenerator(location=location, energy_consumption=sample_bus)
+    carbon_emission_generator = CarbonEmissionGenerator(location=location, energy_consumption=sample_bus)
+
+    await energy_consumption_generator.prime()
+    await carbon_emission_generator.prime()
+    (path / "intel-raplT0" / "energy_uj").write_text("1000000.002\n")
+    await sample_bus.get_energy_usage()
+    (path / "intel-raplT0" / "energy_uj").write_text("2000000.002\n")
+    energy_batch = await energy_consumption_generator.generate_batch()
+    carbon_batch = await carbon_emission_generator.generate_batch()
+
+    energy_counters = {metric.name: value for metric, value in energy_batch if metric.metric_type == MetricType.COUNTER}
+    carbon_counters = {metric.name: value for metric, value in carbon_batch if metric.metric_type == MetricType.COUNTER}
+    assert energy_counters["energy_consumption_host_joules_total"] == pytest.approx(2.0)
+    assert carbon_counters["carbon_emission_host_co2g_total"] == pytest.approx(2.0 / 3600000 * 51.1)
+    energy_consumption.rapl.close()
+
+
 @pytest.mark.asyncio
 async def test_energy_consumption_metric(mocker):
     location_name = "fr"
@@ -266,3 +413,94 @@ async def test_carbon_emission_kubernetes_generator(mocker):
         "source:file",
         "units:co2mg",
     ] == metric.format_tags()
+
+
+@pytest.mark.asyncio
+async def test_kubernetes_generator_should_reuse_the_metrics_of_the_series_and_prune_the_deleted_pods(mocker):
+    energy_usage = EnergyUsage(cpu_energy_usage=12.0, memory_energy_usage=4.0)
+    mocker.patch.object(EnergyConsumption, "from_platform", return_value=MacEnergyConsumption())
+    mocker.patch.object(config, "load_kube_config", return_value=None)
+    mocker.patch.object(HardwareInfo, "get_memory_total", return_value=101200121856)
+    mocker.patch.object(HardwareInfo, "get_number_of_cores", return_value=2)
+    mocker.patch.object(MacEnergyConsumption, "get_energy_usage", return_value=energy_usage)
+    pods_usage = [
+        Pod(
+            name=name,
+            namespace="default",
+            containers=[Container(name="app", cpu_usage="825800n", memory_usage="46472Ki")],
+        )
+        for name in ("pod-a", "pod-b")
+    ]
+    get_pods_usage = mocker.patch.object(Kubernetes, "get_pods_usage", return_value=pods_usage)
+    generator = EnergyConsumptionKubernetesGenerator(location=Country(name="fr", co2g_kwh=51.1), platform="Darwin")
+
+    first_metrics = [metric async for metric in generator.generate()]
+    get_pods_usage.return_value = pods_usage[:1]
+    second_metrics = [metric async for metric in generator.generate()]
+
+    assert len(first_metrics) == 6
+    assert second_metrics == first_metrics[:3]
+    assert all(second is first for second, first in zip(second_metrics, first_metrics[:3], strict=True))
+    assert len(generator._series_metrics) == 3
+    assert round(await second_metrics[0].value(), 4) == 6.7916
+
+
+def test_kubernetes_generator_should_not_delay_the_other_generators_while_listing_the_pods(mocker, caplog):
+    listing = threading.Event()
+    mocker.patch.object(EnergyConsumption, "from_platform", return_value=MacEnergyConsumption())
+    mocker.patch.object(config, "load_kube_config", return_value=None)
+    energy_usage = EnergyUsage(cpu_energy_usage=12.0, memory_energy_usage=4.0)
+    mocker.patch.object(MacEnergyConsumption, "get_energy_usage", return_value=energy_usage)
+
+    def get_pods_usage():
+        listing.wait(timeout=5)
+        return iter([])
+
+    mocker.patch.object(Kubernetes, "get_pods_usage", side_effect=get_pods_usage)
+
+    async def get_value() -> float:
+        return 1.0
+
+    exporter = StdoutExporter(
+        metric_generators=[
+            EnergyConsumptionKubernetesGenerator(location=Country(name="fr", co2g_kwh=51.1), platform="Darwin"),
+            MetricGenerator(metrics=[Metric(name="fast_metric", value=get_value)]),
+        ],
+        metric_generator_timeout_in_seconds=0.1,
+    )
+    start = time.perf_counter()
+    try:
+        exporter.start(interval_in_seconds=60)
+        elapsed_in_seconds = time.perf_counter() - start
+        exporter.stop()
+    finally:
+        listing.set()
+
+    assert elapsed_in_seconds < 2
+    assert exporter.metric_report["fast_metric"].call_count == 1
+    assert (
+        "MetricGenerator[EnergyConsumptionKubernetesGenerator] timed out after 0.1s in the Stdout exporter."
+        in caplog.text
+    )
+
+
+@pytest.mark.asyncio
+async def test_self_telemetry_generator_should_generate_the_overhead_of_tracarbon():
+    TELEMETRY.reset()
+    TELEMETRY.enabled = True
+    exporter = StdoutExporter(metric_generators=[], export_queue_size=4)
+    generator = SelfTelemetryGenerator(exporter=exporter)
+    try:
+        exporter.start(interval_in_seconds=60)
+        exporter.stop()
+        batch = await generator.generate_batch()
+    finally:
+        TELEMETRY.enabled = False
+        TELEMETRY.reset()
+
+    values = {(metric.name, tuple(tag.value for tag in metric.tags[1:])): value for metric, value in batch}
+    assert values[("self_cpu_time_seconds", ())] > 0
+    assert values[("self_rss_bytes", ())] > 0
+    assert values[("self_tick_count", ("Stdout",))] == 1
+    assert values[("self_tick_latency_seconds", ("Stdout", "max"))] > 0
+    assert values[("self_export_queue_depth", ("Stdout",))] == 0
@@ -0,0 +1,60 @@
+import pytest
+
+from tracarbon import EnergyUsage
+from tracarbon.hardwares.sensors import EnergyConsumption
+from tracarbon.hooks import HOOKS
+from tracarbon.hooks import HookPoint
+from tracarbon.hooks import HookRegistry
+
+
+class FakeEnergyConsumption(EnergyConsumption):
+    async def get_energy_usage(self) -> EnergyUsage:
+        return EnergyUsage(host_energy_usage=1.0)
+
+
+def test_hook_registry_should_only_wrap_the_methods_while_hooks_are_registered():
+    hooks = HookRegistry()
+
+    class Source:
+        async def read(self) -> float:
+            return 1.0
+
+    original = Source.read
+    hooks.hook_method(cls=Source, name="read", point=HookPoint.SENSOR)
+    assert Source.read is original
+
+    def before(point, source, start):
+        pass
+
+    hooks.register(point=HookPoint.SENSOR, before=before)
+    assert Source.read is not original
+    hooks.unregister(point=HookPoint.SENSOR, before=before)
+    assert Source.read is original
+    assert not hooks.active
+
+
+@pytest.mark.asyncio
+async def test_hook_registry_should_call_the_hooks_around_the_sensors():
+    calls = []
+    sensor = FakeEnergyConsumption()
+
+    def before(point, source, start):
+        calls.append((point, source, "before"))
+
+    def after(point, source, start, end, error):
+        assert end >= start
+        calls.append((point, source, error))
+
+    def failing_after(point, source, start, end, error):
+        raise ValueError("failing hook")
+
+    HOOKS.register(point=HookPoint.SENSOR, before=before, after=after)
+    HOOKS.register(point=HookPoint.SENSOR, after=failing_after)
+    try:
+        energy_usage = await sensor.get_energy_usage()
+    finally:
+        HOOKS.clear()
+
+    assert energy_usage.host_energy_usage == 1.0
+    assert calls == [(HookPoint.SENSOR, sensor, "before"), (HookPoint.SENSOR, sensor, None)]
+    assert not HOOKS.active
@@ -0,0 +1,39 @@
+import pstats
+
+import pytest
+
+from tracarbon.exporters import Metric
+from tracarbon.exporters import MetricGenerator
+from tracarbon.hooks import HOOKS
+from tracarbon.profiling import Profiler
+from tracarbon.profiling import ProfilerMode
+from tracarbon.scheduler import Scheduler
+
+
+async def get_value() -> float:
+    return sum(range(1000))
+
+
+@pytest.mark.parametrize("mode", [ProfilerMode.CPROFILE, ProfilerMode.SAMPLING])
+def test_profiler_should_dump_where_the_time_goes(tmp_path, mode):
+    output_path = str(tmp_path / "profile")
+    metric_generator = MetricGenerator(metrics=[Metric(name="metric", value=get_value)])
+    scheduler = Scheduler()
+    scheduler.start()
+    profiler = Profiler(mode=mode, output_path=output_path, sampling_interval_in_seconds=0.001)
+    try:
+        profiler.start(scheduler=scheduler)
+        for _ in range(50):
+            scheduler.run(metric_generator.generate_batch())
+        profiler.stop()
+    finally:
+        scheduler.stop()
+
+    assert not HOOKS.active
+    assert profiler.hook_durations[("metric_generator.generate", "MetricGenerator")][0] == 50
+    assert "metric_generator.generate MetricGenerator: 50 call(s)" in profiler.summary()
+    if mode == ProfilerMode.CPROFILE:
+        assert pstats.Stats(output_path).total_calls > 0
+    else:
+        with open(output_path) as file:
+            assert file.read()
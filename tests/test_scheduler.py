@@ -0,0 +1,129 @@
+import asyncio
+import time
+
+import pytest
+
+from tracarbon.scheduler import MissedTickPolicy
+from tracarbon.scheduler import Scheduler
+
+
+def test_scheduler_should_run_the_job_on_a_single_long_lived_thread():
+    threads = set()
+
+    async def callback() -> None:
+        import threading
+
+        threads.add(threading.get_ident())
+
+    scheduler = Scheduler()
+    scheduler.start()
+    job = scheduler.schedule(callback=callback, interval_in_seconds=0.01)
+    assert job.wait_for_first_run(timeout=5) is True
+    time.sleep(0.1)
+    scheduler.stop()
+
+    assert scheduler.startup_duration_in_seconds is not None
+    assert scheduler.is_running is False
+    assert job.statistics.tick_count > 2
+    assert len(threads) == 1
+
+
+def test_scheduler_deadlines_should_not_drift_with_the_callback_duration():
+    interval_in_seconds = 0.05
+    ticks = []
+
+    async def callback() -> None:
+        ticks.append(time.monotonic())
+        await asyncio.sleep(0.02)
+
+    scheduler = Scheduler()
+    scheduler.start()
+    scheduler.schedule(callback=callback, interval_in_seconds=interval_in_seconds)
+    time.sleep(0.33)
+    scheduler.stop()
+
+    elapsed = ticks[-1] - ticks[0]
+    assert elapsed == pytest.approx(interval_in_seconds * (len(ticks) - 1), abs=0.02)
+
+
+def test_scheduler_skip_policy_should_count_the_missed_ticks():
+    async def callback() -> None:
+        await asyncio.sleep(0.05)
+
+    scheduler = Scheduler()
+    scheduler.start()
+    job = scheduler.schedule(
+        callback=callback, interval_in_seconds=0.02, missed_tick_policy=MissedTickPolicy.SKIP, name="slow"
+    )
+    time.sleep(0.2)
+    scheduler.stop()
+
+    assert job.name == "slow"
+    assert job.statistics.missed_tick_count > 0
+    assert job.statistics.maximum_tick_duration_in_seconds >= 0.05
+
+
+def test_scheduler_catch_up_policy_should_run_the_missed_ticks_immediately():
+    durations = [0.1, 0.0, 0.0, 0.0]
+    ticks = []
+
+    async def callback() -> None:
+        ticks.append(time.monotonic())
+        await asyncio.sleep(durations[min(len(ticks) - 1, len(durations) - 1)])
+
+    scheduler = Scheduler()
+    scheduler.start()
+    job = scheduler.schedule(
+        callback=callback,
+        interval_in_seconds=0.04,
+        missed_tick_policy=MissedTickPolicy.CATCH_UP,
+        max_catch_up_ticks=2,
+    )
+    time.sleep(0.15)
+    scheduler.stop()
+
+    assert ticks[1] - ticks[0] >= 0.1
+    assert ticks[2] - ticks[1] < 0.01
+    assert job.statistics.missed_tick_count == 0
+
+
+def test_scheduler_should_isolate_the_errors_of_the_callback():
+    async def callback() -> None:
+        raise ValueError("boom")
+
+    scheduler = Scheduler()
+    scheduler.start()
+    job = scheduler.schedule(callback=callback, interval_in_seconds=0.01)
+    job.wait_for_first_run(timeout=5)
+    time.sleep(0.05)
+    scheduler.stop()
+
+    assert job.statistics.tick_count > 1
+
+
+def test_scheduler_should_reject_a_non_positive_interval():
+    async def callback() -> None:
+        pass
+
+    scheduler = Scheduler()
+    scheduler.start()
+    with pytest.raises(ValueError):
+        scheduler.schedule(callback=callback, interval_in_seconds=0)
+    scheduler.stop()
+
+
+def test_scheduler_should_delay_the_first_run():
+    scheduler = Scheduler()
+    scheduler.start()
+    ticks = []
+
+    async def tick() -> None:
+        ticks.append(time.monotonic())
+
+    start = time.monotonic()
+    job = scheduler.schedule(callback=tick, interval_in_seconds=60, delay_in_seconds=0.2)
+    job.wait_for_first_run(timeout=5)
+    scheduler.stop()
+
+    assert len(ticks) == 1
+    assert ticks[0] - start >= 0.2
@@ -0,0 +1,44 @@
+import pytest
+
+from tracarbon.telemetry import LatencyHistogram
+from tracarbon.telemetry import Telemetry
+
+
+def test_latency_histogram_should_estimate_the_quantiles_within_a_factor_of_two():
+    histogram = LatencyHistogram()
+    for duration in range(1, 1001):
+        histogram.record(duration_in_seconds=duration / 1e3)
+
+    p50 = histogram.quantile(0.5)
+    assert histogram.count == 1000
+    assert histogram.mean == pytest.approx(0.5005)
+    assert p50 is not None and 0.5 <= p50 <= 1.0
+    assert histogram.quantile(1) == histogram.maximum == 1.0
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+@pytest.mark.asyncio
+async def test_telemetry_should_only_record_once_enabled():
+    telemetry = Telemetry()
+
+    @telemetry.timed(kind="sensor", name="sync")
+    def read() -> float:
+        return 1.0
+
+    @telemetry.timed(kind="sensor", name="async")
+    async def read_async() -> float:
+        return 2.0
+
+    assert read() == 1.0
+    assert telemetry.histograms == {}
+
+    telemetry.enabled = True
+    assert read() == 1.0
+    assert await read_async() == 2.0
+    telemetry.record(kind="tick", name="job", duration_in_seconds=0.1)
+
+    assert {key: histogram.count for key, histogram in telemetry.histograms.items()} == {
+        ("sensor", "sync"): 1,
+        ("sensor", "async"): 1,
+        ("tick", "job"): 1,
+    }
@@ -20,15 +20,28 @@ from tracarbon.exceptions import HardwareNoGPUDetectedException
 from tracarbon.exceptions import HardwareRAPLException
 from tracarbon.exceptions import TracarbonException
 from tracarbon.exporters import Exporter
+from tracarbon.exporters import ExportQueue
 from tracarbon.exporters import JSONExporter
 from tracarbon.exporters import Metric
+from tracarbon.exporters import MetricBatch
 from tracarbon.exporters import MetricGenerator
 from tracarbon.exporters import MetricReport
+from tracarbon.exporters import MetricReportStore
+from tracarbon.exporters import MetricSpool
+from tracarbon.exporters import MetricType
+from tracarbon.exporters import MultiExporter
+from tracarbon.exporters import OverflowPolicy
+from tracarbon.exporters import QuantileSketch
 from tracarbon.exporters import StdoutExporter
 from tracarbon.exporters import Tag
 from tracarbon.general_metrics import CarbonEmissionGenerator
 from tracarbon.general_metrics import EnergyConsumptionGenerator
+from tracarbon.general_metrics import SelfTelemetryGenerator
+from tracarbon.hardwares import EnergyBreakdown
 from tracarbon.hardwares import EnergyUsageUnit
+from tracarbon.hardwares import GPUDevice
+from tracarbon.hardwares import SampleBus
+from tracarbon.hardwares import TickContext
 from tracarbon.hardwares import UsageType
 from tracarbon.hardwares.sensors import AMDRAPL
 from tracarbon.hardwares.sensors import RAPL
@@ -44,6 +57,7 @@ from tracarbon.hardwares.sensors import HardwareInfo
 from tracarbon.hardwares.sensors import LinuxEnergyConsumption
 from tracarbon.hardwares.sensors import MacEnergyConsumption
 from tracarbon.hardwares.sensors import Sensor
+from tracarbon.hardwares.sensors import SensorPlan
 from tracarbon.hardwares.sensors import WindowsEnergyConsumption
 from tracarbon.locations import AWSLocation
 from tracarbon.locations import AzureLocation
@@ -54,6 +68,8 @@ from tracarbon.locations import Country
 from tracarbon.locations import EmissionFactorType
 from tracarbon.locations import GCPLocation
 from tracarbon.locations import Location
+from tracarbon.scheduler import MissedTickPolicy
+from tracarbon.scheduler import Scheduler
 
 if DATADOG_INSTALLED:
     from tracarbon.exporters import DatadogExporter as DatadogExporter
@@ -89,14 +105,17 @@ __all__ = [
     "CountryIsMissing",
     "DATADOG_INSTALLED",
     "EmissionFactorType",
+    "EnergyBreakdown",
     "EnergyConsumption",
     "EnergyConsumptionGenerator",
     "EnergyUsage",
     "EnergyUsageUnit",
+    "ExportQueue",
     "Exporter",
     "GCPEnergyConsumption",
     "GCPSensorException",
     "GCPLocation",
+    "GPUDevice",
     "GPUInfo",
     "HardwareInfo",
     "HardwareNoGPUDetectedException",
@@ -107,17 +126,30 @@ __all__ = [
     "Location",
     "MacEnergyConsumption",
     "Metric",
+    "MetricBatch",
     "MetricGenerator",
     "MetricReport",
+    "MetricReportStore",
+    "MetricSpool",
+    "MetricType",
+    "MissedTickPolicy",
+    "MultiExporter",
+    "OverflowPolicy",
     "PROMETHEUS_INSTALLED",
+    "QuantileSketch",
     "RAPL",
+    "SampleBus",
+    "SelfTelemetryGenerator",
+    "Scheduler",
     "Sensor",
+    "SensorPlan",
     "StdoutExporter",
     "Tag",
     "Tracarbon",
     "TracarbonBuilder",
     "TracarbonConfiguration",
     "TracarbonException",
+    "TickContext",
     "TracarbonReport",
     "UsageType",
     "WindowsEnergyConsumption",
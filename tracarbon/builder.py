@@ -1,5 +1,8 @@
 import datetime
+import os
+from typing import Any
 from typing import Dict
+from typing import List
 
 from pydantic import BaseModel
 from pydantic import ConfigDict
@@ -7,11 +10,21 @@ from pydantic import Field
 
 from tracarbon.conf import TracarbonConfiguration
 from tracarbon.exporters import Exporter
+from tracarbon.exporters import MetricGenerator
 from tracarbon.exporters import MetricReport
+from tracarbon.exporters import MetricSpool
+from tracarbon.exporters import MultiExporter
+from tracarbon.exporters import OverflowPolicy
 from tracarbon.exporters import StdoutExporter
 from tracarbon.general_metrics import CarbonEmissionGenerator
+from tracarbon.general_metrics import SelfTelemetryGenerator
+from tracarbon.hardwares import LinuxEnergyConsumption
+from tracarbon.hardwares import SampleBus
+from tracarbon.hardwares.gpu import NvidiaGPU
 from tracarbon.locations import Country
 from tracarbon.locations import Location
+from tracarbon.scheduler import MissedTickPolicy
+from tracarbon.telemetry import TELEMETRY
 
 
 class TracarbonReport(BaseModel):
@@ -53,12 +66,69 @@ class Tracarbon:
     def __exit__(self, type, value, traceback) -> None:
         self.stop()
 
+    @staticmethod
+    def _unwrap_linux_energy_consumption(energy_consumption: Any) -> LinuxEnergyConsumption | None:
+        """
+        Get the Linux energy consumption sensor behind an energy consumption, through its sample buses.
+
+        :param energy_consumption: the energy consumption
+        :return: the Linux energy consumption sensor or None
+        """
+        while isinstance(energy_consumption, SampleBus):
+            energy_consumption = energy_consumption.energy_consumption
+        return energy_consumption if isinstance(energy_consumption, LinuxEnergyConsumption) else None
+
+    def _linux_energy_consumptions(self) -> List[LinuxEnergyConsumption]:
+        """
+        Get the Linux energy consumption sensors of the metric generators,
+        read directly, through a sample bus or through their carbon emission.
+
+        :return: the Linux energy consumption sensors
+        """
+        energy_consumptions: List[LinuxEnergyConsumption] = []
+        for metric_generator in self.exporter.metric_generators:
+            for candidate in (
+                getattr(metric_generator, "energy_consumption", None),
+                getattr(getattr(metric_generator, "carbon_emission", None), "energy_consumption", None),
+            ):
+                energy_consumption = self._unwrap_linux_energy_consumption(candidate)
+                if energy_consumption is not None and all(
+                    energy_consumption is not known for known in energy_consumptions
+                ):
+                    energy_consumptions.append(energy_consumption)
+        return energy_consumptions
+
     def start(self) -> None:
         """
         Start Tracarbon.
         """
         self.report.start_time = datetime.datetime.now()
-        self.exporter.start(interval_in_seconds=self.configuration.interval_in_seconds)
+        if self.configuration.rapl_sampling_frequency_in_hz is not None:
+            for energy_consumption in self._linux_energy_consumptions():
+                if energy_consumption.rapl.sampling_frequency_in_hz is None:
+                    energy_consumption.rapl.sampling_frequency_in_hz = self.configuration.rapl_sampling_frequency_in_hz
+        if self.configuration.export_queue_size is not None:
+            self.exporter.export_queue_size = self.configuration.export_queue_size
+            self.exporter.export_overflow_policy = OverflowPolicy(self.configuration.export_overflow_policy)
+        if self.configuration.spool_path:
+            exporters = self.exporter.exporters if isinstance(self.exporter, MultiExporter) else [self.exporter]
+            for exporter in exporters:
+                if exporter.spool is None:
+                    exporter.spool = MetricSpool(
+                        path=os.path.join(self.configuration.spool_path, exporter.get_name().lower())
+                    )
+        if self.configuration.self_telemetry:
+            TELEMETRY.enabled = True
+            if not any(
+                isinstance(metric_generator, SelfTelemetryGenerator)
+                for metric_generator in self.exporter.metric_generators
+            ):
+                self.exporter.metric_generators.append(SelfTelemetryGenerator(exporter=self.exporter))
+        self.exporter.start(
+            interval_in_seconds=self.configuration.interval_in_seconds,
+            missed_tick_policy=MissedTickPolicy(self.configuration.missed_tick_policy),
+            export_interval_in_seconds=self.configuration.export_interval_in_seconds,
+        )
 
     def stop(self) -> None:
         """
@@ -67,6 +137,11 @@ class Tracarbon:
         self.report.metric_report = self.exporter.metric_report
         self.report.end_time = datetime.datetime.now()
         self.exporter.stop()
+        for energy_consumption in self._linux_energy_consumptions():
+            energy_consumption.rapl.close()
+        NvidiaGPU.stop_sampler()
+        if self.configuration.self_telemetry:
+            TELEMETRY.enabled = False
 
 
 class TracarbonBuilder(BaseModel):
@@ -96,6 +171,25 @@ class TracarbonBuilder(BaseModel):
         self.exporter = exporter
         return self
 
+    def with_exporters(self, exporters: List[Exporter]) -> "TracarbonBuilder":
+        """
+        Add several exporters to the builder, fed by one sampling pass per tick.
+        The metric generators of all the exporters are sampled once and dispatched to every exporter.
+        :param exporters: the exporters
+        :return:
+        """
+        metric_generators: List[MetricGenerator] = []
+        for exporter in exporters:
+            for metric_generator in exporter.metric_generators:
+                if all(metric_generator is not known for known in metric_generators):
+                    metric_generators.append(metric_generator)
+        self.exporter = MultiExporter(
+            exporters=exporters,
+            metric_generators=metric_generators,
+            metric_prefix_name=self.configuration.metric_prefix_name,
+        )
+        return self
+
     def build(self) -> Tracarbon:
         """
         Build Tracarbon with its configuration.
@@ -1,4 +1,5 @@
 import time
+from typing import Annotated
 from typing import List
 
 import typer
@@ -8,9 +9,13 @@ from tracarbon.builder import TracarbonBuilder
 from tracarbon.conf import KUBERNETES_INSTALLED
 from tracarbon.exporters import Exporter
 from tracarbon.exporters import MetricGenerator
+from tracarbon.exporters import MultiExporter
 from tracarbon.general_metrics import CarbonEmissionGenerator
 from tracarbon.general_metrics import EnergyConsumptionGenerator
+from tracarbon.hardwares import SampleBus
 from tracarbon.locations import Country
+from tracarbon.profiling import Profiler
+from tracarbon.profiling import ProfilerMode
 
 app = typer.Typer()
 
@@ -20,7 +25,11 @@ def list_exporters(displayed: bool = True) -> List[str]:
     """
     List all the exporters available.
     """
-    exporters = [cls.get_name() for cls in Exporter.__subclasses__()]  # ty: ignore[call-abstract-method]
+    exporters = [
+        cls.get_name()  # ty: ignore[call-abstract-method]
+        for cls in Exporter.__subclasses__()
+        if cls is not MultiExporter
+    ]
     if displayed:
         logger.info(f"Available Exporters: {exporters}")
     return exporters
@@ -55,38 +64,45 @@ def get_exporter(
     )
 
 
-def add_containers_generator(location: Country) -> List[MetricGenerator]:
+def add_containers_generator(location: Country, sample_bus: SampleBus | None = None) -> List[MetricGenerator]:
     """
     Add metric generators for containers if available
 
     :param: country for the metric generators of containers
+    :param: sample_bus: the sample bus shared with the other metric generators
     :return: the list of metric generators for containers
     """
     if KUBERNETES_INSTALLED:
         from tracarbon.general_metrics import CarbonEmissionKubernetesGenerator
         from tracarbon.general_metrics import EnergyConsumptionKubernetesGenerator
 
+        if not sample_bus:
+            sample_bus = SampleBus()
         return [
-            EnergyConsumptionKubernetesGenerator(location=location),
-            CarbonEmissionKubernetesGenerator(location=location),
+            EnergyConsumptionKubernetesGenerator(location=location, energy_consumption=sample_bus),
+            CarbonEmissionKubernetesGenerator(location=location, energy_consumption=sample_bus),
         ]
     else:
         raise ImportError("kubernetes optional dependency is not installed")
 
 
 def run_metrics(
-    exporter_name: str,
+    exporter_name: str | List[str],
     country_code_alpha_iso_2: str | None = None,
     running: bool = True,
     containers: bool = False,
+    profile: ProfilerMode | None = None,
+    profile_output: str | None = None,
 ) -> None:
     """
-    Run the metrics with the selected exporter
+    Run the metrics with the selected exporters
 
     :param country_code_alpha_iso_2: the alpha iso2 country name where it's running
     :param running: keep running the metrics
-    :param exporter_name: the exporter name to run
+    :param exporter_name: the exporter name, or the exporter names, to run
     :param containers: activate the containers feature
+    :param profile: the profiler to run on the agent
+    :param profile_output: the path of the profile dump
     :return:
     """
     tracarbon_builder = TracarbonBuilder()
@@ -96,27 +112,48 @@ def run_metrics(
         country_code_alpha_iso_2=country_code_alpha_iso_2,
         emission_factor_type=tracarbon_builder.configuration.emission_factor_type,
     )
+    sample_bus = SampleBus()
     metric_generators: List[MetricGenerator] = [
-        EnergyConsumptionGenerator(location=location),
+        EnergyConsumptionGenerator(location=location, energy_consumption=sample_bus),
         CarbonEmissionGenerator(
             location=location,
+            energy_consumption=sample_bus,
         ),
     ]
     if containers:
-        metric_generators.extend(add_containers_generator(location=location))
+        metric_generators.extend(add_containers_generator(location=location, sample_bus=sample_bus))
 
     tracarbon = None
     try:
-        exporter = get_exporter(
-            exporter_name=exporter_name,
-            metric_generators=metric_generators,
-            tracarbon_builder=tracarbon_builder,
-        )
+        exporter_names = list(dict.fromkeys([exporter_name] if isinstance(exporter_name, str) else exporter_name))
+        if len(exporter_names) == 1:
+            exporter = get_exporter(
+                exporter_name=exporter_names[0],
+                metric_generators=metric_generators,
+                tracarbon_builder=tracarbon_builder,
+            )
+        else:
+            exporter = MultiExporter(
+                exporters=[
+                    get_exporter(exporter_name=name, metric_generators=[], tracarbon_builder=tracarbon_builder)
+                    for name in exporter_names
+                ],
+                metric_generators=metric_generators,
+                metric_prefix_name=tracarbon_builder.configuration.metric_prefix_name,
+            )
         tracarbon = tracarbon_builder.with_location(location=location).with_exporter(exporter=exporter).build()
         logger.info("Tracarbon CLI started.")
         with tracarbon:
-            while running:
-                time.sleep(tracarbon_builder.configuration.interval_in_seconds)
+            profiler = None
+            if profile is not None and tracarbon.exporter.scheduler is not None:
+                profiler = Profiler(mode=profile, output_path=profile_output)
+                profiler.start(scheduler=tracarbon.exporter.scheduler)
+            try:
+                while running:
+                    time.sleep(tracarbon_builder.configuration.interval_in_seconds)
+            finally:
+                if profiler is not None:
+                    profiler.stop()
     except KeyboardInterrupt:
         pass
     except Exception as e:
@@ -132,17 +169,28 @@ def run_metrics(
 
 @app.command()
 def run(
-    exporter_name: str = "Stdout",
+    exporter_name: Annotated[
+        List[str] | None,
+        typer.Option(help="The exporter name, repeat it to run several exporters (Stdout by default)."),
+    ] = None,
     country_code_alpha_iso_2: str | None = None,
     containers: bool = False,
+    profile: Annotated[
+        ProfilerMode | None, typer.Option(help="Profile where the time of the agent goes with cProfile or sampling.")
+    ] = None,
+    profile_output: Annotated[
+        str | None, typer.Option(help="The path of the profile dump (tracarbon.prof or tracarbon.folded by default).")
+    ] = None,
 ) -> None:
     """
     Run Tracarbon.
     """
     run_metrics(
-        exporter_name=exporter_name,
+        exporter_name=exporter_name or ["Stdout"],
         country_code_alpha_iso_2=country_code_alpha_iso_2,
         containers=containers,
+        profile=profile,
+        profile_output=profile_output,
     )
 
 
@@ -4,6 +4,7 @@ from typing import Any
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
+from pydantic import Field
 
 
 def check_optional_dependency(name: str) -> bool:
@@ -53,6 +54,14 @@ class TracarbonConfiguration(BaseModel):
     co2signal_api_key: str
     co2signal_url: str
     emission_factor_type: str
+    missed_tick_policy: str
+    export_interval_in_seconds: int | None
+    export_queue_size: int | None
+    export_overflow_policy: str
+    spool_path: str | None
+    self_telemetry: bool
+    # The sampling frequency bounds of the RAPLSampler
+    rapl_sampling_frequency_in_hz: float | None = Field(default=None, ge=10.0, le=1000.0)
 
     def __init__(
         self,
@@ -62,6 +71,13 @@ class TracarbonConfiguration(BaseModel):
         co2signal_api_key: str = "",
         co2signal_url: str = "https://api.electricitymaps.com/v4/carbon-intensity/latest",
         emission_factor_type: str = "lifecycle",
+        missed_tick_policy: str = "skip",
+        export_interval_in_seconds: int | None = None,
+        export_queue_size: int | None = None,
+        export_overflow_policy: str = "drop_oldest",
+        spool_path: str | None = None,
+        self_telemetry: bool = False,
+        rapl_sampling_frequency_in_hz: float | None = None,
         env_file_path: str | None = None,
         **data: Any,
     ) -> None:
@@ -75,5 +91,16 @@ class TracarbonConfiguration(BaseModel):
             co2signal_api_key=os.environ.get("TRACARBON_CO2SIGNAL_API_KEY", co2signal_api_key),
             co2signal_url=os.environ.get("TRACARBON_CO2SIGNAL_URL", co2signal_url),
             emission_factor_type=os.environ.get("TRACARBON_EMISSION_FACTOR_TYPE", emission_factor_type),
+            missed_tick_policy=os.environ.get("TRACARBON_MISSED_TICK_POLICY", missed_tick_policy),
+            export_interval_in_seconds=os.environ.get(
+                "TRACARBON_EXPORT_INTERVAL_IN_SECONDS", export_interval_in_seconds
+            ),
+            export_queue_size=os.environ.get("TRACARBON_EXPORT_QUEUE_SIZE", export_queue_size),
+            export_overflow_policy=os.environ.get("TRACARBON_EXPORT_OVERFLOW_POLICY", export_overflow_policy),
+            spool_path=os.environ.get("TRACARBON_SPOOL_PATH", spool_path),
+            self_telemetry=os.environ.get("TRACARBON_SELF_TELEMETRY", self_telemetry),
+            rapl_sampling_frequency_in_hz=os.environ.get(
+                "TRACARBON_RAPL_SAMPLING_FREQUENCY_IN_HZ", rapl_sampling_frequency_in_hz
+            ),
             **data,
         )
@@ -1,10 +1,12 @@
-from datetime import datetime
+import time
 from enum import Enum
 from typing import Any
+from typing import Dict
 
 from loguru import logger
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from tracarbon.hardwares import EnergyConsumption
 from tracarbon.hardwares import Power
@@ -79,11 +81,16 @@ class CarbonUsage(BaseModel):
 class CarbonEmission(Sensor):
     """
     Carbon Metric sensor in watts per second to calculate the CO2g/kwh emitted.
+
+    The carbon is the energy consumed since the previous run times the carbon intensity: the increase of the energy
+    total accumulated by the sensor, or else the power times the duration it was measured over by the sensor
+    or the duration since the previous run, the same energy as the `*_joules_total` counters.
     """
 
     location: Location
     energy_consumption: EnergyConsumption
-    previous_energy_consumption_time: datetime | None = None
+    _previous_run_time: float | None = PrivateAttr(default=None)
+    _energy_totals: Dict[UsageType, float] = PrivateAttr(default_factory=dict)
 
     def __init__(self, **data: Any) -> None:
         if "location" not in data:
@@ -102,6 +109,35 @@ class CarbonEmission(Sensor):
         """
         return await self.energy_consumption.get_energy_usage()
 
+    async def prime(self) -> None:
+        """
+        Prime the energy consumption and start the first interval, so the first carbon usage covers
+        the interval since the priming.
+        """
+        await self.energy_consumption.prime()
+        self._previous_run_time = time.monotonic()
+
+    def _get_energy_in_joules(
+        self, energy_usage: EnergyUsage, usage_type: UsageType, duration_in_seconds: float | None
+    ) -> float | None:
+        """
+        Get the energy consumed since the previous run.
+
+        :param energy_usage: the energy usage in watts
+        :param usage_type: the type of energy
+        :param duration_in_seconds: the duration the power was measured over
+        :return: the energy in joules, None if unknown
+        """
+        energy_total = energy_usage.get_energy_total_on_type(usage_type=usage_type)
+        if energy_total is not None:
+            joules = max(energy_total - self._energy_totals.get(usage_type, 0.0), 0.0)
+            self._energy_totals[usage_type] = energy_total
+            return joules
+        watts = energy_usage.get_energy_usage_on_type(usage_type=usage_type)
+        if watts is None or duration_in_seconds is None:
+            return None
+        return watts * duration_in_seconds
+
     async def get_co2_usage(self) -> CarbonUsage:
         """
         Run the Carbon Emission sensor and get the carbon emission generated.
@@ -114,46 +150,22 @@ class CarbonEmission(Sensor):
 
         co2g_per_kwh = await self.location.get_latest_co2g_kwh()
         logger.debug(f"Carbon Emission of the location: {co2g_per_kwh}g CO2 eq/kWh")
-        host_carbon_usage = Power.co2g_from_watts_hour(
-            Power.watts_to_watt_hours(
-                watts=energy_usage.host_energy_usage,
-                previous_energy_measurement_time=self.previous_energy_consumption_time,
-            ),
-            co2g_per_kwh=co2g_per_kwh,
-        )
-        cpu_carbon_usage = 0.0
-        memory_carbon_usage = 0.0
-        gpu_carbon_usage = 0.0
-        if energy_usage.cpu_energy_usage:
-            cpu_carbon_usage = Power.co2g_from_watts_hour(
-                Power.watts_to_watt_hours(
-                    watts=energy_usage.cpu_energy_usage,
-                    previous_energy_measurement_time=self.previous_energy_consumption_time,
-                ),
-                co2g_per_kwh=co2g_per_kwh,
-            )
-        if energy_usage.memory_energy_usage:
-            memory_carbon_usage = Power.co2g_from_watts_hour(
-                Power.watts_to_watt_hours(
-                    watts=energy_usage.memory_energy_usage,
-                    previous_energy_measurement_time=self.previous_energy_consumption_time,
-                ),
-                co2g_per_kwh=co2g_per_kwh,
-            )
-        if energy_usage.gpu_energy_usage:
-            gpu_carbon_usage = Power.co2g_from_watts_hour(
-                Power.watts_to_watt_hours(
-                    watts=energy_usage.gpu_energy_usage,
-                    previous_energy_measurement_time=self.previous_energy_consumption_time,
-                ),
-                co2g_per_kwh=co2g_per_kwh,
+        now = time.monotonic()
+        duration_in_seconds = energy_usage.duration_in_seconds
+        if duration_in_seconds is None and self._previous_run_time is not None:
+            duration_in_seconds = now - self._previous_run_time
+        self._previous_run_time = now
+        carbon_usages: Dict[UsageType, float] = {}
+        for usage_type in UsageType:
+            joules = self._get_energy_in_joules(
+                energy_usage=energy_usage, usage_type=usage_type, duration_in_seconds=duration_in_seconds
             )
-        self.previous_energy_consumption_time = datetime.now()
+            carbon_usages[usage_type] = Power.co2g_from_joules(joules, co2g_per_kwh=co2g_per_kwh) if joules else 0.0
         return CarbonUsage(
-            host_carbon_usage=host_carbon_usage,
-            cpu_carbon_usage=cpu_carbon_usage if cpu_carbon_usage > 0 else None,
-            memory_carbon_usage=(memory_carbon_usage if memory_carbon_usage > 0 else None),
-            gpu_carbon_usage=gpu_carbon_usage if gpu_carbon_usage > 0 else None,
+            host_carbon_usage=carbon_usages[UsageType.HOST],
+            cpu_carbon_usage=carbon_usages[UsageType.CPU] if carbon_usages[UsageType.CPU] > 0 else None,
+            memory_carbon_usage=(carbon_usages[UsageType.MEMORY] if carbon_usages[UsageType.MEMORY] > 0 else None),
+            gpu_carbon_usage=carbon_usages[UsageType.GPU] if carbon_usages[UsageType.GPU] > 0 else None,
             unit=CarbonUsageUnit.CO2_G,
             carbon_intensity_metadata=self.location.carbon_intensity_metadata.model_copy(),
         )
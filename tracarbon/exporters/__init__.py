@@ -1,19 +1,37 @@
 from tracarbon.conf import DATADOG_INSTALLED
 from tracarbon.conf import PROMETHEUS_INSTALLED
 from tracarbon.exporters.exporter import Exporter
+from tracarbon.exporters.exporter import ExportQueue
 from tracarbon.exporters.exporter import Metric
+from tracarbon.exporters.exporter import MetricBatch
 from tracarbon.exporters.exporter import MetricGenerator
 from tracarbon.exporters.exporter import MetricReport
+from tracarbon.exporters.exporter import MetricReportStore
+from tracarbon.exporters.exporter import MetricType
+from tracarbon.exporters.exporter import MetricValue
+from tracarbon.exporters.exporter import OverflowPolicy
 from tracarbon.exporters.exporter import Tag
 from tracarbon.exporters.json_exporter import JSONExporter
+from tracarbon.exporters.multi_exporter import MultiExporter
+from tracarbon.exporters.spool import MetricSpool
+from tracarbon.exporters.statistics import QuantileSketch
 from tracarbon.exporters.stdout import StdoutExporter
 
 __all__ = [
+    "ExportQueue",
     "Exporter",
     "JSONExporter",
     "Metric",
+    "MetricBatch",
     "MetricGenerator",
     "MetricReport",
+    "MetricReportStore",
+    "MetricSpool",
+    "MetricType",
+    "MetricValue",
+    "MultiExporter",
+    "OverflowPolicy",
+    "QuantileSketch",
     "StdoutExporter",
     "Tag",
 ]
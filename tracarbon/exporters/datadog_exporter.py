@@ -1,19 +1,33 @@
+import asyncio
 import os
 from typing import Any
+from typing import Dict
+from typing import List
 
 from loguru import logger
+from pydantic import PrivateAttr
 
 from tracarbon.conf import DATADOG_INSTALLED
 from tracarbon.exporters.exporter import Exporter
+from tracarbon.exporters.exporter import MetricBatch
 from tracarbon.exporters.exporter import MetricGenerator
+from tracarbon.exporters.exporter import MetricType
+from tracarbon.exporters.statistics import REPORTED_QUANTILES
 
 if DATADOG_INSTALLED:
     from datadog import ThreadStats
+    from datadog import api
     from datadog import initialize
 
     class DatadogExporter(Exporter):
         """
         Datadog exporter for the metrics.
+
+        The quantiles of each metric over the run are sent in a `<metric>.quantile` gauge with a `quantile` tag.
+        With a spool, the metrics are sent synchronously in one request per batch, so a failed delivery is spooled
+        and replayed in bulk once Datadog is reachable again.
+        The counter metrics are sent as monotonic counts: the growth of their cumulative total since the last delivery.
+        A count is committed once delivered, so the next delivery covers the growth of a failed one.
         """
 
         api_key: str | None = None
@@ -21,6 +35,7 @@ if DATADOG_INSTALLED:
         stats: ThreadStats | None = None
         disable_buffering: bool = False
         datadog_flush_interval: int = 10
+        _counter_totals: Dict[str, float] = PrivateAttr(default_factory=dict)
 
         def __init__(self, **data: Any) -> None:
             """
@@ -45,18 +60,101 @@ if DATADOG_INSTALLED:
             :param metric_generator: the metric generators
             :return:
             """
-            async for metric in metric_generator.generate():
-                metric_value = await metric.value()
+            await self.launch_batch(batch=await metric_generator.generate_batch())
+
+        async def launch_batch(self, batch: MetricBatch) -> None:
+            """
+            Send a batch of metrics to Datadog.
+
+            :param batch: the batch of metrics
+            """
+            timestamp = batch.timestamp.timestamp()
+            series: List[Dict[str, Any]] = []
+            counter_totals: Dict[str, float] = {}
+            for metric, metric_value in batch:
                 if metric_value:
-                    await self.add_metric_to_report(metric=metric, value=metric_value)
+                    metric_report = await self.add_metric_to_report(metric=metric, value=metric_value)
                     metric_name = metric.format_name(metric_prefix_name=self.metric_prefix_name)
+                    if metric.metric_type == MetricType.COUNTER:
+                        previous_total = self._counter_totals.get(metric.series_key, 0.0)
+                        count = metric_value - previous_total if metric_value >= previous_total else metric_value
+                        counter_totals[metric.series_key] = metric_value
+                        if count > 0:
+                            logger.info(
+                                f"Sending count[{metric_name}] with value [{count}] "
+                                f"and tags{metric.format_tags()} to Datadog."
+                            )
+                            series.append(
+                                {
+                                    "metric": metric_name,
+                                    "points": [(timestamp, count)],
+                                    "tags": metric.format_tags(),
+                                    "type": "count",
+                                }
+                            )
+                        continue
                     logger.info(
                         f"Sending metric[{metric_name}] with value [{metric_value}] "
                         f"and tags{metric.format_tags()} to Datadog."
                     )
-                    if self.stats is None:
-                        raise RuntimeError("DatadogExporter stats not initialized")
-                    self.stats.gauge(metric_name, metric_value, tags=metric.format_tags())
+                    series.append(
+                        {"metric": metric_name, "points": [(timestamp, metric_value)], "tags": metric.format_tags()}
+                    )
+                    for quantile in REPORTED_QUANTILES:
+                        quantile_value = metric_report.quantile(quantile=quantile)
+                        if quantile_value is not None:
+                            series.append(
+                                {
+                                    "metric": f"{metric_name}.quantile",
+                                    "points": [(timestamp, quantile_value)],
+                                    "tags": metric.format_tags() + [f"quantile:{quantile}"],
+                                }
+                            )
+            await self._send(series=series)
+            self._counter_totals.update(counter_totals)
+
+        async def replay_batches(self, batches: List[MetricBatch]) -> None:
+            """
+            Send the batches replayed from the spool to Datadog in one request.
+            The replayed values were already added to the report when they were sampled.
+            The counters are not replayed: their growth is sent with the next delivered total.
+
+            :param batches: the replayed batches
+            """
+            series = [
+                {
+                    "metric": metric.format_name(metric_prefix_name=self.metric_prefix_name),
+                    "points": [(batch.timestamp.timestamp(), metric_value)],
+                    "tags": metric.format_tags(),
+                }
+                for batch in batches
+                for metric, metric_value in batch
+                if metric_value and metric.metric_type != MetricType.COUNTER
+            ]
+            logger.info(f"Replaying {len(series)} spooled metric(s) to Datadog.")
+            await self._send(series=series)
+
+        async def _send(self, series: List[Dict[str, Any]]) -> None:
+            """
+            Send the series to Datadog: buffered by the stats, or in one request raising on errors with a spool.
+
+            :param series: the series to send
+            """
+            if not series:
+                return
+            if self.spool is not None:
+                response = await asyncio.to_thread(api.Metric.send, metrics=series)
+                if isinstance(response, dict) and response.get("errors"):
+                    raise RuntimeError(f"Datadog rejected the metrics: {response['errors']}")
+                return
+            if self.stats is None:
+                raise RuntimeError("DatadogExporter stats not initialized")
+            for point in series:
+                (timestamp, value) = point["points"][0]
+                if point.get("type") == "count":
+                    self.stats.increment(point["metric"], value, timestamp=timestamp, tags=point["tags"])
+                else:
+                    self.stats.gauge(point["metric"], value, timestamp=timestamp, tags=point["tags"])
 
         @classmethod
         def get_name(cls) -> str:
@@ -1,25 +1,51 @@
 import asyncio
+import math
 import sys
+import time
 from abc import ABCMeta
 from abc import abstractmethod
+from array import array
+from collections import OrderedDict
+from collections import deque
+from concurrent import futures
 from datetime import datetime
+from datetime import timezone
+from enum import Enum
+from functools import partial
 from threading import Event
-from threading import Timer
+from typing import Any
 from typing import AsyncGenerator
 from typing import Awaitable
 from typing import Callable
+from typing import Deque
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Set
+from typing import Tuple
 
-from asyncer import asyncify
+import anyio
 from loguru import logger
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import PrivateAttr
+from pydantic import computed_field
 
+from tracarbon.exporters.spool import MetricSpool
+from tracarbon.exporters.statistics import QuantileSketch
+from tracarbon.exporters.statistics import RunningStatistics
+from tracarbon.exporters.statistics import SeriesAggregate
 from tracarbon.hardwares.hardware import HardwareInfo
+from tracarbon.hardwares.sample_bus import TickContext
+from tracarbon.hooks import HOOKS
+from tracarbon.hooks import HookPoint
 from tracarbon.locations import Location
+from tracarbon.scheduler import MissedTickPolicy
+from tracarbon.scheduler import Scheduler
+from tracarbon.telemetry import TELEMETRY
+
+SeriesTags = Tuple[Tuple[str, str], ...]
 
 
 class Tag(BaseModel):
@@ -31,14 +57,45 @@ class Tag(BaseModel):
     value: str
 
 
+class MetricValue:
+    """
+    Value holder of a pre-built metric: the generator sets a float per tick and the exporters await it.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: float | None = None) -> None:
+        self.value = value
+
+    async def __call__(self) -> float | None:
+        return self.value
+
+
+class MetricType(str, Enum):
+    """
+    Type of a metric: a gauge is an instantaneous value, a counter is a monotonic cumulative total.
+    """
+
+    GAUGE = "gauge"
+    COUNTER = "counter"
+
+
 class Metric(BaseModel):
     """
     Global metric to use for the exporters.
+
+    The formatted name, tags and series key are computed once per metric and cached,
+    so a metric is meant to be immutable once created.
     """
 
     name: str
     value: Callable[[], Awaitable[float | None]]
     tags: List[Tag] = Field(default_factory=list)
+    metric_type: MetricType = MetricType.GAUGE
+    _formatted_names: Dict[Tuple[str | None, str], str] = PrivateAttr(default_factory=dict)
+    _formatted_tags: Dict[str, List[str]] = PrivateAttr(default_factory=dict)
+    _tag_values: Tuple[str, ...] | None = PrivateAttr(default=None)
+    _series_key: str | None = PrivateAttr(default=None)
 
     def format_name(self, metric_prefix_name: str | None = None, separator: str = ".") -> str:
         """
@@ -47,9 +104,11 @@ class Metric(BaseModel):
         :param metric_prefix_name: the prefix to insert before the separator and the name.
         :param separator: the separator to use between the prefix and the name.
         """
-        if metric_prefix_name:
-            return f"{metric_prefix_name}{separator}{self.name}"
-        return self.name
+        formatted_name = self._formatted_names.get((metric_prefix_name, separator))
+        if formatted_name is None:
+            formatted_name = f"{metric_prefix_name}{separator}{self.name}" if metric_prefix_name else self.name
+            self._formatted_names[(metric_prefix_name, separator)] = formatted_name
+        return formatted_name
 
     def format_tags(self, separator: str = ":") -> List[str]:
         """
@@ -57,35 +116,287 @@ class Metric(BaseModel):
 
         :param separator: the separator to insert between the key and value.
         """
-        return [f"{tag.key}{separator}{tag.value}" for tag in self.tags]
+        formatted_tags = self._formatted_tags.get(separator)
+        if formatted_tags is None:
+            formatted_tags = [f"{tag.key}{separator}{tag.value}" for tag in self.tags]
+            self._formatted_tags[separator] = formatted_tags
+        return formatted_tags
+
+    @property
+    def tag_values(self) -> Tuple[str, ...]:
+        """
+        Get the values of the tags, in the order of the tags.
+
+        :return: the values of the tags
+        """
+        if self._tag_values is None:
+            self._tag_values = tuple(tag.value for tag in self.tags)
+        return self._tag_values
+
+    @property
+    def series_key(self) -> str:
+        """
+        Get the interned identity of the series of the metric: its name and its set of tags.
+
+        :return: the series key formatted as name{key=value,...} with the tags sorted by key
+        """
+        if self._series_key is None:
+            if self.tags:
+                tags = ",".join(f"{tag.key}={tag.value}" for tag in sorted(self.tags, key=lambda tag: tag.key))
+                self._series_key = sys.intern(f"{self.name}{{{tags}}}")
+            else:
+                self._series_key = sys.intern(self.name)
+        return self._series_key
 
 
 class MetricReport(BaseModel):
     """
     MetricReport is a report of the generated metrics.
+
+    The statistics are streamed in the event loop: adding a value is a constant-time update without any executor hop.
     """
 
     exporter_name: str
     metric: "Metric"
-    average_interval_in_seconds: float | None = None
     last_report_time: datetime | None = None
-    total: float = 0.0
-    average: float = 0.0
-    minimum: float = sys.float_info.max
-    maximum: float = 0.0
-    call_count: int = 0
+    _statistics: RunningStatistics = PrivateAttr(default_factory=RunningStatistics)
+    _sketch: QuantileSketch = PrivateAttr(default_factory=QuantileSketch)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @property
+    def last_update_time(self) -> float | None:
+        """
+        Get the monotonic time of the last value.
+
+        :return: the monotonic time in seconds or None without values
+        """
+        return self._statistics.last_time
+
+    def add(self, value: float) -> None:
+        """
+        Add a value to the report.
+
+        :param value: the metric value to add
+        """
+        self._statistics.add(value=value, now=time.monotonic())
+        self._sketch.add(value=value)
+        self.last_report_time = datetime.now()
+
+    @property
+    def sketch(self) -> QuantileSketch:
+        """
+        Get the quantile sketch of the values, to merge it with the sketches of other reports.
+
+        :return: the quantile sketch
+        """
+        return self._sketch
+
+    def quantile(self, quantile: float) -> float | None:
+        """
+        Estimate a quantile of the values.
+
+        :param quantile: the quantile to estimate, between 0 and 1
+        :return: the estimated quantile or None without values
+        """
+        return self._sketch.quantile(quantile=quantile)
+
+    @computed_field
+    @property
+    def call_count(self) -> int:
+        """
+        Get the number of values.
+        """
+        return self._statistics.count
+
+    @computed_field
+    @property
+    def total(self) -> float:
+        """
+        Get the sum of the values.
+        """
+        return self._statistics.total
+
+    @computed_field
+    @property
+    def average(self) -> float:
+        """
+        Get the mean of the values.
+        """
+        return self._statistics.mean
+
+    @computed_field
+    @property
+    def minimum(self) -> float:
+        """
+        Get the minimum of the values.
+        """
+        return self._statistics.minimum
+
+    @computed_field
+    @property
+    def maximum(self) -> float:
+        """
+        Get the maximum of the values.
+        """
+        return self._statistics.maximum
+
+    @computed_field
+    @property
+    def variance(self) -> float | None:
+        """
+        Get the sample variance of the values.
+        """
+        return self._statistics.variance
+
+    @computed_field
+    @property
+    def standard_deviation(self) -> float | None:
+        """
+        Get the sample standard deviation of the values.
+        """
+        return self._statistics.standard_deviation
+
+    @computed_field
+    @property
+    def time_weighted_average(self) -> float | None:
+        """
+        Get the mean of the values weighted by the interval they cover.
+        """
+        return self._statistics.time_weighted_mean
+
+    @computed_field
+    @property
+    def average_interval_in_seconds(self) -> float | None:
+        """
+        Get the mean interval between two values.
+        """
+        return self._statistics.average_interval_in_seconds
+
+    @computed_field
+    @property
+    def p50(self) -> float | None:
+        """
+        Get the estimated median of the values.
+        """
+        return self._sketch.quantile(quantile=0.5)
+
+    @computed_field
+    @property
+    def p90(self) -> float | None:
+        """
+        Get the estimated 90th percentile of the values.
+        """
+        return self._sketch.quantile(quantile=0.9)
+
+    @computed_field
+    @property
+    def p95(self) -> float | None:
+        """
+        Get the estimated 95th percentile of the values.
+        """
+        return self._sketch.quantile(quantile=0.95)
+
+    @computed_field
+    @property
+    def p99(self) -> float | None:
+        """
+        Get the estimated 99th percentile of the values.
+        """
+        return self._sketch.quantile(quantile=0.99)
+
+
+class MetricReportStore(OrderedDict[str, MetricReport]):
+    """
+    Reports of the metric series, keyed by series key, with a bounded cardinality.
+
+    The series are kept in least recently updated order: the series idle for longer than the idle timeout are evicted,
+    then the least recently updated series are evicted to stay under the maximum number of series.
+    """
+
+    def __init__(self, max_series: int | None = None, idle_timeout_in_seconds: float | None = None) -> None:
+        super().__init__()
+        self.max_series = max_series
+        self.idle_timeout_in_seconds = idle_timeout_in_seconds
+        self.evicted_series_count = 0
+
+    def get_or_create(self, series_key: str, exporter_name: str, metric: Metric) -> MetricReport:
+        """
+        Get the report of a series and mark it as the most recently updated, creating it if needed.
+
+        :param series_key: the series key of the metric
+        :param exporter_name: the name of the exporter
+        :param metric: the metric of the series
+        :return: the report of the series
+        """
+        self.evict_idle_series(now=time.monotonic())
+        metric_report = self.get(series_key)
+        if metric_report is not None:
+            self.move_to_end(series_key)
+            return metric_report
+        if self.max_series is not None:
+            while self and len(self) >= self.max_series:
+                self.popitem(last=False)
+                self.evicted_series_count += 1
+        metric_report = MetricReport(exporter_name=exporter_name, metric=metric)
+        self[series_key] = metric_report
+        return metric_report
+
+    def evict_idle_series(self, now: float) -> None:
+        """
+        Evict the series not updated since the idle timeout.
+
+        :param now: the current monotonic time in seconds
+        """
+        if self.idle_timeout_in_seconds is None:
+            return
+        deadline = now - self.idle_timeout_in_seconds
+        while self:
+            last_update_time = next(iter(self.values())).last_update_time
+            if last_update_time is None or last_update_time >= deadline:
+                return
+            self.popitem(last=False)
+            self.evicted_series_count += 1
+
 
 class MetricGenerator(BaseModel):
     """
     MetricGenerator generates metrics for the Exporter.
+
+    A generator with its own interval is sampled at its own cadence by the scheduler of the exporter,
+    and the exporter ticks hold its last sampled values until the next sample.
+    The generate_batch implementations are surrounded by the metric generator hooks.
+
+    A generator measuring over the intervals between its samples overrides prime: it is primed when the exporter
+    starts, so its first sample covers the interval since the start, and sampled once more when the exporter stops.
     """
 
     metrics: List[Metric]
     platform: str = HardwareInfo.get_platform()
     location: Location | None = None
+    interval_in_seconds: float | None = None
+    _series_metrics: Dict[Tuple[str, SeriesTags], Tuple[Metric, MetricValue]] = PrivateAttr(default_factory=dict)
+    _counter_totals: Dict[Tuple[str, SeriesTags], float] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        HOOKS.hook_method(cls=cls, name="generate_batch", point=HookPoint.METRIC_GENERATOR)
+
+    async def prime(self) -> None:
+        """
+        Take the baseline of the measures made over an interval, nothing by default.
+        """
+        pass
+
+    @classmethod
+    def needs_priming(cls) -> bool:
+        """
+        Check if the metric generator measures over intervals, i.e. if prime is overridden.
+
+        :return: if the metric generator is primed on start and sampled on stop
+        """
+        return cls.prime is not MetricGenerator.prime
 
     async def generate(self) -> AsyncGenerator[Metric, None]:
         """
@@ -94,6 +405,372 @@ class MetricGenerator(BaseModel):
         for metric in self.metrics:
             yield metric
 
+    async def generate_batch(self) -> "MetricBatch":
+        """
+        Generate the metrics and their values of the tick in one batch.
+        By default, the metrics of generate are awaited one by one: override it to fill the batch in bulk.
+
+        :return: the batch of the metrics
+        """
+        batch = MetricBatch()
+        async for metric in self.generate():
+            try:
+                metric_value = await metric.value()
+            except Exception as e:
+                logger.error(f"Error processing metric '{metric.name}': {e}")
+                metric_value = None
+            batch.append(metric=metric, value=metric_value)
+        return batch
+
+    def series_metric(
+        self, name: str, tags: SeriesTags, value: float | None, metric_type: MetricType = MetricType.GAUGE
+    ) -> Metric:
+        """
+        Get the pre-built metric of a series with its value of the tick.
+        The metric and its tags are built once per series, then only the value is set on each tick.
+        A generator is therefore meant to be run by one exporter, use a MultiExporter to fan it out.
+
+        :param name: the name of the metric
+        :param tags: the (key, value) pairs of the tags
+        :param value: the value of the tick
+        :param metric_type: the type of the metric
+        :return: the metric of the series
+        """
+        series_metric = self._series_metrics.get((name, tags))
+        if series_metric is None:
+            metric_value = MetricValue()
+            metric = Metric(
+                name=name,
+                value=metric_value,
+                tags=[Tag(key=key, value=tag) for key, tag in tags],
+                metric_type=metric_type,
+            )
+            series_metric = (metric, metric_value)
+            self._series_metrics[(name, tags)] = series_metric
+        series_metric[1].value = value
+        return series_metric[0]
+
+    def append_series_metric(self, batch: "MetricBatch", name: str, tags: SeriesTags, value: float | None) -> None:
+        """
+        Append the pre-built metric of a series and its value of the tick to a batch.
+
+        :param batch: the batch of the tick
+        :param name: the name of the metric
+        :param tags: the (key, value) pairs of the tags
+        :param value: the value of the tick
+        """
+        batch.append(metric=self.series_metric(name=name, tags=tags, value=value), value=value)
+
+    def append_series_counter(self, batch: "MetricBatch", name: str, tags: SeriesTags, increase: float | None) -> None:
+        """
+        Add the increase of the tick to the cumulative total of a counter series and append the total to a batch.
+        The total stays missing until the first increase.
+
+        :param batch: the batch of the tick
+        :param name: the name of the counter
+        :param tags: the (key, value) pairs of the tags
+        :param increase: the increase of the tick, None if missing
+        """
+        total = self._counter_totals.get((name, tags))
+        if increase is not None:
+            total = (total or 0.0) + max(increase, 0.0)
+            self._counter_totals[(name, tags)] = total
+        batch.append(
+            metric=self.series_metric(name=name, tags=tags, value=total, metric_type=MetricType.COUNTER), value=total
+        )
+
+    def prune_series_metrics(self, tags: Set[SeriesTags]) -> None:
+        """
+        Drop the pre-built metrics and the counter totals of the series whose tags were not generated in the tick,
+        e.g. deleted pods.
+
+        :param tags: the tags of the series to keep
+        """
+        for series in [series for series in self._series_metrics if series[1] not in tags]:
+            del self._series_metrics[series]
+            self._counter_totals.pop(series, None)
+
+
+HOOKS.hook_method(cls=MetricGenerator, name="generate_batch", point=HookPoint.METRIC_GENERATOR)
+
+
+class MetricBatch:
+    """
+    Batch of the metrics of a tick: the series and their values in parallel arrays, with one shared timestamp.
+    A missing value is stored as NaN. The batch of an export window also holds the aggregate of each series.
+    """
+
+    __slots__ = ("metrics", "values", "timestamp", "aggregates")
+
+    def __init__(
+        self,
+        metrics: List[Metric] | None = None,
+        values: array | None = None,
+        timestamp: datetime | None = None,
+        aggregates: List[SeriesAggregate] | None = None,
+    ) -> None:
+        self.metrics = metrics if metrics is not None else []
+        self.values = values if values is not None else array("d")
+        self.timestamp = timestamp if timestamp is not None else datetime.now(timezone.utc)
+        self.aggregates = aggregates
+
+    def __len__(self) -> int:
+        return len(self.metrics)
+
+    def __iter__(self) -> Iterator[Tuple[Metric, float | None]]:
+        """
+        Iterate over the metrics and their values, None for the missing values.
+        """
+        for metric, value in zip(self.metrics, self.values, strict=True):
+            yield metric, None if math.isnan(value) else value
+
+    def append(self, metric: Metric, value: float | None) -> None:
+        """
+        Append a metric and its value to the batch.
+
+        :param metric: the metric
+        :param value: the value of the metric, None if missing
+        """
+        self.metrics.append(metric)
+        self.values.append(math.nan if value is None else value)
+
+    def copy(self) -> "MetricBatch":
+        """
+        Copy the batch, so coalescing a newer batch into the copy leaves this batch unchanged.
+
+        :return: the copy of the batch
+        """
+        return MetricBatch(
+            metrics=list(self.metrics),
+            values=array("d", self.values),
+            timestamp=self.timestamp,
+            aggregates=list(self.aggregates) if self.aggregates is not None else None,
+        )
+
+    def coalesce(self, other: "MetricBatch") -> None:
+        """
+        Coalesce a newer batch into this batch: the latest value of each series wins and the new series are appended.
+        A value missing from the newer batch keeps the value of this batch.
+
+        :param other: the newer batch
+        """
+        indexes = {metric.series_key: index for index, metric in enumerate(self.metrics)}
+        aggregates = self.aggregates if self.aggregates is not None and other.aggregates is not None else None
+        for position, metric in enumerate(other.metrics):
+            index = indexes.get(metric.series_key)
+            if index is None:
+                self.metrics.append(metric)
+                self.values.append(other.values[position])
+                if aggregates is not None and other.aggregates is not None:
+                    aggregates.append(other.aggregates[position])
+            elif not math.isnan(other.values[position]):
+                self.metrics[index] = metric
+                self.values[index] = other.values[position]
+                if aggregates is not None and other.aggregates is not None:
+                    aggregates[index] = other.aggregates[position]
+        self.aggregates = aggregates
+        self.timestamp = other.timestamp
+
+    def to_record(self) -> Dict[str, Any]:
+        """
+        Serialize the values of the batch, to spool them.
+
+        :return: the record of the batch, without the missing values and the aggregates
+        """
+        return {
+            "timestamp": self.timestamp.timestamp(),
+            "metrics": [
+                [metric.name, [[tag.key, tag.value] for tag in metric.tags], value, metric.metric_type.value]
+                for metric, value in self
+                if value is not None
+            ],
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "MetricBatch":
+        """
+        Deserialize a batch spooled with to_record.
+
+        :param record: the record of the batch
+        :return: the batch
+        """
+        batch = cls(timestamp=datetime.fromtimestamp(record["timestamp"], timezone.utc))
+        for name, tags, value, *metric_type in record["metrics"]:
+            batch.append(
+                metric=Metric(
+                    name=name,
+                    value=MetricValue(value=value),
+                    tags=[Tag(key=tag_key, value=tag_value) for tag_key, tag_value in tags],
+                    metric_type=MetricType(metric_type[0]) if metric_type else MetricType.GAUGE,
+                ),
+                value=value,
+            )
+        return batch
+
+    def to_metric_generator(self) -> "MetricGenerator":
+        """
+        Convert the batch to a metric generator replaying its values, for the exporters launched per metric.
+
+        :return: the metric generator
+        """
+        return MetricGenerator(
+            metrics=[
+                Metric(
+                    name=metric.name,
+                    value=MetricValue(value=value),
+                    tags=metric.tags,
+                    metric_type=metric.metric_type,
+                )
+                for metric, value in self
+            ]
+        )
+
+
+class MetricAggregator:
+    """
+    Aggregate the sampled batches of the metric series between two exports.
+    """
+
+    __slots__ = ("series", "window_start")
+
+    def __init__(self) -> None:
+        self.series: Dict[str, Tuple[Metric, SeriesAggregate]] = {}
+        self.window_start = time.monotonic()
+
+    def add(self, batch: MetricBatch, now: float) -> None:
+        """
+        Add a sampled batch to the aggregates of the window.
+
+        :param batch: the sampled batch
+        :param now: the monotonic time of the batch in seconds
+        """
+        for metric, value in batch:
+            if value is None:
+                continue
+            series = self.series.get(metric.series_key)
+            if series is None:
+                series = (metric, SeriesAggregate(start_time=self.window_start))
+                self.series[metric.series_key] = series
+            series[1].add(value=value, now=now)
+
+    def flush(self, now: float) -> MetricBatch | None:
+        """
+        Close the window: get one point per series, its time-weighted mean or the last total of a counter,
+        and start a new window.
+
+        :param now: the monotonic time of the end of the window in seconds
+        :return: the aggregated batch or None if nothing was sampled
+        """
+        series = self.series
+        self.series = {}
+        self.window_start = now
+        if not series:
+            return None
+        aggregates: List[SeriesAggregate] = []
+        batch = MetricBatch(aggregates=aggregates)
+        for metric, aggregate in series.values():
+            batch.append(
+                metric=metric,
+                value=aggregate.last if metric.metric_type == MetricType.COUNTER else aggregate.time_weighted_mean,
+            )
+            aggregates.append(aggregate)
+        return batch
+
+
+class OverflowPolicy(str, Enum):
+    """
+    Policy applied when a batch is put in a full export queue.
+    """
+
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    BLOCK = "block"
+
+
+class ExportQueue:
+    """
+    Bounded queue between the sampling and the export stages, so a slow exporter does not delay the sampling.
+
+    When the queue is full, drop_oldest drops the oldest batch, coalesce merges the batch into the newest queued batch
+    with the latest values winning, and block waits for the exporter: the sampling is then slowed down by the exporter.
+    """
+
+    __slots__ = (
+        "maximum_size",
+        "overflow_policy",
+        "dropped_batch_count",
+        "coalesced_batch_count",
+        "blocked_batch_count",
+        "_batches",
+        "_unfinished_batch_count",
+        "_condition",
+    )
+
+    def __init__(self, maximum_size: int, overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST) -> None:
+        if maximum_size < 1:
+            raise ValueError(f"The maximum size of the export queue must be positive, got {maximum_size}.")
+        self.maximum_size = maximum_size
+        self.overflow_policy = overflow_policy
+        self.dropped_batch_count = 0
+        self.coalesced_batch_count = 0
+        self.blocked_batch_count = 0
+        self._batches: Deque[MetricBatch] = deque()
+        self._unfinished_batch_count = 0
+        self._condition = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._batches)
+
+    async def put(self, batch: MetricBatch) -> None:
+        """
+        Put a batch in the queue, applying the overflow policy if the queue is full.
+
+        :param batch: the batch to export
+        """
+        async with self._condition:
+            if len(self._batches) >= self.maximum_size:
+                if self.overflow_policy == OverflowPolicy.COALESCE:
+                    self._batches[-1].coalesce(batch)
+                    self.coalesced_batch_count += 1
+                    return
+                if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                    self._batches.popleft()
+                    self._unfinished_batch_count -= 1
+                    self.dropped_batch_count += 1
+                else:
+                    self.blocked_batch_count += 1
+                    await self._condition.wait_for(lambda: len(self._batches) < self.maximum_size)
+            self._batches.append(batch)
+            self._unfinished_batch_count += 1
+            self._condition.notify_all()
+
+    async def get(self) -> MetricBatch:
+        """
+        Get the oldest batch of the queue, waiting for one if the queue is empty.
+
+        :return: the oldest batch
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: len(self._batches) > 0)
+            batch = self._batches.popleft()
+            self._condition.notify_all()
+            return batch
+
+    async def task_done(self) -> None:
+        """
+        Mark a batch got from the queue as exported.
+        """
+        async with self._condition:
+            self._unfinished_batch_count -= 1
+            self._condition.notify_all()
+
+    async def join(self) -> None:
+        """
+        Wait until all the batches put in the queue are exported.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._unfinished_batch_count == 0)
+
 
 class Exporter(BaseModel, metaclass=ABCMeta):
     """The Exporter interface."""
@@ -102,8 +779,20 @@ class Exporter(BaseModel, metaclass=ABCMeta):
     event: Event | None = None
     stopped: bool = False
     metric_prefix_name: str | None = None
-    metric_report: Dict[str, MetricReport] = Field(default_factory=dict)
-    _timer: Timer | None = PrivateAttr(default=None)
+    metric_report: MetricReportStore = Field(default_factory=MetricReportStore)
+    metric_report_max_series: int | None = 10000
+    metric_report_idle_timeout_in_seconds: float | None = None
+    metric_generator_timeout_in_seconds: float | None = None
+    metric_generator_prime_timeout_in_seconds: float = 30.0
+    spool: MetricSpool | None = None
+    export_queue_size: int | None = None
+    export_overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    export_queue_drain_timeout_in_seconds: float | None = None
+    _scheduler: Scheduler | None = PrivateAttr(default=None)
+    _aggregator: MetricAggregator | None = PrivateAttr(default=None)
+    _interval_in_seconds: float | None = PrivateAttr(default=None)
+    _held_batches: Dict[int, MetricBatch] = PrivateAttr(default_factory=dict)
+    _export_queue: ExportQueue | None = PrivateAttr(default=None)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -117,81 +806,449 @@ class Exporter(BaseModel, metaclass=ABCMeta):
         """
         pass
 
-    def start(self, interval_in_seconds: int) -> None:
+    async def launch_batch(self, batch: MetricBatch) -> None:
+        """
+        Launch the exporter with a batch of metrics.
+        By default, the batch is replayed through launch: override it to export the batch in bulk.
+
+        :param batch: the batch of metrics
+        """
+        await self.launch(metric_generator=batch.to_metric_generator())
+
+    @classmethod
+    def launches_batches(cls) -> bool:
+        """
+        Check if the exporter exports batches, i.e. if launch_batch is overridden at least as deep as launch.
+        An exporter overriding launch only keeps being launched per metric.
+
+        :return: if the exporter is launched with batches
+        """
+        for klass in cls.__mro__:
+            if "launch_batch" in vars(klass):
+                return klass is not Exporter
+            if "launch" in vars(klass):
+                return False
+        return False
+
+    async def export_batch(self, batch: MetricBatch) -> None:
+        """
+        Export a batch of metrics with launch_batch or, for the exporters launched per metric, with launch.
+
+        With a spool, a batch failing to be delivered is spooled, and the spooled batches are replayed
+        after the next successful delivery. The spool is checked from its count of pending segments, without I/O.
+
+        :param batch: the batch of metrics
+        """
+        if self.spool is None:
+            await self._deliver(batch=batch)
+            return
+        try:
+            await self._deliver(batch=batch)
+        except Exception as exception:
+            logger.warning(f"The {self.get_name()} exporter failed to deliver a batch, spooling it: {exception}")
+            await asyncio.to_thread(self.spool.append, [batch.to_record()])
+            return
+        if not self.spool.is_empty:
+            await self.replay_spool()
+
+    async def _deliver(self, batch: MetricBatch) -> None:
+        """
+        Deliver a batch of metrics with launch_batch or launch.
+
+        :param batch: the batch of metrics
+        """
+        start = time.perf_counter()
+        if self.launches_batches():
+            await HOOKS.call(HookPoint.EXPORTER, self, self.launch_batch, batch=batch)
+        else:
+            await HOOKS.call(HookPoint.EXPORTER, self, self.launch, metric_generator=batch.to_metric_generator())
+        TELEMETRY.record(kind="export", name=self.get_name(), duration_in_seconds=time.perf_counter() - start)
+
+    async def replay_batches(self, batches: List[MetricBatch]) -> None:
+        """
+        Deliver the batches replayed from the spool, raising if the delivery fails.
+        By default, the batches are delivered one by one: override it to deliver them in bulk.
+
+        :param batches: the replayed batches, from the oldest to the newest
+        """
+        for batch in batches:
+            await self._deliver(batch=batch)
+
+    async def replay_spool(self) -> bool:
+        """
+        Replay the spooled batches in bulk until the spool is empty or a delivery fails.
+
+        :return: if all the spooled batches are delivered
+        """
+        if self.spool is None:
+            return True
+        return await self.spool.replay(
+            send=lambda records: self.replay_batches(batches=[MetricBatch.from_record(record) for record in records])
+        )
+
+    @property
+    def scheduler(self) -> Scheduler | None:
+        """
+        Get the scheduler running the exporter, to measure its startup and tick overhead.
+
+        :return: the scheduler if the exporter is started
+        """
+        return self._scheduler
+
+    @property
+    def export_queue(self) -> ExportQueue | None:
         """
-        Start the exporter and a dedicated timer configured with the configured timeout.
+        Get the queue between the sampling and the export, to measure the dropped, coalesced and blocked batches.
+
+        :return: the export queue if the exporter is started with an export queue size
+        """
+        return self._export_queue
+
+    def start(
+        self,
+        interval_in_seconds: float,
+        missed_tick_policy: MissedTickPolicy = MissedTickPolicy.SKIP,
+        export_interval_in_seconds: float | None = None,
+    ) -> None:
+        """
+        Start the exporter on a long-lived scheduler ticking at the configured interval.
+        The first tick is run before returning.
+
+        With an export interval longer than the interval, the ticks only sample the metric generators:
+        the samples are aggregated per series and exported once per export interval, and once more on stop.
 
-        :param: interval_in_seconds: the interval for the timer
+        The metric generators with their own interval are sampled by their own job on the same scheduler,
+        their first sample is taken before the first tick and the ticks hold their last sampled values.
+
+        With an export queue size, the batches are exported by a consumer task through a bounded queue,
+        so a slow exporter does not delay the sampling: the overflow policy applies when the queue is full.
+
+        The metric generators measuring over intervals are primed before the first tick, so the first tick
+        covers the interval since the start.
+
+        :param: interval_in_seconds: the interval between two ticks
+        :param: missed_tick_policy: the policy to apply when ticks are missed
+        :param: export_interval_in_seconds: the interval between two exports, the interval by default
         """
         self.stopped = False
         if not self.event:
             self.event = Event()
+        self.event.clear()
 
-        def _run() -> None:
-            asyncio.run(self._launch_all())
-            if self.event and not self.stopped and not self.event.is_set():
-                timer = Timer(interval_in_seconds, _run, [])
-                timer.daemon = True
-                self._timer = timer
-                timer.start()
-
-        self.metric_report = dict()
-        _run()
+        self.reset_metric_report()
+        aggregated = export_interval_in_seconds is not None and export_interval_in_seconds != interval_in_seconds
+        self._aggregator = MetricAggregator() if aggregated else None
+        self._interval_in_seconds = interval_in_seconds
+        self._held_batches = dict()
+        self._export_queue = (
+            ExportQueue(maximum_size=self.export_queue_size, overflow_policy=self.export_overflow_policy)
+            if self.export_queue_size is not None
+            else None
+        )
+        self._scheduler = Scheduler(name=f"tracarbon-{self.get_name().lower()}")
+        self._scheduler.start()
+        self._spawn_export_queue_consumers()
+        self._scheduler.run(self._prime())
+        held_jobs = []
+        for metric_generator in self.metric_generators:
+            if metric_generator.interval_in_seconds is None or not self._is_held(metric_generator=metric_generator):
+                continue
+            held_jobs.append(
+                self._scheduler.schedule(
+                    callback=partial(self._sample_held_metric_generator, metric_generator),
+                    interval_in_seconds=metric_generator.interval_in_seconds,
+                    missed_tick_policy=missed_tick_policy,
+                    name=f"{self.get_name()}-{type(metric_generator).__name__}",
+                )
+            )
+        for held_job in held_jobs:
+            held_job.wait_for_first_run()
+        job = self._scheduler.schedule(
+            callback=self._tick,
+            interval_in_seconds=interval_in_seconds,
+            missed_tick_policy=missed_tick_policy,
+            name=self.get_name(),
+        )
+        if export_interval_in_seconds is not None and aggregated:
+            self._scheduler.schedule(
+                callback=self._export,
+                interval_in_seconds=export_interval_in_seconds,
+                missed_tick_policy=MissedTickPolicy.SKIP,
+                name=f"{self.get_name()}-export",
+                delay_in_seconds=export_interval_in_seconds,
+            )
+        job.wait_for_first_run()
 
     def stop(self) -> None:
         """
-        Stop the explorer and the associated timer.
+        Stop the explorer and the associated scheduler.
+        The metric generators measuring over intervals are sampled a last time, so the interval since the last tick
+        is measured, then the samples aggregated since the last export and the queued batches are exported.
 
         :return:
         """
         self.stopped = True
         if self.event:
             self.event.set()
-        if self._timer is not None:
-            self._timer.cancel()
-            self._timer = None
+        if self._scheduler is not None:
+            if not self._scheduler.is_current_thread:
+                self._scheduler.run(self._sample_final())
+                if self._aggregator is not None:
+                    self._scheduler.run(self._export())
+                self._drain_export_queues()
+            self._scheduler.stop()
+            self._scheduler = None
+
+    def _drain_export_queues(self) -> None:
+        """
+        Wait for the queued batches to be exported, bounded by the drain timeout.
+        """
+        if self._scheduler is None or self._export_queue is None:
+            return
+        self._drain_export_queue(export_queue=self._export_queue, exporter_name=self.get_name())
+
+    def _drain_export_queue(self, export_queue: ExportQueue, exporter_name: str) -> None:
+        """
+        Wait for the batches of an export queue to be exported, bounded by the drain timeout.
+
+        :param export_queue: the export queue
+        :param exporter_name: the name of the exporter consuming the queue
+        """
+        if self._scheduler is None:
+            return
+        try:
+            self._scheduler.run(export_queue.join(), timeout=self.export_queue_drain_timeout_in_seconds)
+        except futures.TimeoutError:
+            logger.warning(
+                f"{len(export_queue)} queued batch(es) not exported "
+                f"by the {exporter_name} exporter after {self.export_queue_drain_timeout_in_seconds}s."
+            )
+
+    async def _tick(self) -> None:
+        """
+        Run one tick of the exporter unless it has been stopped.
+        """
+        if self.stopped or (self.event and self.event.is_set()):
+            return
+        await self._launch_all()
+
+    async def _prime(self) -> None:
+        """
+        Prime the metric generators measuring over intervals concurrently, isolating their errors.
+        Each prime is bounded by the prime timeout, or the metric generator timeout if shorter,
+        so a hanging sensor does not block the start.
+        """
+        timeout_in_seconds = self.metric_generator_prime_timeout_in_seconds
+        if self.metric_generator_timeout_in_seconds is not None:
+            timeout_in_seconds = min(timeout_in_seconds, self.metric_generator_timeout_in_seconds)
+
+        async def prime(metric_generator: "MetricGenerator") -> None:
+            try:
+                with anyio.fail_after(timeout_in_seconds):
+                    await metric_generator.prime()
+            except TimeoutError:
+                logger.warning(
+                    f"MetricGenerator[{type(metric_generator).__name__}] timed out after {timeout_in_seconds}s "
+                    f"priming in the {self.get_name()} exporter."
+                )
+            except Exception:
+                logger.exception(
+                    f"MetricGenerator[{type(metric_generator).__name__}] failed to prime in the "
+                    f"{self.get_name()} exporter."
+                )
+
+        with TickContext():
+            async with anyio.create_task_group() as task_group:
+                for metric_generator in self.metric_generators:
+                    if metric_generator.needs_priming():
+                        task_group.start_soon(prime, metric_generator)
+
+    async def _sample_final(self) -> None:
+        """
+        Sample the metric generators measuring over intervals a last time, for the interval since the last tick.
+        """
+        metric_generators = [
+            metric_generator for metric_generator in self.metric_generators if metric_generator.needs_priming()
+        ]
+        if not metric_generators:
+            return
+        with TickContext():
+            await self._launch_metric_generators(metric_generators=metric_generators)
+
+    def _is_held(self, metric_generator: "MetricGenerator") -> bool:
+        """
+        Check if the metric generator is sampled at its own cadence and held between its samples.
+
+        :param metric_generator: the metric generator
+        :return: if the metric generator is held
+        """
+        return (
+            metric_generator.interval_in_seconds is not None
+            and metric_generator.interval_in_seconds != self._interval_in_seconds
+        )
 
     async def _launch_all(self) -> None:
         """
-        Launch the exporter with all the metric generators.
+        Launch the exporter with all the metric generators concurrently inside one tick context.
+        The tick latency is set by the slowest metric generator.
+        The metric generators sampled at their own cadence are launched with their last sampled batch.
         """
-        for metric_generator in self.metric_generators:
-            logger.debug(f"Running MetricGenerator[{metric_generator}].")
-            await self.launch(metric_generator=metric_generator)
+        with TickContext():
+            await self._launch_metric_generators(
+                metric_generators=[
+                    metric_generator
+                    for metric_generator in self.metric_generators
+                    if not self._is_held(metric_generator=metric_generator)
+                ]
+            )
+        for batch in list(self._held_batches.values()):
+            try:
+                if self._aggregator is not None:
+                    self._aggregator.add(batch=batch, now=time.monotonic())
+                else:
+                    await self._ship(batch=batch)
+            except Exception:
+                logger.exception(f"The held metrics failed in the {self.get_name()} exporter.")
+
+    async def _sample_held_metric_generator(self, metric_generator: "MetricGenerator") -> None:
+        """
+        Sample a metric generator at its own cadence and hold its batch for the ticks of the exporter.
+
+        :param metric_generator: the metric generator
+        """
+        if self.stopped:
+            return
+        try:
+            with TickContext(), anyio.fail_after(self.metric_generator_timeout_in_seconds):
+                batch = await metric_generator.generate_batch()
+        except TimeoutError:
+            logger.warning(
+                f"MetricGenerator[{type(metric_generator).__name__}] timed out after "
+                f"{self.metric_generator_timeout_in_seconds}s in the {self.get_name()} exporter."
+            )
+            return
+        except Exception:
+            logger.exception(
+                f"MetricGenerator[{type(metric_generator).__name__}] failed in the {self.get_name()} exporter."
+            )
+            return
+        self._held_batches[id(metric_generator)] = batch
+        if self._aggregator is not None:
+            self._aggregator.add(batch=batch, now=time.monotonic())
+
+    async def _launch_metric_generators(self, metric_generators: List["MetricGenerator"]) -> None:
+        """
+        Launch the exporter with the metric generators concurrently.
+
+        :param metric_generators: the metric generators
+        """
+        async with anyio.create_task_group() as task_group:
+            for metric_generator in metric_generators:
+                task_group.start_soon(self._launch_metric_generator, metric_generator)
+
+    async def _launch_metric_generator(self, metric_generator: "MetricGenerator") -> None:
+        """
+        Launch the exporter with one metric generator, isolating its errors and bounding its duration.
+        When the exports are aggregated, the metric generator is only sampled.
+
+        :param metric_generator: the metric generator
+        """
+        logger.debug(f"Running MetricGenerator[{metric_generator}].")
+        try:
+            with anyio.fail_after(self.metric_generator_timeout_in_seconds):
+                if self._aggregator is not None:
+                    self._aggregator.add(batch=await metric_generator.generate_batch(), now=time.monotonic())
+                elif self._export_queue is not None:
+                    await self._export_queue.put(await metric_generator.generate_batch())
+                elif self.launches_batches():
+                    batch = await metric_generator.generate_batch()
+                    start = time.perf_counter()
+                    await HOOKS.call(HookPoint.EXPORTER, self, self.launch_batch, batch=batch)
+                    TELEMETRY.record(
+                        kind="export", name=self.get_name(), duration_in_seconds=time.perf_counter() - start
+                    )
+                else:
+                    await HOOKS.call(HookPoint.EXPORTER, self, self.launch, metric_generator=metric_generator)
+        except TimeoutError:
+            logger.warning(
+                f"MetricGenerator[{type(metric_generator).__name__}] timed out after "
+                f"{self.metric_generator_timeout_in_seconds}s in the {self.get_name()} exporter."
+            )
+        except Exception:
+            logger.exception(
+                f"MetricGenerator[{type(metric_generator).__name__}] failed in the {self.get_name()} exporter."
+            )
+
+    async def _export(self) -> None:
+        """
+        Export the batch aggregated since the last export.
+        """
+        if self._aggregator is None:
+            return
+        batch = self._aggregator.flush(now=time.monotonic())
+        if batch is None:
+            return
+        try:
+            await self._ship(batch=batch)
+        except Exception:
+            logger.exception(f"The export of the aggregated metrics failed in the {self.get_name()} exporter.")
+
+    async def _ship(self, batch: MetricBatch) -> None:
+        """
+        Export a batch, through the export queue if any.
+
+        :param batch: the batch of metrics
+        """
+        if self._export_queue is not None:
+            await self._export_queue.put(batch)
+        else:
+            await self.export_batch(batch=batch)
+
+    def _spawn_export_queue_consumers(self) -> None:
+        """
+        Spawn the consumer task of the export queue, if any, on the scheduler.
+        """
+        if self._scheduler is not None and self._export_queue is not None:
+            self._scheduler.spawn(self._consume_export_queue(), name=f"{self.get_name()}-export-queue")
+
+    async def _consume_export_queue(self) -> None:
+        """
+        Export the batches of the export queue one by one until the scheduler stops.
+        """
+        export_queue = self._export_queue
+        if export_queue is None:
+            return
+        while True:
+            batch = await export_queue.get()
+            try:
+                await self.export_batch(batch=batch)
+            except Exception:
+                logger.exception(f"The export of a queued batch failed in the {self.get_name()} exporter.")
+            finally:
+                await export_queue.task_done()
+
+    def reset_metric_report(self) -> None:
+        """
+        Reset the report with an empty store bounded by the configured cardinality.
+        """
+        self.metric_report = MetricReportStore(
+            max_series=self.metric_report_max_series,
+            idle_timeout_in_seconds=self.metric_report_idle_timeout_in_seconds,
+        )
 
     async def add_metric_to_report(self, metric: "Metric", value: float) -> "MetricReport":
         """
-        Add the generated metric to the report asynchronously.
+        Add the generated metric to the report of its series.
 
         :param metric: the metric to add
         :param value: the metric value to add
         :return:
         """
-
-        def add_metric_to_report() -> MetricReport:
-            if metric.name not in self.metric_report:
-                self.metric_report[metric.name] = MetricReport(exporter_name=self.get_name(), metric=metric)
-            metric_report = self.metric_report[metric.name]
-            now = datetime.now()
-            if metric_report.last_report_time:
-                time_difference_in_s = (now - metric_report.last_report_time).total_seconds()
-                metric_report.average_interval_in_seconds = (
-                    time_difference_in_s
-                    if not metric_report.average_interval_in_seconds
-                    else (metric_report.average_interval_in_seconds + time_difference_in_s) / 2
-                )
-
-            metric_report.last_report_time = now
-            metric_report.total += value
-            metric_report.call_count += 1
-            metric_report.average = metric_report.total / metric_report.call_count
-            if value < metric_report.minimum:
-                metric_report.minimum = value
-            if value > metric_report.maximum:
-                metric_report.maximum = value
-            return metric_report
-
-        return await asyncify(add_metric_to_report)()
+        metric_report = self.metric_report.get_or_create(
+            series_key=metric.series_key, exporter_name=self.get_name(), metric=metric
+        )
+        metric_report.add(value=value)
+        return metric_report
 
     @classmethod
     @abstractmethod
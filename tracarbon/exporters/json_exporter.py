@@ -2,24 +2,30 @@ import asyncio
 import atexit
 import os
 from datetime import datetime
-from datetime import timezone
+from threading import Lock
 from typing import Any
+from typing import Dict
+from typing import List
 
-import aiofiles
-import aiofiles.os
 import orjson
+from pydantic import PrivateAttr
 
 from tracarbon.exporters.exporter import Exporter
+from tracarbon.exporters.exporter import MetricBatch
 from tracarbon.exporters.exporter import MetricGenerator
+from tracarbon.exporters.exporter import MetricType
 
 
 class JSONExporter(Exporter):
     """
     Write the metrics to a local JSON file.
+
+    The counter metrics are written with their cumulative total and a `metric_type` of `counter`.
     """
 
     path: str = ""
     indent: int = 4
+    _write_lock: Lock = PrivateAttr(default_factory=Lock)
 
     def __init__(self, **data: Any) -> None:
         # Register flush at exit
@@ -85,40 +91,69 @@ class JSONExporter(Exporter):
 
             logger.debug(f"JSONExporter: flush failed for {self.path}: {exc}")
 
+    def _append(self, payloads: List[bytes]) -> None:
+        """
+        Append the serialized metrics to the JSON array file.
+        The writes are serialized because the metric generators are launched concurrently.
+
+        :param payloads: the serialized metrics to append
+        """
+        with self._write_lock:
+            self._strip_trailing_closing_bracket()
+            try:
+                prior_byte_length = os.stat(self.path).st_size
+            except FileNotFoundError:
+                prior_byte_length = 0
+            separator = f",{os.linesep}".encode()
+            with open(self.path, "ab") as file:
+                file.write(separator if prior_byte_length > 0 else f"[{os.linesep}".encode())
+                file.write(separator.join(payloads))
+
     async def launch(self, metric_generator: MetricGenerator) -> None:
         """
         Append each metric value as a JSON object inside a growing JSON array file.
 
         :param metric_generator: produces metrics to serialize
         """
-        await asyncio.to_thread(self._strip_trailing_closing_bracket)
-        async for metric in metric_generator.generate():
-            metric_value = await metric.value()
+        await self.launch_batch(batch=await metric_generator.generate_batch())
+
+    async def launch_batch(self, batch: MetricBatch) -> None:
+        """
+        Append a batch of metrics as JSON objects inside a growing JSON array file, with one write per batch.
+        The aggregate of each series is written with the aggregated batches.
+
+        :param batch: the batch of metrics
+        """
+        indent_opt = orjson.OPT_INDENT_2 if self.indent >= 2 else 0
+        timestamp = str(batch.timestamp)
+        aggregates = batch.aggregates
+        payloads = []
+        for index, (metric, metric_value) in enumerate(batch):
             if metric_value is None:
                 continue
             await self.add_metric_to_report(metric=metric, value=metric_value)
-            try:
-                path_stat = await aiofiles.os.stat(self.path)
-            except FileNotFoundError:
-                prior_byte_length = 0
-            else:
-                prior_byte_length = path_stat.st_size
-            async with aiofiles.open(self.path, "a+") as file:
-                if prior_byte_length > 0:
-                    await file.write(f",{os.linesep}")
-                else:
-                    await file.write(f"[{os.linesep}")
-                indent_opt = orjson.OPT_INDENT_2 if self.indent >= 2 else 0
-                payload = orjson.dumps(
-                    {
-                        "timestamp": str(datetime.now(timezone.utc)),
-                        "metric_name": metric.format_name(metric_prefix_name=self.metric_prefix_name),
-                        "metric_value": metric_value,
-                        "metric_tags": metric.format_tags(),
-                    },
-                    option=indent_opt,
-                )
-                await file.write(payload.decode("utf-8"))
+            record: Dict[str, Any] = {
+                "timestamp": timestamp,
+                "metric_name": metric.format_name(metric_prefix_name=self.metric_prefix_name),
+                "metric_value": metric_value,
+                "metric_tags": metric.format_tags(),
+            }
+            if metric.metric_type == MetricType.COUNTER:
+                record["metric_type"] = metric.metric_type.value
+            if aggregates is not None:
+                aggregate = aggregates[index]
+                record["metric_aggregate"] = {
+                    "count": aggregate.count,
+                    "sum": aggregate.total,
+                    "mean": aggregate.mean,
+                    "minimum": aggregate.minimum,
+                    "maximum": aggregate.maximum,
+                    "last": aggregate.last,
+                    "integral": aggregate.integral,
+                }
+            payloads.append(orjson.dumps(record, option=indent_opt))
+        if payloads:
+            await asyncio.to_thread(self._append, payloads)
 
     @classmethod
     def get_name(cls) -> str:
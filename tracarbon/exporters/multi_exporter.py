@@ -0,0 +1,157 @@
+from typing import List
+from typing import Tuple
+
+import anyio
+from loguru import logger
+from pydantic import PrivateAttr
+
+from tracarbon.exporters.exporter import Exporter
+from tracarbon.exporters.exporter import ExportQueue
+from tracarbon.exporters.exporter import MetricBatch
+from tracarbon.exporters.exporter import MetricGenerator
+from tracarbon.exporters.exporter import OverflowPolicy
+from tracarbon.scheduler import MissedTickPolicy
+
+__all__ = [
+    "MultiExporter",
+]
+
+
+class MultiExporter(Exporter):
+    """
+    Fan one sampling pass out to several exporters.
+
+    Each metric generator is sampled once per tick in a batch and the batch is put in the bounded queue of every
+    exporter, each queue being exported by its own consumer task, so a slow exporter cannot stall the ticks nor
+    the others. The exporters are driven by this exporter: they are not started and their own metric generators
+    are not used.
+    """
+
+    exporters: List[Exporter]
+    exporter_timeout_in_seconds: float | None = 30.0
+    exporter_queue_size: int = 16
+
+    _exporter_queues: List[Tuple[Exporter, ExportQueue]] = PrivateAttr(default_factory=list)
+
+    def start(
+        self,
+        interval_in_seconds: float,
+        missed_tick_policy: MissedTickPolicy = MissedTickPolicy.SKIP,
+        export_interval_in_seconds: float | None = None,
+    ) -> None:
+        """
+        Start the exporter, reset the reports of the exporters and create their export queues.
+
+        :param: interval_in_seconds: the interval between two ticks
+        :param: missed_tick_policy: the policy to apply when ticks are missed
+        :param: export_interval_in_seconds: the interval between two exports, the interval by default
+        """
+        for exporter in self.exporters:
+            exporter.stopped = False
+            exporter.reset_metric_report()
+        self._exporter_queues = [
+            (exporter, ExportQueue(maximum_size=self.exporter_queue_size, overflow_policy=self.export_overflow_policy))
+            for exporter in self.exporters
+        ]
+        super().start(
+            interval_in_seconds=interval_in_seconds,
+            missed_tick_policy=missed_tick_policy,
+            export_interval_in_seconds=export_interval_in_seconds,
+        )
+
+    def stop(self) -> None:
+        """
+        Stop the exporter and the exporters, once their queued batches are exported.
+        """
+        super().stop()
+        for exporter in self.exporters:
+            exporter.stop()
+        self._exporter_queues = []
+
+    def _spawn_export_queue_consumers(self) -> None:
+        """
+        Spawn the consumer tasks of the export queue, if any, and of the queues of the exporters on the scheduler.
+        """
+        super()._spawn_export_queue_consumers()
+        if self._scheduler is None:
+            return
+        for exporter, export_queue in self._exporter_queues:
+            self._scheduler.spawn(
+                self._consume_exporter_queue(exporter=exporter, export_queue=export_queue),
+                name=f"{self.get_name()}-{exporter.get_name()}-export-queue",
+            )
+
+    def _drain_export_queues(self) -> None:
+        """
+        Wait for the batches queued for this exporter and then for the exporters to be exported,
+        each bounded by the drain timeout.
+        """
+        super()._drain_export_queues()
+        for exporter, export_queue in self._exporter_queues:
+            self._drain_export_queue(export_queue=export_queue, exporter_name=exporter.get_name())
+
+    async def launch(self, metric_generator: MetricGenerator) -> None:
+        """
+        Sample the metric generator once and dispatch the metrics to all the exporters.
+
+        :param metric_generator: the metric generator
+        """
+        await self.launch_batch(batch=await metric_generator.generate_batch())
+
+    async def launch_batch(self, batch: MetricBatch) -> None:
+        """
+        Report a batch of metrics and put it in the queues of all the exporters without waiting for their export.
+        The batch is copied per queue when coalescing, since a queued batch is modified by the coalescing.
+        Before the start, the batch is dispatched to all the exporters concurrently.
+
+        :param batch: the batch of metrics
+        """
+        for metric, metric_value in batch:
+            if metric_value is not None:
+                await self.add_metric_to_report(metric=metric, value=metric_value)
+        if self._exporter_queues:
+            coalesced = self.export_overflow_policy == OverflowPolicy.COALESCE
+            for _, export_queue in self._exporter_queues:
+                await export_queue.put(batch.copy() if coalesced else batch)
+            return
+        async with anyio.create_task_group() as task_group:
+            for exporter in self.exporters:
+                task_group.start_soon(self._dispatch_to_exporter, exporter, batch)
+
+    async def _dispatch_to_exporter(self, exporter: Exporter, batch: MetricBatch) -> None:
+        """
+        Dispatch a batch of metrics to one exporter, isolating its errors and bounding its duration.
+
+        :param exporter: the exporter
+        :param batch: the batch of metrics
+        """
+        try:
+            with anyio.fail_after(self.exporter_timeout_in_seconds):
+                await exporter.export_batch(batch=batch)
+        except TimeoutError:
+            logger.warning(f"Exporter[{exporter.get_name()}] timed out after {self.exporter_timeout_in_seconds}s.")
+        except Exception:
+            logger.exception(f"Exporter[{exporter.get_name()}] failed.")
+
+    async def _consume_exporter_queue(self, exporter: Exporter, export_queue: ExportQueue) -> None:
+        """
+        Dispatch the batches of the queue of one exporter one by one until the scheduler stops.
+
+        :param exporter: the exporter
+        :param export_queue: the export queue of the exporter
+        """
+        while True:
+            batch = await export_queue.get()
+            try:
+                await self._dispatch_to_exporter(exporter, batch)
+            finally:
+                await export_queue.task_done()
+
+    @classmethod
+    def get_name(cls) -> str:
+        """
+        Get the name of the exporter.
+
+        :return: the Exporter's name
+        """
+        return "Multi"
@@ -1,26 +1,44 @@
 import os
+from collections import OrderedDict
 from contextlib import suppress
 from typing import Any
 from typing import Dict
+from typing import Tuple
 
 from loguru import logger
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from tracarbon.conf import PROMETHEUS_INSTALLED
 from tracarbon.exporters.exporter import Exporter
+from tracarbon.exporters.exporter import Metric
+from tracarbon.exporters.exporter import MetricBatch
 from tracarbon.exporters.exporter import MetricGenerator
+from tracarbon.exporters.exporter import MetricType
+from tracarbon.exporters.statistics import REPORTED_QUANTILES
 
 if PROMETHEUS_INSTALLED:
     import prometheus_client
+    from prometheus_client import Counter
     from prometheus_client import Gauge
     from prometheus_client import start_http_server
 
     class PrometheusExporter(Exporter):
         """
         Send the metrics to Prometheus by running an HTTP server for the metrics exposure.
+
+        The quantiles of each metric over the run are exposed in a `<metric>_quantile` gauge with a `quantile` label.
+        The counter metrics are exposed as Prometheus counters, increased by the growth of their cumulative total.
+        The labelled series evicted from the report are removed from the collectors, so they are no longer exposed.
         """
 
-        prometheus_metrics: Dict[str, Gauge] = Field(default_factory=dict)
+        prometheus_metrics: Dict[str, Gauge | Counter] = Field(default_factory=dict)
+        _prometheus_children: OrderedDict[str, Tuple[Any, Tuple[Tuple[float, Any], ...]]] = PrivateAttr(
+            default_factory=OrderedDict
+        )
+        _prometheus_labels: Dict[str, Tuple[Tuple[Any, Tuple[str, ...]], ...]] = PrivateAttr(default_factory=dict)
+        _counter_totals: Dict[str, float] = PrivateAttr(default_factory=dict)
+        _evicted_series_count: int = PrivateAttr(default=0)
         address: str | None = None
         port: int | None = None
 
@@ -41,22 +59,134 @@ if PROMETHEUS_INSTALLED:
 
             :param metric_generator: the metric generator
             """
-            async for metric in metric_generator.generate():
-                metric_name = metric.format_name(metric_prefix_name=self.metric_prefix_name, separator="_")
-                if metric_name not in self.prometheus_metrics:
-                    self.prometheus_metrics[metric_name] = Gauge(
-                        metric_name,
-                        f"Tracarbon metric {metric_name}",
-                        [tag.key for tag in metric.tags],
-                    )
-                metric_value = await metric.value()
+            await self.launch_batch(batch=await metric_generator.generate_batch())
+
+        async def launch_batch(self, batch: MetricBatch) -> None:
+            """
+            Set the gauges of a batch of metrics.
+
+            :param batch: the batch of metrics
+            """
+            for metric, metric_value in batch:
+                children = self._prometheus_children.get(metric.series_key)
+                if children is None:
+                    children = self._create_prometheus_children(metric=metric)
+                else:
+                    self._prometheus_children.move_to_end(metric.series_key)
                 if metric_value is not None:
-                    await self.add_metric_to_report(metric=metric, value=metric_value)
+                    metric_report = await self.add_metric_to_report(metric=metric, value=metric_value)
+                    metric_name = metric.format_name(metric_prefix_name=self.metric_prefix_name, separator="_")
                     logger.info(
                         f"Sending metric[{metric_name}] with value [{metric_value}] "
                         f"and labels{metric.format_tags()} to Prometheus."
                     )
-                    self.prometheus_metrics[metric_name].labels(*[tag.value for tag in metric.tags]).set(metric_value)
+                    child, quantile_gauges = children
+                    if metric.metric_type == MetricType.COUNTER:
+                        self._increase_counter(series_key=metric.series_key, counter=child, total=metric_value)
+                    else:
+                        child.set(metric_value)
+                    for quantile, quantile_gauge in quantile_gauges:
+                        quantile_value = metric_report.quantile(quantile=quantile)
+                        if quantile_value is not None:
+                            quantile_gauge.set(quantile_value)
+            if self.metric_report.evicted_series_count != self._evicted_series_count:
+                self._evicted_series_count = self.metric_report.evicted_series_count
+                for series_key in [key for key in self._prometheus_children if key not in self.metric_report]:
+                    self._evict_prometheus_series(series_key=series_key)
+
+        def _increase_counter(self, series_key: str, counter: Any, total: float) -> None:
+            """
+            Increase a counter by the growth of its cumulative total, the total restarting from zero on a reset.
+
+            :param series_key: the series key of the counter
+            :param counter: the labelled counter of the series
+            :param total: the cumulative total
+            """
+            previous_total = self._counter_totals.get(series_key, 0.0)
+            increase = total - previous_total if total >= previous_total else total
+            if increase > 0:
+                counter.inc(increase)
+            self._counter_totals[series_key] = total
+
+        def _create_prometheus_children(self, metric: Metric) -> Tuple[Any, Tuple[Tuple[float, Any], ...]]:
+            """
+            Create the gauges, or the counter, of the metric and cache their labelled children for its series.
+
+            :param metric: the metric
+            :return: the labelled gauge or counter and the quantile gauges of the series
+            """
+            metric_name = metric.format_name(metric_prefix_name=self.metric_prefix_name, separator="_")
+            label_values = metric.tag_values
+            if metric.metric_type == MetricType.COUNTER:
+                if metric_name not in self.prometheus_metrics:
+                    self.prometheus_metrics[metric_name] = Counter(
+                        metric_name,
+                        f"Tracarbon metric {metric_name}",
+                        [tag.key for tag in metric.tags],
+                    )
+                return self._cache_prometheus_children(
+                    series_key=metric.series_key,
+                    children=(self.prometheus_metrics[metric_name].labels(*label_values), ()),
+                    labels=((self.prometheus_metrics[metric_name], label_values),),
+                )
+            quantile_metric_name = f"{metric_name}_quantile"
+            if metric_name not in self.prometheus_metrics:
+                self.prometheus_metrics[metric_name] = Gauge(
+                    metric_name,
+                    f"Tracarbon metric {metric_name}",
+                    [tag.key for tag in metric.tags],
+                )
+                self.prometheus_metrics[quantile_metric_name] = Gauge(
+                    quantile_metric_name,
+                    f"Tracarbon metric {metric_name} quantiles",
+                    [tag.key for tag in metric.tags] + ["quantile"],
+                )
+            children = (
+                self.prometheus_metrics[metric_name].labels(*label_values),
+                tuple(
+                    (quantile, self.prometheus_metrics[quantile_metric_name].labels(*label_values, str(quantile)))
+                    for quantile in REPORTED_QUANTILES
+                ),
+            )
+            labels = ((self.prometheus_metrics[metric_name], label_values),) + tuple(
+                (self.prometheus_metrics[quantile_metric_name], (*label_values, str(quantile)))
+                for quantile in REPORTED_QUANTILES
+            )
+            return self._cache_prometheus_children(series_key=metric.series_key, children=children, labels=labels)
+
+        def _cache_prometheus_children(
+            self,
+            series_key: str,
+            children: Tuple[Any, Tuple[Tuple[float, Any], ...]],
+            labels: Tuple[Tuple[Any, Tuple[str, ...]], ...],
+        ) -> Tuple[Any, Tuple[Tuple[float, Any], ...]]:
+            """
+            Cache the labelled children of a series, evicting the least recently updated series beyond the maximum
+            of the report, like the report store.
+
+            :param series_key: the series key
+            :param children: the labelled children of the series
+            :param labels: the parent metric and the label values of each labelled child of the series
+            :return: the labelled children of the series
+            """
+            if self.metric_report_max_series is not None:
+                while len(self._prometheus_children) >= self.metric_report_max_series:
+                    self._evict_prometheus_series(series_key=next(iter(self._prometheus_children)))
+            self._prometheus_children[series_key] = children
+            self._prometheus_labels[series_key] = labels
+            return children
+
+        def _evict_prometheus_series(self, series_key: str) -> None:
+            """
+            Evict a series from the cache and remove its labelled children from their parent metrics.
+
+            :param series_key: the series key
+            """
+            self._prometheus_children.pop(series_key, None)
+            self._counter_totals.pop(series_key, None)
+            for parent, label_values in self._prometheus_labels.pop(series_key, ()):
+                with suppress(KeyError):
+                    parent.remove(*label_values)
 
         @classmethod
         def get_name(cls) -> str:
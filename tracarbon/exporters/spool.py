@@ -0,0 +1,199 @@
+import asyncio
+import os
+import time
+from threading import Lock
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import List
+
+import msgpack
+from loguru import logger
+from pydantic import BaseModel
+from pydantic import PrivateAttr
+
+__all__ = [
+    "MetricSpool",
+]
+
+
+class MetricSpool(BaseModel):
+    """
+    Write-ahead spool of the records an exporter failed to deliver, replayed once the target recovers.
+
+    The records are appended with msgpack to segment files of a directory. The current segment is rolled when it
+    reaches the segment size and the oldest segments are deleted when the spool exceeds its maximum size.
+    The segments are kept on disk, so the records spooled by a previous run are replayed too.
+    A segment is deleted once all its records are delivered: a replay interrupted by a failure delivers at least once.
+    The pending segments are counted on append and drain, so checking if the spool is empty does not list the directory.
+    """
+
+    path: str
+    segment_size_in_bytes: int = 1024 * 1024
+    max_size_in_bytes: int = 64 * 1024 * 1024
+    replay_batch_size: int = 1000
+    spooled_record_count: int = 0
+    replayed_record_count: int = 0
+    dropped_segment_count: int = 0
+    dropped_size_in_bytes: int = 0
+    replay_duration_in_seconds: float = 0.0
+    _lock: Lock = PrivateAttr(default_factory=Lock)
+    _sequence: int = PrivateAttr(default=0)
+    _pending_segment_count: int = PrivateAttr(default=0)
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        os.makedirs(self.path, exist_ok=True)
+        segments = self.segments()
+        self._sequence = self._segment_sequence(segments[-1]) + 1 if segments else 0
+        self._pending_segment_count = len(segments)
+
+    @staticmethod
+    def _segment_sequence(segment: str) -> int:
+        return int(os.path.splitext(os.path.basename(segment))[0])
+
+    def _segment_path(self, sequence: int) -> str:
+        return os.path.join(self.path, f"{sequence:012d}.spool")
+
+    def segments(self) -> List[str]:
+        """
+        Get the segments of the spool, from the oldest to the newest.
+
+        :return: the paths of the segments
+        """
+        return sorted(
+            os.path.join(self.path, name)
+            for name in os.listdir(self.path)
+            if name.endswith(".spool") and name[: -len(".spool")].isdigit()
+        )
+
+    @property
+    def size_in_bytes(self) -> int:
+        """
+        Get the disk footprint of the spool.
+
+        :return: the size of the segments in bytes
+        """
+        size = 0
+        for segment in self.segments():
+            try:
+                size += os.path.getsize(segment)
+            except FileNotFoundError:
+                continue
+        return size
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Check if the spool has no record to replay, from the count of the pending segments.
+
+        :return: if the spool is empty
+        """
+        return self._pending_segment_count == 0
+
+    @property
+    def replay_throughput(self) -> float | None:
+        """
+        Get the throughput of the replays.
+
+        :return: the replayed records per second or None before the first replay
+        """
+        if self.replay_duration_in_seconds <= 0:
+            return None
+        return self.replayed_record_count / self.replay_duration_in_seconds
+
+    def append(self, records: List[Any]) -> None:
+        """
+        Append records to the current segment, rolling it and applying the retention if needed.
+
+        :param records: the records to spool, serializable with msgpack
+        """
+        payload = b"".join(msgpack.packb(record) for record in records)
+        with self._lock:
+            segment = self._segment_path(self._sequence)
+            with open(segment, "ab") as file:
+                if file.tell() == 0:
+                    self._pending_segment_count += 1
+                file.write(payload)
+                size = file.tell()
+            self.spooled_record_count += len(records)
+            if size >= self.segment_size_in_bytes:
+                self._sequence += 1
+            self._apply_retention()
+
+    def _apply_retention(self) -> None:
+        """
+        Delete the oldest segments while the spool exceeds its maximum size, keeping the current segment.
+        """
+        segments = self.segments()
+        sizes = [os.path.getsize(segment) for segment in segments]
+        total = sum(sizes)
+        for segment, size in zip(segments[:-1], sizes[:-1], strict=True):
+            if total <= self.max_size_in_bytes:
+                break
+            os.remove(segment)
+            self._pending_segment_count -= 1
+            total -= size
+            self.dropped_segment_count += 1
+            self.dropped_size_in_bytes += size
+            logger.warning(f"Spool[{self.path}] dropped the segment {segment} of {size} bytes to stay bounded.")
+
+    def _roll(self) -> List[str]:
+        """
+        Close the current segment so the existing segments can be replayed while the new records are appended.
+
+        :return: the segments to replay
+        """
+        with self._lock:
+            segments = self.segments()
+            if segments and self._segment_sequence(segments[-1]) >= self._sequence:
+                self._sequence = self._segment_sequence(segments[-1]) + 1
+            return segments
+
+    @staticmethod
+    def read(segment: str) -> List[Any]:
+        """
+        Read the records of a segment, ignoring a record truncated by a crash.
+
+        :param segment: the path of the segment
+        :return: the records
+        """
+        with open(segment, "rb") as file:
+            unpacker = msgpack.Unpacker(file, raw=False, strict_map_key=False)
+            return list(unpacker)
+
+    async def replay(self, send: Callable[[List[Any]], Awaitable[None]]) -> bool:
+        """
+        Replay the spooled records in batches, from the oldest to the newest, until a batch fails.
+
+        :param send: the coroutine function delivering a batch of records, raising if the delivery fails
+        :return: if all the spooled records are delivered
+        """
+        for segment in await asyncio.to_thread(self._roll):
+            try:
+                records = await asyncio.to_thread(self.read, segment)
+            except FileNotFoundError:
+                continue
+            for start in range(0, len(records), self.replay_batch_size):
+                chunk = records[start : start + self.replay_batch_size]
+                replay_start = time.perf_counter()
+                try:
+                    await send(chunk)
+                except Exception as exception:
+                    logger.warning(f"Spool[{self.path}] replay interrupted: {exception}")
+                    return False
+                self.replay_duration_in_seconds += time.perf_counter() - replay_start
+                self.replayed_record_count += len(chunk)
+            try:
+                await asyncio.to_thread(os.remove, segment)
+            except FileNotFoundError:
+                pass
+        await asyncio.to_thread(self._count_pending_segments)
+        return True
+
+    def _count_pending_segments(self) -> None:
+        """
+        Count the segments left after a replay, the records appended during the replay being still pending.
+        """
+        with self._lock:
+            self._pending_segment_count = len(self.segments())
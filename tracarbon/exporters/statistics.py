@@ -0,0 +1,367 @@
+import math
+import sys
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+__all__ = [
+    "REPORTED_QUANTILES",
+    "RunningStatistics",
+    "SeriesAggregate",
+    "QuantileSketch",
+]
+
+REPORTED_QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.95, 0.99)
+
+
+class RunningStatistics:
+    """
+    Streaming statistics of a metric series, updated in place in constant time and memory.
+
+    The mean and variance are computed with the Welford algorithm. As the metrics are mostly rates (power),
+    the time-weighted mean weights each value by the interval it closes: a value sampled at t covers (t_previous, t].
+    """
+
+    __slots__ = (
+        "count",
+        "total",
+        "mean",
+        "m2",
+        "minimum",
+        "maximum",
+        "last_value",
+        "first_time",
+        "last_time",
+        "integral",
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = sys.float_info.max
+        self.maximum = 0.0
+        self.last_value: float | None = None
+        self.first_time: float | None = None
+        self.last_time: float | None = None
+        self.integral = 0.0
+
+    def add(self, value: float, now: float) -> None:
+        """
+        Add a value to the statistics.
+
+        :param value: the value to add
+        :param now: the monotonic time of the value in seconds
+        """
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        if self.last_time is None:
+            self.first_time = now
+        else:
+            self.integral += value * (now - self.last_time)
+        self.last_time = now
+        self.last_value = value
+
+    @property
+    def duration_in_seconds(self) -> float:
+        """
+        Get the duration covered by the values.
+
+        :return: the duration between the first and the last value in seconds
+        """
+        if self.first_time is None or self.last_time is None:
+            return 0.0
+        return self.last_time - self.first_time
+
+    @property
+    def variance(self) -> float | None:
+        """
+        Get the sample variance of the values.
+
+        :return: the variance or None with less than two values
+        """
+        if self.count < 2:
+            return None
+        return self.m2 / (self.count - 1)
+
+    @property
+    def standard_deviation(self) -> float | None:
+        """
+        Get the sample standard deviation of the values.
+
+        :return: the standard deviation or None with less than two values
+        """
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    @property
+    def time_weighted_mean(self) -> float | None:
+        """
+        Get the mean of the values weighted by their interval.
+
+        :return: the time-weighted mean, the mean if the values cover no duration or None without values
+        """
+        if self.count == 0:
+            return None
+        duration = self.duration_in_seconds
+        if duration <= 0:
+            return self.mean
+        return self.integral / duration
+
+    @property
+    def average_interval_in_seconds(self) -> float | None:
+        """
+        Get the mean interval between two values.
+
+        :return: the mean interval in seconds or None with less than two values
+        """
+        if self.count < 2:
+            return None
+        return self.duration_in_seconds / (self.count - 1)
+
+
+class SeriesAggregate:
+    """
+    Aggregate of the values of a metric series over an export window.
+
+    Each value covers the interval since the previous value, or since the start of the window for the first one,
+    so the integral of a power in watts is the energy in joules over the window.
+    """
+
+    __slots__ = ("count", "total", "minimum", "maximum", "last", "integral", "start_time", "last_time")
+
+    def __init__(self, start_time: float) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.last = math.nan
+        self.integral = 0.0
+        self.start_time = start_time
+        self.last_time = start_time
+
+    def add(self, value: float, now: float) -> None:
+        """
+        Add a value to the aggregate.
+
+        :param value: the value to add
+        :param now: the monotonic time of the value in seconds
+        """
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        self.last = value
+        self.integral += value * (now - self.last_time)
+        self.last_time = now
+
+    @property
+    def mean(self) -> float:
+        """
+        Get the mean of the values.
+
+        :return: the mean or NaN without values
+        """
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def time_weighted_mean(self) -> float:
+        """
+        Get the mean of the values weighted by the interval they cover.
+
+        :return: the time-weighted mean, the mean if the values cover no duration or NaN without values
+        """
+        duration = self.last_time - self.start_time
+        if duration <= 0:
+            return self.mean
+        return self.integral / duration
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with a bounded memory (DDSketch).
+
+    The values are counted in logarithmic buckets, so any quantile is estimated within a relative accuracy
+    without keeping the raw values. Two sketches with the same relative accuracy are merged by adding their buckets,
+    so the sketches of several exporters or processes can be combined. When the number of buckets exceeds the maximum,
+    the lowest buckets are collapsed together and only the accuracy of the lowest quantiles is lost.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_bucket_count",
+        "count",
+        "zero_count",
+        "minimum",
+        "maximum",
+        "positive_buckets",
+        "negative_buckets",
+        "_gamma",
+        "_log_gamma",
+    )
+
+    MIN_INDEXABLE_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bucket_count: int = 2048) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"The relative accuracy must be between 0 and 1, got {relative_accuracy}.")
+        if max_bucket_count < 1:
+            raise ValueError(f"The maximum number of buckets must be positive, got {max_bucket_count}.")
+        self.relative_accuracy = relative_accuracy
+        self.max_bucket_count = max_bucket_count
+        self.count = 0
+        self.zero_count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.positive_buckets: Dict[int, int] = {}
+        self.negative_buckets: Dict[int, int] = {}
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def _collapse(self, buckets: Dict[int, int], negative: bool = False) -> None:
+        """
+        Collapse the buckets of the lowest values until the number of buckets is bounded.
+
+        :param buckets: the buckets to collapse
+        :param negative: if the buckets count negative values, whose lowest values have the highest indexes
+        """
+        if len(buckets) <= self.max_bucket_count:
+            return
+        indexes = sorted(buckets, reverse=negative)
+        excess = len(indexes) - self.max_bucket_count
+        target = indexes[excess]
+        buckets[target] += sum(buckets.pop(index) for index in indexes[:excess])
+
+    def add(self, value: float) -> None:
+        """
+        Add a value to the sketch.
+
+        :param value: the value to add
+        """
+        self.count += 1
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        if value > self.MIN_INDEXABLE_VALUE:
+            index = self._index(value)
+            self.positive_buckets[index] = self.positive_buckets.get(index, 0) + 1
+            self._collapse(self.positive_buckets)
+        elif value < -self.MIN_INDEXABLE_VALUE:
+            index = self._index(-value)
+            self.negative_buckets[index] = self.negative_buckets.get(index, 0) + 1
+            self._collapse(self.negative_buckets, negative=True)
+        else:
+            self.zero_count += 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Merge another sketch into this sketch.
+
+        :param other: the sketch to merge, with the same relative accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f"Cannot merge sketches with different relative accuracies: "
+                f"{self.relative_accuracy} and {other.relative_accuracy}."
+            )
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.zero_count += other.zero_count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        for buckets, other_buckets, negative in (
+            (self.positive_buckets, other.positive_buckets, False),
+            (self.negative_buckets, other.negative_buckets, True),
+        ):
+            for index, count in other_buckets.items():
+                buckets[index] = buckets.get(index, 0) + count
+            self._collapse(buckets, negative=negative)
+
+    def quantile(self, quantile: float) -> float | None:
+        """
+        Estimate a quantile of the values.
+
+        :param quantile: the quantile to estimate, between 0 and 1
+        :return: the estimated quantile or None without values
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError(f"The quantile must be between 0 and 1, got {quantile}.")
+        if self.count == 0:
+            return None
+        if quantile == 0:
+            return self.minimum
+        if quantile == 1:
+            return self.maximum
+        rank = quantile * (self.count - 1)
+        seen = 0
+        estimate = None
+        for index in sorted(self.negative_buckets, reverse=True):
+            seen += self.negative_buckets[index]
+            if seen > rank:
+                estimate = -self._value(index)
+                break
+        if estimate is None:
+            seen += self.zero_count
+            if seen > rank:
+                estimate = 0.0
+        if estimate is None:
+            for index in sorted(self.positive_buckets):
+                seen += self.positive_buckets[index]
+                if seen > rank:
+                    estimate = self._value(index)
+                    break
+        if estimate is None:
+            return self.maximum
+        return min(max(estimate, self.minimum), self.maximum)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the sketch, to merge it in another process.
+
+        :return: the serialized sketch
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bucket_count": self.max_bucket_count,
+            "count": self.count,
+            "zero_count": self.zero_count,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "positive_buckets": list(self.positive_buckets.items()),
+            "negative_buckets": list(self.negative_buckets.items()),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """
+        Deserialize a sketch.
+
+        :param data: the serialized sketch
+        :return: the sketch
+        """
+        sketch = cls(relative_accuracy=data["relative_accuracy"], max_bucket_count=data["max_bucket_count"])
+        sketch.count = data["count"]
+        sketch.zero_count = data["zero_count"]
+        sketch.minimum = data["minimum"]
+        sketch.maximum = data["maximum"]
+        sketch.positive_buckets = {int(index): count for index, count in data["positive_buckets"]}
+        sketch.negative_buckets = {int(index): count for index, count in data["negative_buckets"]}
+        return sketch
@@ -1,6 +1,7 @@
 from loguru import logger
 
 from tracarbon.exporters.exporter import Exporter
+from tracarbon.exporters.exporter import MetricBatch
 from tracarbon.exporters.exporter import MetricGenerator
 
 
@@ -15,24 +16,24 @@ class StdoutExporter(Exporter):
 
         :param metric_generator: the metric generator
         """
-        try:
-            async for metric in metric_generator.generate():
-                try:
-                    metric_value = await metric.value()
-                    logger.debug(f"Generated metric '{metric.name}' with value: {metric_value}")
-
-                    if metric_value is not None:
-                        await self.add_metric_to_report(metric=metric, value=metric_value)
-                        logger.info(
-                            f"Metric name[{metric.format_name(metric_prefix_name=self.metric_prefix_name)}], "
-                            f"value[{metric_value}], tags{metric.format_tags()}"
-                        )
-                    else:
-                        logger.debug(f"Skipping metric '{metric.name}' with None value")
-                except Exception as e:
-                    logger.error(f"Error processing metric '{metric.name}': {e}")
-        except Exception as e:
-            logger.error(f"Error in StdoutExporter.launch: {e}")
+        await self.launch_batch(batch=await metric_generator.generate_batch())
+
+    async def launch_batch(self, batch: MetricBatch) -> None:
+        """
+        Print a batch of metrics.
+
+        :param batch: the batch of metrics
+        """
+        for metric, metric_value in batch:
+            logger.debug(f"Generated metric '{metric.name}' with value: {metric_value}")
+            if metric_value is None:
+                logger.debug(f"Skipping metric '{metric.name}' with None value")
+                continue
+            await self.add_metric_to_report(metric=metric, value=metric_value)
+            logger.info(
+                f"Metric name[{metric.format_name(metric_prefix_name=self.metric_prefix_name)}], "
+                f"value[{metric_value}], tags{metric.format_tags()}"
+            )
 
     @classmethod
     def get_name(cls) -> str:
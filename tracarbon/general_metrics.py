@@ -1,25 +1,62 @@
+import asyncio
+import time
 from typing import Any
 from typing import AsyncGenerator
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+
+import psutil
+from pydantic import PrivateAttr
 
 from tracarbon.conf import KUBERNETES_INSTALLED
 from tracarbon.emissions import CarbonEmission
 from tracarbon.emissions import CarbonUsageUnit
+from tracarbon.exporters import Exporter
 from tracarbon.exporters import Metric
+from tracarbon.exporters import MetricBatch
 from tracarbon.exporters import MetricGenerator
-from tracarbon.exporters import Tag
+from tracarbon.exporters.exporter import SeriesTags
 from tracarbon.hardwares import EnergyConsumption
 from tracarbon.hardwares import EnergyUsageUnit
 from tracarbon.hardwares import UsageType
 from tracarbon.locations import Country
 from tracarbon.locations import Location
+from tracarbon.telemetry import TELEMETRY
+
+ENERGY_CONSUMPTION_METRIC_NAMES = {usage_type: f"energy_consumption_{usage_type.value}" for usage_type in UsageType}
+CARBON_EMISSION_METRIC_NAMES = {usage_type: f"carbon_emission_{usage_type.value}" for usage_type in UsageType}
+ENERGY_CONSUMPTION_COUNTER_NAMES = {
+    usage_type: f"energy_consumption_{usage_type.value}_joules_total" for usage_type in UsageType
+}
+CARBON_EMISSION_COUNTER_NAMES = {
+    usage_type: f"carbon_emission_{usage_type.value}_co2g_total" for usage_type in UsageType
+}
+ENERGY_CONSUMPTION_BREAKDOWN_METRIC_NAME = "energy_consumption_domain"
+GPU_DEVICE_METRIC_NAMES = {
+    "power": ("energy_consumption_gpu_device", "watts"),
+    "utilization": ("gpu_device_utilization", "percent"),
+    "memory_used": ("gpu_device_memory_used", "mebibytes"),
+}
 
 
 class EnergyConsumptionGenerator(MetricGenerator):
     """
     Energy consumption generator for energy consumption.
+
+    The power is generated in gauges and the energy consumed since the start in `*_joules_total` counters:
+    the energy total accumulated by the sensor from its energy counters, whichever consumer read them,
+    or else the power times the duration it was measured over by the sensor or the duration since the previous tick.
+    When the sensor breaks the power down by counter, the power of each counter is generated in a gauge tagged with
+    its domain, socket and counter.
+    When the sensor reports the usage of each GPU, its power, utilization and used memory are generated in gauges
+    tagged with its index, uuid and name, the GPU gauge staying their total power.
     """
 
     energy_consumption: EnergyConsumption
+    _last_generation_time: float | None = PrivateAttr(default=None)
+    _energy_totals: Dict[UsageType, float] = PrivateAttr(default_factory=dict)
 
     def __init__(self, location: Location | None = None, **data: Any) -> None:
         if "energy_consumption" not in data:
@@ -28,38 +65,97 @@ class EnergyConsumptionGenerator(MetricGenerator):
             location = Country.get_location()
         super().__init__(location=location, metrics=[], **data)
 
+    async def prime(self) -> None:
+        """
+        Prime the energy consumption and start the first interval of the counters.
+        """
+        await self.energy_consumption.prime()
+        self._last_generation_time = time.monotonic()
+
     async def generate(self) -> AsyncGenerator[Metric, None]:
         """
         Generate a metric for energy consumption.
 
         :return: an async generator of the metrics
         """
-        energy_usage = await self.energy_consumption.get_energy_usage()
+        for metric in (await self.generate_batch()).metrics:
+            yield metric
 
-        for usage_type in UsageType:
+    async def generate_batch(self) -> MetricBatch:
+        """
+        Generate the metrics for energy consumption in one batch.
 
-            async def energy_consumption_by_usage_type(ut=usage_type) -> float | None:
-                """
-                Get the energy usage.
-                """
-                return energy_usage.get_energy_usage_on_type(usage_type=ut)
+        :return: the batch of the metrics
+        """
+        batch = MetricBatch()
+        energy_usage = await self.energy_consumption.get_energy_usage()
 
-            if self.location is None:
-                raise ValueError("Location must be set")
-            yield Metric(
-                name=f"energy_consumption_{usage_type.value}",
-                value=energy_consumption_by_usage_type,
-                tags=[
-                    Tag(key="platform", value=self.platform),
-                    Tag(key="location", value=self.location.name),
-                    Tag(key="units", value=energy_usage.unit.value),
-                ],
+        if self.location is None:
+            raise ValueError("Location must be set")
+        tags = (
+            ("platform", self.platform),
+            ("location", self.location.name),
+            ("units", energy_usage.unit.value),
+        )
+        for usage_type in UsageType:
+            metric_value = energy_usage.get_energy_usage_on_type(usage_type=usage_type)
+            self.append_series_metric(
+                batch=batch, name=ENERGY_CONSUMPTION_METRIC_NAMES[usage_type], tags=tags, value=metric_value
             )
+        if energy_usage.breakdown is not None:
+            for name, domain, socket, watts in energy_usage.breakdown:
+                self.append_series_metric(
+                    batch=batch,
+                    name=ENERGY_CONSUMPTION_BREAKDOWN_METRIC_NAME,
+                    tags=tags[:-1] + (("domain", domain), ("socket", socket), ("counter", name), ("units", "watts")),
+                    value=watts,
+                )
+        if energy_usage.gpu_devices is not None:
+            for device in energy_usage.gpu_devices:
+                device_tags = tags[:-1] + (
+                    ("gpu_index", str(device.index)),
+                    ("gpu_uuid", device.uuid or ""),
+                    ("gpu_name", device.name or ""),
+                )
+                for field, (name, units) in GPU_DEVICE_METRIC_NAMES.items():
+                    value = getattr(device, field)
+                    if field == "power" or value is not None:
+                        self.append_series_metric(
+                            batch=batch, name=name, tags=device_tags + (("units", units),), value=value
+                        )
+
+        now = time.monotonic()
+        duration_in_seconds = energy_usage.duration_in_seconds
+        if duration_in_seconds is None and self._last_generation_time is not None:
+            duration_in_seconds = now - self._last_generation_time
+        self._last_generation_time = now
+        energy_usage.convert_unit(unit=EnergyUsageUnit.WATT)
+        counter_tags = tags[:-1] + (("units", "joules"),)
+        for usage_type in UsageType:
+            energy_total = energy_usage.get_energy_total_on_type(usage_type=usage_type)
+            if energy_total is not None:
+                increase: float | None = energy_total - self._energy_totals.get(usage_type, 0.0)
+                self._energy_totals[usage_type] = energy_total
+            else:
+                watts = energy_usage.get_energy_usage_on_type(usage_type=usage_type)
+                increase = None
+                if watts is not None and duration_in_seconds is not None:
+                    increase = watts * duration_in_seconds
+            self.append_series_counter(
+                batch=batch,
+                name=ENERGY_CONSUMPTION_COUNTER_NAMES[usage_type],
+                tags=counter_tags,
+                increase=increase,
+            )
+        return batch
 
 
 class CarbonEmissionGenerator(MetricGenerator):
     """
     Carbon emission generator to generate carbon emissions.
+
+    The carbon emitted over each interval is generated in gauges and the carbon emitted since the start
+    in `*_co2g_total` counters.
     """
 
     carbon_emission: CarbonEmission
@@ -75,41 +171,153 @@ class CarbonEmissionGenerator(MetricGenerator):
                 ),
                 co2signal_url=(data["co2signal_url"] if "co2signal_url" in data else location.co2signal_url),
                 location=location,
+                energy_consumption=data.pop("energy_consumption", None) or EnergyConsumption.from_platform(),
             )
         super().__init__(location=location, metrics=[], **data)
 
+    async def prime(self) -> None:
+        """
+        Prime the carbon emission sensor.
+        """
+        await self.carbon_emission.prime()
+
     async def generate(self) -> AsyncGenerator[Metric, None]:
         """
         Generate metrics for the carbon emission.
 
         :return: an async generator of the metrics
         """
+        for metric in (await self.generate_batch()).metrics:
+            yield metric
+
+    async def generate_batch(self) -> MetricBatch:
+        """
+        Generate the metrics for the carbon emission in one batch.
+
+        :return: the batch of the metrics
+        """
+        batch = MetricBatch()
         carbon_usage = await self.carbon_emission.get_co2_usage()
 
+        if self.location is None:
+            raise ValueError("Location must be set")
+        tags = (
+            ("platform", self.platform),
+            ("location", self.location.name),
+            ("source", self.location.co2g_kwh_source.value),
+            ("units", carbon_usage.unit.value),
+        )
         for usage_type in UsageType:
+            metric_value = carbon_usage.get_carbon_usage_on_type(usage_type=usage_type)
+            self.append_series_metric(
+                batch=batch, name=CARBON_EMISSION_METRIC_NAMES[usage_type], tags=tags, value=metric_value
+            )
 
-            async def get_carbon_emission_by_usage_type(ut=usage_type) -> float | None:
-                """
-                Get the carbon usage.
-                """
-                return carbon_usage.get_carbon_usage_on_type(usage_type=ut)
+        carbon_usage.convert_unit(unit=CarbonUsageUnit.CO2_G)
+        counter_tags = tags[:-1] + (("units", CarbonUsageUnit.CO2_G.value),)
+        for usage_type in UsageType:
+            self.append_series_counter(
+                batch=batch,
+                name=CARBON_EMISSION_COUNTER_NAMES[usage_type],
+                tags=counter_tags,
+                increase=carbon_usage.get_carbon_usage_on_type(usage_type=usage_type),
+            )
+        return batch
 
-            if self.location is None:
-                raise ValueError("Location must be set")
-            yield Metric(
-                name=f"carbon_emission_{usage_type.value}",
-                value=get_carbon_emission_by_usage_type,
-                tags=[
-                    Tag(key="platform", value=self.platform),
-                    Tag(key="location", value=self.location.name),
-                    Tag(key="source", value=self.location.co2g_kwh_source.value),
-                    Tag(key="units", value=carbon_usage.unit.value),
-                ],
+
+class SelfTelemetryGenerator(MetricGenerator):
+    """
+    Self-telemetry generator measuring the overhead of Tracarbon itself.
+
+    It generates the CPU time and resident memory of the process, the latency histograms of the ticks,
+    sensor reads and exports and the depth of the export queue. The histograms are only recorded while the telemetry
+    is enabled, by Tracarbon between its start and its stop.
+    """
+
+    exporter: Exporter | None = None
+    _process: psutil.Process = PrivateAttr(default_factory=psutil.Process)
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(metrics=[], **data)
+
+    def _read_process_usage(self) -> Tuple[Any, Any]:
+        """
+        Read the CPU times and the memory of the process in one pass.
+
+        :return: the CPU times and the memory info of the process
+        """
+        with self._process.oneshot():
+            return self._process.cpu_times(), self._process.memory_info()
+
+    async def generate(self) -> AsyncGenerator[Metric, None]:
+        """
+        Generate the self-telemetry metrics.
+
+        :return: an async generator of the metrics
+        """
+        for metric in (await self.generate_batch()).metrics:
+            yield metric
+
+    async def generate_batch(self) -> MetricBatch:
+        """
+        Generate the self-telemetry metrics in one batch.
+
+        :return: the batch of the metrics
+        """
+        batch = MetricBatch()
+        tags: SeriesTags = (("platform", self.platform),)
+        cpu_times, memory_info = await asyncio.to_thread(self._read_process_usage)
+        self.append_series_metric(
+            batch=batch, name="self_cpu_time_seconds", tags=tags, value=cpu_times.user + cpu_times.system
+        )
+        self.append_series_metric(batch=batch, name="self_rss_bytes", tags=tags, value=memory_info.rss)
+        for (kind, name), histogram in list(TELEMETRY.histograms.items()):
+            source_tags = tags + (("source", name),)
+            self.append_series_metric(batch=batch, name=f"self_{kind}_count", tags=source_tags, value=histogram.count)
+            for statistic, value in (
+                ("mean", histogram.mean),
+                ("p50", histogram.quantile(0.5)),
+                ("p99", histogram.quantile(0.99)),
+                ("max", histogram.maximum),
+            ):
+                self.append_series_metric(
+                    batch=batch,
+                    name=f"self_{kind}_latency_seconds",
+                    tags=source_tags + (("statistic", statistic),),
+                    value=value,
+                )
+        if self.exporter is not None:
+            exporter_tags = tags + (("exporter", self.exporter.get_name()),)
+            self.append_series_metric(
+                batch=batch,
+                name="self_report_evicted_series",
+                tags=exporter_tags,
+                value=self.exporter.metric_report.evicted_series_count,
             )
+            export_queue = self.exporter.export_queue
+            if export_queue is not None:
+                for name, value in (
+                    ("self_export_queue_depth", len(export_queue)),
+                    ("self_export_queue_dropped_batches", export_queue.dropped_batch_count),
+                    ("self_export_queue_coalesced_batches", export_queue.coalesced_batch_count),
+                    ("self_export_queue_blocked_batches", export_queue.blocked_batch_count),
+                ):
+                    self.append_series_metric(batch=batch, name=name, tags=exporter_tags, value=value)
+        return batch
 
 
 if KUBERNETES_INSTALLED:
     from tracarbon.hardwares.containers import Kubernetes
+    from tracarbon.hardwares.containers import Pod
+
+    def _list_pods_usage(kubernetes: Kubernetes) -> List[Pod]:
+        """
+        List the pods with their usage, to run in a thread so the Kubernetes API calls do not block the event loop.
+
+        :param kubernetes: the Kubernetes client
+        :return: the pods with their usage
+        """
+        return list(kubernetes.get_pods_usage())
 
     class EnergyConsumptionKubernetesGenerator(MetricGenerator):
         """
@@ -126,72 +334,64 @@ if KUBERNETES_INSTALLED:
                 data["kubernetes"] = Kubernetes()
             super().__init__(metrics=[], **data)
 
+        async def prime(self) -> None:
+            """
+            Prime the energy consumption.
+            """
+            await self.energy_consumption.prime()
+
         async def generate(self) -> AsyncGenerator[Metric, None]:
             """
             Generate metrics for the energy consumption with Kubernetes.
 
             :return: an async generator of the metrics
             """
+            for metric in (await self.generate_batch()).metrics:
+                yield metric
+
+        async def generate_batch(self) -> MetricBatch:
+            """
+            Generate metrics for the energy consumption with Kubernetes in one batch.
+
+            :return: the batch of the metrics
+            """
+            batch = MetricBatch()
             energy_usage = await self.energy_consumption.get_energy_usage()
             energy_usage.convert_unit(unit=EnergyUsageUnit.MILLIWATT)
-            for pod in self.kubernetes.get_pods_usage():
+            if self.location is None:
+                raise ValueError("Location must be set")
+            generated_tags: Set[SeriesTags] = set()
+            for pod in await asyncio.to_thread(_list_pods_usage, self.kubernetes):
                 for container in pod.containers:
-
-                    async def get_pod_memory_energy_consumption(c=container) -> float | None:
-                        """
-                        Get the memory energy consumption of the pod.
-                        """
-                        if energy_usage.memory_energy_usage is None:
-                            return None
-                        return c.memory_usage * energy_usage.memory_energy_usage
-
-                    async def get_pod_cpu_energy_consumption(c=container) -> float | None:
-                        """
-                        Get the CPU energy consumption of the pod.
-                        """
-                        if energy_usage.cpu_energy_usage is None:
-                            return None
-                        return c.cpu_usage * energy_usage.cpu_energy_usage
-
-                    async def get_pod_total_energy_consumption(
-                        _mem=get_pod_memory_energy_consumption, _cpu=get_pod_cpu_energy_consumption
-                    ) -> float | None:
-                        """
-                        Get the total energy consumption of the pod.
-                        """
-                        memory = await _mem()
-                        cpu = await _cpu()
-                        if memory is None or cpu is None:
-                            return None
-                        return memory + cpu
-
-                    if self.location is None:
-                        raise ValueError("Location must be set")
-                    tags = [
-                        Tag(key="pod_name", value=pod.name),
-                        Tag(key="pod_namespace", value=pod.namespace),
-                        Tag(key="container_name", value=container.name),
-                        Tag(key="platform", value=self.platform),
-                        Tag(key="containers", value="kubernetes"),
-                        Tag(key="location", value=self.location.name),
-                        Tag(key="units", value=energy_usage.unit.value),
-                    ]
-
-                    yield Metric(
-                        name="energy_consumption_kubernetes_total",
-                        value=get_pod_total_energy_consumption,
-                        tags=tags,
+                    memory = (
+                        container.memory_usage * energy_usage.memory_energy_usage
+                        if energy_usage.memory_energy_usage is not None
+                        else None
                     )
-                    yield Metric(
-                        name="energy_consumption_kubernetes_cpu",
-                        value=get_pod_cpu_energy_consumption,
-                        tags=tags,
+                    cpu = (
+                        container.cpu_usage * energy_usage.cpu_energy_usage
+                        if energy_usage.cpu_energy_usage is not None
+                        else None
                     )
-                    yield Metric(
-                        name="energy_consumption_kubernetes_memory",
-                        value=get_pod_memory_energy_consumption,
-                        tags=tags,
+                    tags = (
+                        ("pod_name", pod.name),
+                        ("pod_namespace", pod.namespace),
+                        ("container_name", container.name),
+                        ("platform", self.platform),
+                        ("containers", "kubernetes"),
+                        ("location", self.location.name),
+                        ("units", energy_usage.unit.value),
                     )
+                    generated_tags.add(tags)
+                    total = memory + cpu if memory is not None and cpu is not None else None
+                    for name, metric_value in (
+                        ("energy_consumption_kubernetes_total", total),
+                        ("energy_consumption_kubernetes_cpu", cpu),
+                        ("energy_consumption_kubernetes_memory", memory),
+                    ):
+                        self.append_series_metric(batch=batch, name=name, tags=tags, value=metric_value)
+            self.prune_series_metrics(tags=generated_tags)
+            return batch
 
     class CarbonEmissionKubernetesGenerator(MetricGenerator):
         """
@@ -210,75 +410,68 @@ if KUBERNETES_INSTALLED:
                     ),
                     co2signal_url=(data["co2signal_url"] if "co2signal_url" in data else location.co2signal_url),
                     location=location,
+                    energy_consumption=data.pop("energy_consumption", None) or EnergyConsumption.from_platform(),
                 )
             if "kubernetes" not in data:
                 data["kubernetes"] = Kubernetes()
             super().__init__(location=location, metrics=[], **data)
 
+        async def prime(self) -> None:
+            """
+            Prime the carbon emission sensor.
+            """
+            await self.carbon_emission.prime()
+
         async def generate(self) -> AsyncGenerator[Metric, None]:
             """
             Generate metrics for the carbon emission with Kubernetes.
 
             :return: an async generator of the metrics
             """
+            for metric in (await self.generate_batch()).metrics:
+                yield metric
+
+        async def generate_batch(self) -> MetricBatch:
+            """
+            Generate metrics for the carbon emission with Kubernetes in one batch.
+
+            :return: the batch of the metrics
+            """
+            batch = MetricBatch()
             carbon_usage = await self.carbon_emission.get_co2_usage()
             carbon_usage.convert_unit(unit=CarbonUsageUnit.CO2_MG)
-
-            for pod in self.kubernetes.get_pods_usage():
+            if self.location is None:
+                raise ValueError("Location must be set")
+            generated_tags: Set[SeriesTags] = set()
+            for pod in await asyncio.to_thread(_list_pods_usage, self.kubernetes):
                 for container in pod.containers:
-
-                    async def get_cpu_pod_carbon_emission(c=container) -> float | None:
-                        """
-                        Get the CPU carbon emission of the pod.
-                        """
-                        if carbon_usage.cpu_carbon_usage is None:
-                            return None
-                        return c.cpu_usage * carbon_usage.cpu_carbon_usage
-
-                    async def get_memory_pod_carbon_emission(c=container) -> float | None:
-                        """
-                        Get the memory carbon emission of the pod.
-                        """
-                        if carbon_usage.memory_carbon_usage is None:
-                            return None
-                        return c.memory_usage * carbon_usage.memory_carbon_usage
-
-                    async def get_total_pod_carbon_emission(
-                        _cpu=get_cpu_pod_carbon_emission, _mem=get_memory_pod_carbon_emission
-                    ) -> float | None:
-                        """
-                        Get the total carbon emission of the pod.
-                        """
-                        cpu = await _cpu()
-                        memory = await _mem()
-                        if cpu is None or memory is None:
-                            return None
-                        return cpu + memory
-
-                    if self.location is None:
-                        raise ValueError("Location must be set")
-                    tags = [
-                        Tag(key="pod_name", value=pod.name),
-                        Tag(key="pod_namespace", value=pod.namespace),
-                        Tag(key="container_name", value=container.name),
-                        Tag(key="platform", value=self.platform),
-                        Tag(key="containers", value="kubernetes"),
-                        Tag(key="location", value=self.location.name),
-                        Tag(key="source", value=self.location.co2g_kwh_source.value),
-                        Tag(key="units", value=carbon_usage.unit.value),
-                    ]
-                    yield Metric(
-                        name="carbon_emission_kubernetes_total",
-                        value=get_total_pod_carbon_emission,
-                        tags=tags,
+                    cpu = (
+                        container.cpu_usage * carbon_usage.cpu_carbon_usage
+                        if carbon_usage.cpu_carbon_usage is not None
+                        else None
                     )
-                    yield Metric(
-                        name="carbon_emission_kubernetes_cpu",
-                        value=get_cpu_pod_carbon_emission,
-                        tags=tags,
+                    memory = (
+                        container.memory_usage * carbon_usage.memory_carbon_usage
+                        if carbon_usage.memory_carbon_usage is not None
+                        else None
                     )
-                    yield Metric(
-                        name="carbon_emission_kubernetes_memory",
-                        value=get_memory_pod_carbon_emission,
-                        tags=tags,
+                    tags = (
+                        ("pod_name", pod.name),
+                        ("pod_namespace", pod.namespace),
+                        ("container_name", container.name),
+                        ("platform", self.platform),
+                        ("containers", "kubernetes"),
+                        ("location", self.location.name),
+                        ("source", self.location.co2g_kwh_source.value),
+                        ("units", carbon_usage.unit.value),
                     )
+                    generated_tags.add(tags)
+                    total = cpu + memory if cpu is not None and memory is not None else None
+                    for name, metric_value in (
+                        ("carbon_emission_kubernetes_total", total),
+                        ("carbon_emission_kubernetes_cpu", cpu),
+                        ("carbon_emission_kubernetes_memory", memory),
+                    ):
+                        self.append_series_metric(batch=batch, name=name, tags=tags, value=metric_value)
+            self.prune_series_metrics(tags=generated_tags)
+            return batch
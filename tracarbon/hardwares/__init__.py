@@ -4,10 +4,16 @@ from tracarbon.hardwares.cloud_providers import AWS
 from tracarbon.hardwares.cloud_providers import GCP
 from tracarbon.hardwares.cloud_providers import Azure
 from tracarbon.hardwares.cloud_providers import CloudProviders
+from tracarbon.hardwares.energy import EnergyBreakdown
 from tracarbon.hardwares.energy import EnergyUsageUnit
+from tracarbon.hardwares.energy import GPUDevice
 from tracarbon.hardwares.energy import Power
 from tracarbon.hardwares.energy import UsageType
+from tracarbon.hardwares.rapl import EnergyRingBuffer
 from tracarbon.hardwares.rapl import RAPLResult
+from tracarbon.hardwares.rapl import RAPLSampler
+from tracarbon.hardwares.sample_bus import SampleBus
+from tracarbon.hardwares.sample_bus import TickContext
 from tracarbon.hardwares.sensors import AMDRAPL
 from tracarbon.hardwares.sensors import RAPL
 from tracarbon.hardwares.sensors import AppleSiliconPowerMetrics
@@ -22,6 +28,7 @@ from tracarbon.hardwares.sensors import HardwareInfo
 from tracarbon.hardwares.sensors import LinuxEnergyConsumption
 from tracarbon.hardwares.sensors import MacEnergyConsumption
 from tracarbon.hardwares.sensors import Sensor
+from tracarbon.hardwares.sensors import SensorPlan
 from tracarbon.hardwares.sensors import WindowsEnergyConsumption
 
 __all__ = [
@@ -34,11 +41,14 @@ __all__ = [
     "AzureEnergyConsumption",
     "CloudEnergyConsumption",
     "CloudProviders",
+    "EnergyBreakdown",
     "EnergyConsumption",
+    "EnergyRingBuffer",
     "EnergyUsage",
     "EnergyUsageUnit",
     "GCP",
     "GCPEnergyConsumption",
+    "GPUDevice",
     "GPUInfo",
     "HardwareInfo",
     "LinuxEnergyConsumption",
@@ -46,7 +56,11 @@ __all__ = [
     "Power",
     "RAPL",
     "RAPLResult",
+    "RAPLSampler",
+    "SampleBus",
     "Sensor",
+    "SensorPlan",
+    "TickContext",
     "UsageType",
     "WindowsEnergyConsumption",
 ]
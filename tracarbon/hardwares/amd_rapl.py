@@ -1,17 +1,24 @@
 import os
 import re
+import time
+from array import array
 from datetime import datetime
 from typing import Dict
 from typing import List
+from typing import Tuple
 
 import aiofiles
 from loguru import logger
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from tracarbon.exceptions import HardwareRAPLException
+from tracarbon.hardwares.energy import EnergyBreakdown
 from tracarbon.hardwares.energy import EnergyUsage
 from tracarbon.hardwares.energy import Power
+from tracarbon.hardwares.energy import UsageType
+from tracarbon.telemetry import TELEMETRY
 
 __all__ = [
     "AMDRAPLResult",
@@ -22,12 +29,15 @@ __all__ = [
 class AMDRAPLResult(BaseModel):
     """
     AMD RAPL result after reading the HWMON energy files.
+
+    The monotonic timestamp in nanoseconds times the deltas, the wall-clock timestamp is kept for display.
     """
 
     name: str
     label: str
     energy_uj: float
     timestamp: datetime
+    timestamp_ns: int | None = None
 
 
 class AMDRAPL(BaseModel):
@@ -41,12 +51,20 @@ class AMDRAPL(BaseModel):
     Labels follow the pattern:
     - Esocket0, Esocket1, ... : Package/socket level energy
     - Ecore0, Ecore1, ... : Per-core energy
+
+    The labels are read once with the list of the energy files. A report carries the breakdown of the power
+    of each socket, and of each core with the core breakdown, and the energy of the sockets accumulated
+    from the wrapped counter deltas of every reading since the first one.
     """
 
     hwmon_base_path: str = "/sys/class/hwmon"
     amd_energy_path: str | None = None
     rapl_results: Dict[str, AMDRAPLResult] = Field(default_factory=dict)
     energy_files: List[str] = Field(default_factory=list)
+    core_breakdown: bool = False
+    _labels: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _package_energy_total_uj: float = PrivateAttr(default=0.0)
+    _breakdown_labels: Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]] = PrivateAttr(default=((), (), ()))
 
     async def _find_amd_energy_hwmon(self) -> str | None:
         """
@@ -106,6 +124,8 @@ class AMDRAPL(BaseModel):
                 label_file = os.path.join(self.amd_energy_path, f"energy{energy_index}_label")
 
                 if os.path.exists(input_file) and os.path.exists(label_file):
+                    with open(label_file) as label:
+                        self._labels[energy_index] = label.read().strip()
                     self.energy_files.append(energy_index)
 
         logger.debug(f"Found AMD energy files: {self.energy_files}")
@@ -126,23 +146,27 @@ class AMDRAPL(BaseModel):
                 raise ValueError("AMD energy HWMON interface not found")
             for energy_index in self.energy_files:
                 input_file = os.path.join(self.amd_energy_path, f"energy{energy_index}_input")
-                label_file = os.path.join(self.amd_energy_path, f"energy{energy_index}_label")
-
-                async with aiofiles.open(label_file) as f:
-                    label = (await f.read()).strip()
+                label = self._labels.get(energy_index)
+                if label is None:
+                    label_file = os.path.join(self.amd_energy_path, f"energy{energy_index}_label")
+                    async with aiofiles.open(label_file) as f:
+                        label = (await f.read()).strip()
+                    self._labels[energy_index] = label
 
                 async with aiofiles.open(input_file) as f:
                     energy_uj = float((await f.read()).strip())
+                timestamp_ns = time.monotonic_ns()
 
                 # Create a unique name combining index and label
                 name = f"amd-{energy_index}-{label}"
 
                 rapl_results.append(
-                    AMDRAPLResult(
+                    AMDRAPLResult.model_construct(
                         name=name,
                         label=label,
                         energy_uj=energy_uj,
                         timestamp=datetime.now(),
+                        timestamp_ns=timestamp_ns,
                     )
                 )
 
@@ -169,6 +193,14 @@ class AMDRAPL(BaseModel):
         else:
             return "unknown"
 
+    async def prime(self) -> None:
+        """
+        Take the baseline reading of the energy counters, so the first report covers the interval since the priming.
+        """
+        for rapl_result in await self.get_amd_rapl_power_usage():
+            self.rapl_results[rapl_result.name] = rapl_result
+
+    @TELEMETRY.timed(kind="sensor", name="amd_hwmon")
     async def get_energy_report(self) -> EnergyUsage:
         """
         Get the energy report based on AMD RAPL HWMON readings.
@@ -185,43 +217,85 @@ class AMDRAPL(BaseModel):
         rapl_results = await self.get_amd_rapl_power_usage()
 
         total_package_watts = 0.0
+        duration_in_seconds = 0.0
+        breakdown_names: List[str] = []
+        breakdown_watts = array("d")
 
         for rapl_result in rapl_results:
-            previous_rapl_result = self.rapl_results.get(rapl_result.name, rapl_result)
-
-            time_difference_seconds = (rapl_result.timestamp - previous_rapl_result.timestamp).total_seconds()
-            if time_difference_seconds <= 0:
-                time_difference_seconds = 1.0
-
-            energy_uj = rapl_result.energy_uj
-
-            # Handle wrap-around for 32-bit counters on older AMD CPUs
-            # 32-bit counter max is ~4.29 billion microjoules
-            max_32bit_uj = 4294967295.0
-            if previous_rapl_result.energy_uj > rapl_result.energy_uj:
-                logger.debug(
-                    f"Wrap-around detected in AMD RAPL {rapl_result.name}. "
-                    f"Current: {rapl_result.energy_uj}, Previous: {previous_rapl_result.energy_uj}"
-                )
-                energy_uj = energy_uj + max_32bit_uj
-
-            energy_delta = energy_uj - previous_rapl_result.energy_uj
-            watts = Power.watts_from_microjoules(energy_delta / time_difference_seconds)
+            previous_rapl_result = self.rapl_results.get(rapl_result.name)
 
             # Store current result for next comparison
             self.rapl_results[rapl_result.name] = rapl_result
 
             domain = self._classify_domain(rapl_result.label)
 
+            # The first reading is the baseline: no energy is measured yet
+            watts = 0.0
+            if previous_rapl_result is not None:
+                if rapl_result.timestamp_ns is not None and previous_rapl_result.timestamp_ns is not None:
+                    time_difference_seconds = (rapl_result.timestamp_ns - previous_rapl_result.timestamp_ns) / 1e9
+                else:
+                    time_difference_seconds = (rapl_result.timestamp - previous_rapl_result.timestamp).total_seconds()
+
+                energy_uj = rapl_result.energy_uj
+
+                # Handle wrap-around for 32-bit counters on older AMD CPUs
+                # 32-bit counter max is ~4.29 billion microjoules
+                max_32bit_uj = 4294967295.0
+                if previous_rapl_result.energy_uj > rapl_result.energy_uj:
+                    logger.debug(
+                        f"Wrap-around detected in AMD RAPL {rapl_result.name}. "
+                        f"Current: {rapl_result.energy_uj}, Previous: {previous_rapl_result.energy_uj}"
+                    )
+                    energy_uj = energy_uj + max_32bit_uj
+
+                energy_delta = energy_uj - previous_rapl_result.energy_uj
+                if domain == "package":
+                    self._package_energy_total_uj += energy_delta
+                if time_difference_seconds > 0:
+                    duration_in_seconds = time_difference_seconds
+                    watts = Power.watts_from_microjoules(energy_delta / time_difference_seconds)
+
             if domain == "package":
                 total_package_watts += watts
+            if domain == "package" or self.core_breakdown:
+                breakdown_names.append(rapl_result.label)
+                breakdown_watts.append(watts)
 
         energy_usage_report = EnergyUsage(
             host_energy_usage=total_package_watts,
             cpu_energy_usage=total_package_watts if total_package_watts > 0 else None,
             memory_energy_usage=None,
             gpu_energy_usage=None,
+            duration_in_seconds=duration_in_seconds,
+            breakdown=self._get_breakdown(names=tuple(breakdown_names), watts=breakdown_watts),
+            energy_totals_in_joules={
+                UsageType.HOST: Power.watts_from_microjoules(self._package_energy_total_uj),
+                UsageType.CPU: Power.watts_from_microjoules(self._package_energy_total_uj),
+            },
         )
 
         logger.debug(f"AMD RAPL energy report: {energy_usage_report}")
         return energy_usage_report
+
+    def _get_breakdown(self, names: Tuple[str, ...], watts: array) -> EnergyBreakdown:
+        """
+        Get the breakdown of the power of the counters, their labels being built once for the discovered counters.
+
+        :param names: the labels of the counters
+        :param watts: the power of the counters in watts
+        :return: the breakdown
+        """
+        labels = self._breakdown_labels
+        if labels[0] != names:
+            domains = tuple(self._classify_domain(name) for name in names)
+            labels = (
+                names,
+                domains,
+                tuple(
+                    "".join(character for character in name if character.isdigit()) if domain == "package" else ""
+                    for name, domain in zip(names, domains, strict=True)
+                ),
+            )
+            self._breakdown_labels = labels
+        return EnergyBreakdown(names=labels[0], domains=labels[1], sockets=labels[2], watts=watts)
@@ -1,12 +1,20 @@
+from array import array
 from datetime import datetime
 from enum import Enum
 from typing import ClassVar
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 
 __all__ = [
     "EnergyUsageUnit",
     "UsageType",
+    "EnergyBreakdown",
+    "GPUDevice",
     "EnergyUsage",
     "Power",
 ]
@@ -32,16 +40,70 @@ class UsageType(Enum):
     GPU = "gpu"
 
 
+class EnergyBreakdown:
+    """
+    Power of each energy counter of a sensor read in one pass, e.g. each RAPL domain of each socket.
+
+    The labels of the counters are constant tuples shared between the reads, only the power in watts is stored
+    per read, in an array parallel to the labels.
+    """
+
+    __slots__ = ("names", "domains", "sockets", "watts")
+
+    def __init__(
+        self, names: Tuple[str, ...], domains: Tuple[str, ...], sockets: Tuple[str, ...], watts: array
+    ) -> None:
+        self.names = names
+        self.domains = domains
+        self.sockets = sockets
+        self.watts = watts
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[Tuple[str, str, str, float]]:
+        """
+        Iterate over the counters: their name, domain, socket and power in watts.
+        """
+        return zip(self.names, self.domains, self.sockets, self.watts, strict=True)
+
+
+class GPUDevice(BaseModel):
+    """
+    Usage of a GPU read by the tool of its vendor: its power in watts, its utilization in percent
+    and its used memory in MiB, None if not reported.
+    """
+
+    index: int
+    uuid: str | None = None
+    name: str | None = None
+    power: float
+    utilization: float | None = None
+    memory_used: float | None = None
+
+
 class EnergyUsage(BaseModel):
     """
     Energy report in watts.
+
+    The duration is the exact interval the power was measured over, when the sensor measures an energy counter.
+    The breakdown is the power in watts of each counter of the sensor, when it reads several counters.
+    The GPU devices are the usages of each GPU, the GPU energy usage being their total power.
+    The energy totals are the energy in joules of each type accumulated by the sensor from its energy counters since
+    its first reading, whichever consumer read it, when the sensor reads energy counters.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     host_energy_usage: float = 0.0
     cpu_energy_usage: float | None = None
     memory_energy_usage: float | None = None
     gpu_energy_usage: float | None = None
     unit: EnergyUsageUnit = EnergyUsageUnit.WATT
+    duration_in_seconds: float | None = None
+    breakdown: EnergyBreakdown | None = None
+    gpu_devices: List[GPUDevice] | None = None
+    energy_totals_in_joules: Dict[UsageType, float] | None = None
 
     def get_energy_usage_on_type(self, usage_type: UsageType) -> float | None:
         """
@@ -60,6 +122,17 @@ class EnergyUsage(BaseModel):
             return self.memory_energy_usage
         return None
 
+    def get_energy_total_on_type(self, usage_type: UsageType) -> float | None:
+        """
+        Get the energy total in joules based on the type.
+
+        :param: usage_type: the type of energy to return
+        :return: the energy total of the type, None if the sensor does not accumulate it
+        """
+        if self.energy_totals_in_joules is None:
+            return None
+        return self.energy_totals_in_joules.get(usage_type)
+
     def convert_unit(self, unit: EnergyUsageUnit) -> None:
         """
         Convert the EnergyUsage values to the requested unit.
@@ -90,6 +163,7 @@ class Power(BaseModel):
     MICROJOULES_TO_WATT_FACTOR: ClassVar[int] = 1000000
     WH_TO_KWH_FACTOR: ClassVar[int] = 1000
     SECONDS_TO_HOURS_FACTOR: ClassVar[int] = 3600
+    JOULES_TO_KWH_FACTOR: ClassVar[int] = 3600000
 
     @staticmethod
     def watts_to_watt_hours(watts: float, previous_energy_measurement_time: datetime | None = None) -> float:
@@ -116,6 +190,15 @@ class Power(BaseModel):
         """
         return (watts_hour / Power.WH_TO_KWH_FACTOR) * co2g_per_kwh
 
+    @staticmethod
+    def co2g_from_joules(joules: float, co2g_per_kwh: float) -> float:
+        """
+        Calculate the CO2g generated using joules and the CO2g/kwh.
+
+        :return: the CO2g generated by the energy consumption
+        """
+        return (joules / Power.JOULES_TO_KWH_FACTOR) * co2g_per_kwh
+
     @staticmethod
     def watts_from_microjoules(
         uj: float,
@@ -1,18 +1,34 @@
+import asyncio
 import functools
+import os
 import platform
 import re
 import shutil
 import subprocess
+import time
+import weakref
 from abc import ABC
+from contextlib import suppress
+from typing import ClassVar
+from typing import Dict
+from typing import List
 from typing import Tuple
 
 from loguru import logger
 from pydantic import BaseModel
 
 from tracarbon.exceptions import HardwareNoGPUDetectedException
+from tracarbon.hardwares.energy import GPUDevice
+from tracarbon.hardwares.sysfs import read_sysfs_counter
+from tracarbon.telemetry import TELEMETRY
 
 _RE_POWER_W = re.compile(r"Power\s*\(W\):\s*([\d.]+)", re.IGNORECASE)
 _RE_POWER_USAGE_W = re.compile(r"POWER[^:]*:\s*([\d.]+)\s*W", re.IGNORECASE)
+_RE_AMD_GPU_INDEX = re.compile(r"^\s*GPU(?:\[(\d+)\]|:\s*(\d+)\s*$)", re.IGNORECASE)
+_RE_AMD_UTILIZATION = re.compile(r"(?:GPU use \(%\)|GFX_ACTIVITY):\s*([\d.]+)", re.IGNORECASE)
+_RE_AMD_UUID = re.compile(r"Unique ID:\s*(\S+)", re.IGNORECASE)
+_RE_AMD_NAME = re.compile(r"Card series:\s*(.+?)\s*$", re.IGNORECASE)
+_RE_DRM_CARD = re.compile(r"^card(\d+)$")
 
 
 @functools.lru_cache(maxsize=8)
@@ -20,13 +36,272 @@ def _compile_power_pattern(label: str, unit: str) -> re.Pattern:
     return re.compile(rf"{label}:\s*([\d.]+)\s*{unit}", re.IGNORECASE)
 
 
+def _parse_float(value: str) -> float | None:
+    try:
+        return float(value.split()[0])
+    except (IndexError, ValueError):
+        return None
+
+
+def parse_nvidia_smi_line(line: str, default_index: int = 0) -> GPUDevice | None:
+    """
+    Parse a line of the nvidia-smi csv output: the index, uuid, name, power, utilization and used memory of a GPU,
+    or only its power, with or without its index. The unsupported values are missing.
+
+    :param line: the line in the csv format, without header
+    :param default_index: the index of the GPU if the line does not report it
+    :return: the GPU device, None if its power is not reported
+    """
+    fields = [field.strip() for field in line.split(",")]
+    try:
+        if len(fields) == 1:
+            index, power = default_index, _parse_float(fields[0])
+            uuid = name = None
+            utilization = memory_used = None
+        elif len(fields) == 2:
+            index, power = int(fields[0]), _parse_float(fields[1])
+            uuid = name = None
+            utilization = memory_used = None
+        elif len(fields) >= 6:
+            index, uuid, name = int(fields[0]), fields[1], ",".join(fields[2:-3])
+            power, utilization, memory_used = (_parse_float(field) for field in fields[-3:])
+        else:
+            return None
+    except ValueError:
+        return None
+    if power is None:
+        return None
+    return GPUDevice.model_construct(
+        index=index, uuid=uuid, name=name, power=power, utilization=utilization, memory_used=memory_used
+    )
+
+
+class NvidiaGPUSampler:
+    """
+    Streaming sampler of the Nvidia GPUs.
+
+    A long-lived nvidia-smi child process reports the usage of each GPU every interval and its output is parsed
+    line by line by a task of the event loop, so reading the latest usage costs no process and never blocks the loop.
+    The child is supervised: it is restarted with an exponential backoff when it exits.
+    """
+
+    __slots__ = (
+        "interval_in_ms",
+        "max_age_in_seconds",
+        "minimum_backoff_in_seconds",
+        "maximum_backoff_in_seconds",
+        "devices",
+        "timestamp",
+        "restart_count",
+        "_process",
+        "_task",
+        "_loop",
+    )
+
+    QUERY = "index,uuid,name,power.draw,utilization.gpu,memory.used"
+
+    def __init__(
+        self,
+        interval_in_ms: int = 1000,
+        max_age_in_seconds: float | None = None,
+        minimum_backoff_in_seconds: float = 1.0,
+        maximum_backoff_in_seconds: float = 60.0,
+    ) -> None:
+        self.interval_in_ms = interval_in_ms
+        self.max_age_in_seconds = (
+            max_age_in_seconds if max_age_in_seconds is not None else max(3 * interval_in_ms / 1000, 5.0)
+        )
+        self.minimum_backoff_in_seconds = minimum_backoff_in_seconds
+        self.maximum_backoff_in_seconds = maximum_backoff_in_seconds
+        self.devices: Dict[int, GPUDevice] = {}
+        self.timestamp: float | None = None
+        self.restart_count = 0
+        self._process: asyncio.subprocess.Process | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the supervision task is running.
+
+        :return: if the sampler is running
+        """
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """
+        Start supervising the nvidia-smi child process in the running event loop.
+        """
+        if self.is_running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self._supervise())
+
+    def stop(self) -> asyncio.Task | None:
+        """
+        Stop the supervision task and kill the nvidia-smi child process, from any thread.
+        The cancelled task kills and waits for its child process: await it from the event loop to wait for the stop.
+
+        :return: the cancelled supervision task, if any
+        """
+        process = self._process
+        if process is not None and process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        task, loop = self._task, self._loop
+        if task is not None and loop is not None and not loop.is_closed():
+            try:
+                running_loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if loop.is_running() and running_loop is not loop:
+                loop.call_soon_threadsafe(task.cancel)
+            else:
+                task.cancel()
+        self._task = None
+        self._process = None
+        return task
+
+    def parse_line(self, line: bytes) -> None:
+        """
+        Parse a line of the nvidia-smi output: the usage of a GPU. A GPU without power reported is ignored.
+
+        :param line: the line in the csv format, without header and units
+        """
+        device = parse_nvidia_smi_line(line=line.decode())
+        if device is None:
+            return
+        self.devices[device.index] = device
+        self.timestamp = time.monotonic()
+
+    def get_gpu_devices(self) -> List[GPUDevice] | None:
+        """
+        Get the latest usage of each GPU.
+
+        :return: the GPU devices by index, or None without a recent sample
+        """
+        if self.timestamp is None or time.monotonic() - self.timestamp > self.max_age_in_seconds:
+            return None
+        return [self.devices[index] for index in sorted(self.devices)]
+
+    def get_gpu_power_usage(self) -> float | None:
+        """
+        Get the latest power usage of the GPUs.
+
+        :return: the total gpu power usage in W, or None without a recent sample
+        """
+        devices = self.get_gpu_devices()
+        return sum(device.power for device in devices) if devices is not None else None
+
+    async def _supervise(self) -> None:
+        """
+        Run the nvidia-smi child process and restart it with an exponential backoff until the sampler stops.
+        """
+        backoff_in_seconds = self.minimum_backoff_in_seconds
+        while True:
+            nvidia_smi_path = shutil.which("nvidia-smi")
+            if nvidia_smi_path is None:
+                logger.warning("Nvidia GPU sampler stopped: nvidia-smi not found in PATH.")
+                return
+            try:
+                if await self._run(nvidia_smi_path=nvidia_smi_path):
+                    backoff_in_seconds = self.minimum_backoff_in_seconds
+            except OSError as exception:
+                logger.warning(f"Nvidia GPU sampler failed to run nvidia-smi: {exception}")
+            self.restart_count += 1
+            logger.debug(f"Nvidia GPU sampler restarting nvidia-smi in {backoff_in_seconds} s.")
+            await asyncio.sleep(backoff_in_seconds)
+            backoff_in_seconds = min(backoff_in_seconds * 2, self.maximum_backoff_in_seconds)
+
+    async def _run(self, nvidia_smi_path: str) -> bool:
+        """
+        Run the nvidia-smi child process and parse its output until it exits.
+        The spawn is shielded, so a cancel while spawning still kills and waits for the child process.
+
+        :param nvidia_smi_path: the path of nvidia-smi
+        :return: if the child process reported a sample
+        """
+        spawn = asyncio.ensure_future(
+            asyncio.create_subprocess_exec(
+                nvidia_smi_path,
+                f"--query-gpu={self.QUERY}",
+                "--format=csv,noheader,nounits",
+                "-lms",
+                str(self.interval_in_ms),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        )
+        try:
+            process = await asyncio.shield(spawn)
+        except asyncio.CancelledError:
+            with suppress(OSError):
+                await self._kill(process=await spawn)
+            raise
+        self._process = process
+        timestamp = self.timestamp
+        try:
+            while process.stdout is not None and (line := await process.stdout.readline()):
+                self.parse_line(line)
+        finally:
+            await self._kill(process=process)
+            self._process = None
+        return self.timestamp != timestamp
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        """
+        Kill the nvidia-smi child process if still running and wait for it.
+
+        :param process: the child process
+        """
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await process.wait()
+
+
 class NvidiaGPU(BaseModel):
     """
     Nvidia GPU information.
     Supports multiple GPUs by summing power consumption across all detected GPUs.
+    The index, uuid, name, power, utilization and used memory of each GPU are read by the same query.
+
+    Once the streaming sampler is started, the usage is its latest sample instead of a nvidia-smi run.
     """
 
+    sampler: ClassVar[NvidiaGPUSampler | None] = None
+
+    @classmethod
+    def start_sampler(cls, interval_in_ms: int = 1000) -> None:
+        """
+        Start the streaming sampler of the Nvidia GPUs in the running event loop.
+
+        :param interval_in_ms: the sampling interval of nvidia-smi in milliseconds
+        """
+        if cls.sampler is not None and cls.sampler.is_running:
+            return
+        cls.sampler = NvidiaGPUSampler(interval_in_ms=interval_in_ms)
+        cls.sampler.start()
+        logger.info(f"Nvidia GPU sampler started every {interval_in_ms} ms.")
+
+    @classmethod
+    def stop_sampler(cls) -> asyncio.Task | None:
+        """
+        Stop the streaming sampler of the Nvidia GPUs.
+
+        :return: the cancelled supervision task of the sampler, to await from its event loop, if any
+        """
+        sampler, cls.sampler = cls.sampler, None
+        return sampler.stop() if sampler is not None else None
+
     @classmethod
+    @TELEMETRY.timed(kind="sensor", name="nvidia_smi")
     def launch_shell_command(cls) -> Tuple[bytes, int]:
         """
         Launch a shell command to query GPU power.
@@ -37,40 +312,264 @@ class NvidiaGPU(BaseModel):
         if nvidia_smi_path is None:
             raise HardwareNoGPUDetectedException("Nvidia GPU with nvidia-smi not found in PATH.")
 
-        result = subprocess.run(
-            [nvidia_smi_path, "--query-gpu=power.draw", "--format=csv,noheader"],
-            capture_output=True,
-        )
+        try:
+            result = subprocess.run(
+                [nvidia_smi_path, f"--query-gpu={NvidiaGPUSampler.QUERY}", "--format=csv,noheader,nounits"],
+                capture_output=True,
+                timeout=10,
+            )
+        except subprocess.TimeoutExpired as exception:
+            raise HardwareNoGPUDetectedException("nvidia-smi timed out.") from exception
         return result.stdout, result.returncode
 
     @classmethod
-    def get_gpu_power_usage(cls) -> float:
+    def get_gpu_devices(cls) -> List[GPUDevice]:
         """
-        Get the GPU power usage in watts.
-        Supports multiple GPUs by summing power consumption.
+        Get the usage of each GPU.
+        Without a recent sample of the running sampler, right after its start or while nvidia-smi restarts,
+        the reading of the tick is missing: no GPU device is reported.
 
-        :return: the total gpu power usage in W
+        :return: the GPU devices
+        """
+        sampler = cls.sampler
+        if sampler is not None and sampler.is_running:
+            devices = sampler.get_gpu_devices()
+            if devices is None:
+                logger.debug("No recent sample of the Nvidia GPU sampler.")
+                return []
+            return devices
+        return cls.query_gpu_devices()
+
+    @classmethod
+    def query_gpu_devices(cls) -> List[GPUDevice]:
+        """
+        Get the usage of each GPU with a one-shot nvidia-smi query.
+
+        :return: the GPU devices
         """
         gpu_output, return_code = cls.launch_shell_command()
         if return_code == 0:
-            total_power = 0.0
+            devices = []
             for line in gpu_output.decode().strip().split("\n"):
                 line = line.strip()
                 if line:
-                    # Parse decimal number
-                    power_str = line.split()[0]
-                    total_power += float(power_str)
-            return total_power
+                    device = parse_nvidia_smi_line(line=line, default_index=len(devices))
+                    if device is not None:
+                        devices.append(device)
+            return devices
         raise HardwareNoGPUDetectedException("No Nvidia GPU detected.")
 
+    @classmethod
+    def get_gpu_power_usage(cls) -> float:
+        """
+        Get the GPU power usage in watts.
+        Supports multiple GPUs by summing power consumption.
+
+        :return: the total gpu power usage in W
+        """
+        return sum(device.power for device in cls.get_gpu_devices())
+
+
+class AMDGPUCard:
+    """
+    AMD GPU card discovered once in sysfs: its index, unique id and name,
+    and the file descriptors of its power, busy percent and used VRAM kept open.
+    """
+
+    __slots__ = ("index", "uuid", "name", "power_fd", "utilization_fd", "memory_used_fd")
+
+    def __init__(
+        self,
+        index: int,
+        power_fd: int,
+        uuid: str | None = None,
+        name: str | None = None,
+        utilization_fd: int | None = None,
+        memory_used_fd: int | None = None,
+    ) -> None:
+        self.index = index
+        self.uuid = uuid
+        self.name = name
+        self.power_fd = power_fd
+        self.utilization_fd = utilization_fd
+        self.memory_used_fd = memory_used_fd
+
+
+def _close_cards(cards: List[AMDGPUCard]) -> None:
+    for card in cards:
+        for fd in (card.power_fd, card.utilization_fd, card.memory_used_fd):
+            if fd is None:
+                continue
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    cards.clear()
+
+
+def _read_optional_file(path: str) -> str | None:
+    try:
+        with open(path) as file:
+            return file.read().strip() or None
+    except OSError:
+        return None
+
+
+def _open_optional_file(path: str) -> int | None:
+    try:
+        return os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+
+
+def _read_optional_value(fd: int | None) -> float | None:
+    if fd is None:
+        return None
+    try:
+        return float(read_sysfs_counter(fd))
+    except (OSError, ValueError):
+        return None
+
+
+class AMDGPUSysfs:
+    """
+    Reader of the AMD GPUs exposed by the amdgpu kernel driver in sysfs.
+
+    The cards are discovered once under /sys/class/drm/card*/device: the AMD cards with a power file in their
+    hwmon directory, power1_average or else power1_input in microwatts. Their files are kept open, so a tick
+    reads the power, busy percent and used VRAM of every card without opening any file or running any process.
+    """
+
+    AMD_VENDOR_ID = "0x1002"
+    POWER_FILES = ("power1_average", "power1_input")
+
+    def __init__(self, path: str = "/sys/class/drm") -> None:
+        self.path = path
+        self.cards: List[AMDGPUCard] = []
+        weakref.finalize(self, _close_cards, self.cards)
+
+    def discover(self) -> None:
+        """
+        Discover the AMD GPU cards: read their constant files once and open their power files.
+        """
+        if not os.path.isdir(self.path):
+            return
+        card_directories = sorted(
+            (int(card_match.group(1)), entry)
+            for entry in os.listdir(self.path)
+            if (card_match := _RE_DRM_CARD.match(entry))
+        )
+        cards: List[AMDGPUCard] = []
+        try:
+            for _, entry in card_directories:
+                device_path = os.path.join(self.path, entry, "device")
+                if _read_optional_file(os.path.join(device_path, "vendor")) != self.AMD_VENDOR_ID:
+                    continue
+                power_path = self._find_power_file(device_path=device_path)
+                if power_path is None:
+                    continue
+                cards.append(
+                    AMDGPUCard(
+                        index=len(cards),
+                        power_fd=os.open(power_path, os.O_RDONLY),
+                        uuid=_read_optional_file(os.path.join(device_path, "unique_id")),
+                        name=_read_optional_file(os.path.join(device_path, "product_name")),
+                        utilization_fd=_open_optional_file(os.path.join(device_path, "gpu_busy_percent")),
+                        memory_used_fd=_open_optional_file(os.path.join(device_path, "mem_info_vram_used")),
+                    )
+                )
+        except Exception:
+            _close_cards(cards)
+            raise
+        self.cards.extend(cards)
+        logger.debug(f"The AMD GPU cards discovered in sysfs: {[card.index for card in cards]}.")
+
+    def _find_power_file(self, device_path: str) -> str | None:
+        """
+        Find the power file of a card in its hwmon directories.
+
+        :param device_path: the path of the device of the card
+        :return: the path of the power file, or None if the card does not report its power
+        """
+        hwmon_path = os.path.join(device_path, "hwmon")
+        if not os.path.isdir(hwmon_path):
+            return None
+        for hwmon_directory in sorted(os.listdir(hwmon_path)):
+            for power_file in self.POWER_FILES:
+                power_path = os.path.join(hwmon_path, hwmon_directory, power_file)
+                if os.path.exists(power_path):
+                    return power_path
+        return None
+
+    def close(self) -> None:
+        """
+        Close the files of the cards.
+        """
+        _close_cards(self.cards)
+
+    @TELEMETRY.timed(kind="sensor", name="amdgpu_sysfs")
+    def get_gpu_devices(self) -> List[GPUDevice]:
+        """
+        Read the usage of each card in one pass.
+
+        :return: the GPU devices
+        """
+        return [
+            GPUDevice.model_construct(
+                index=card.index,
+                uuid=card.uuid,
+                name=card.name,
+                power=float(read_sysfs_counter(card.power_fd)) / 1_000_000,
+                utilization=_read_optional_value(card.utilization_fd),
+                memory_used=(
+                    memory_used / (1024 * 1024)
+                    if (memory_used := _read_optional_value(card.memory_used_fd)) is not None
+                    else None
+                ),
+            )
+            for card in self.cards
+        ]
+
 
 class AMDGPU(BaseModel):
     """
-    AMD GPU information using rocm-smi or amd-smi.
+    AMD GPU information read from the sysfs files of the amdgpu driver, or else using rocm-smi or amd-smi.
     Supports multiple GPUs by summing power consumption across all detected GPUs.
+    The power, utilization, unique id and name of each GPU are read by the same query, when reported.
+
+    The sysfs cards are discovered once, the tools only being run when no card is found in sysfs.
     """
 
+    sysfs_path: ClassVar[str] = "/sys/class/drm"
+    sysfs: ClassVar[AMDGPUSysfs | None] = None
+
+    @classmethod
+    def get_sysfs(cls) -> AMDGPUSysfs:
+        """
+        Get the sysfs reader of the AMD GPUs, its cards being discovered on the first call.
+
+        :return: the sysfs reader
+        """
+        sysfs = cls.sysfs
+        if sysfs is None or sysfs.path != cls.sysfs_path:
+            if sysfs is not None:
+                sysfs.close()
+            sysfs = AMDGPUSysfs(path=cls.sysfs_path)
+            sysfs.discover()
+            cls.sysfs = sysfs
+        return sysfs
+
     @classmethod
+    def close_sysfs(cls) -> None:
+        """
+        Close the sysfs reader of the AMD GPUs, its cards are discovered again on the next read.
+        """
+        if cls.sysfs is not None:
+            cls.sysfs.close()
+            cls.sysfs = None
+
+    @classmethod
+    @TELEMETRY.timed(kind="sensor", name="amd_smi")
     def launch_shell_command(cls) -> Tuple[bytes, int]:
         """
         Launch a shell command to query AMD GPU power.
@@ -82,7 +581,7 @@ class AMDGPU(BaseModel):
         rocm_smi_path = shutil.which("rocm-smi")
         if rocm_smi_path is not None:
             result = subprocess.run(
-                [rocm_smi_path, "--showpower"],
+                [rocm_smi_path, "--showpower", "--showuse", "--showuniqueid", "--showproductname"],
                 capture_output=True,
             )
             return result.stdout, result.returncode
@@ -91,13 +590,73 @@ class AMDGPU(BaseModel):
         amd_smi_path = shutil.which("amd-smi")
         if amd_smi_path is not None:
             result = subprocess.run(
-                [amd_smi_path, "metric", "--power"],
+                [amd_smi_path, "metric", "--power", "--usage"],
                 capture_output=True,
             )
             return result.stdout, result.returncode
 
         raise HardwareNoGPUDetectedException("AMD GPU tools (rocm-smi or amd-smi) not found in PATH.")
 
+    @classmethod
+    def parse_gpu_devices(cls, output: str) -> List[GPUDevice]:
+        """
+        Parse the usage of each GPU from the rocm-smi or amd-smi output.
+
+        :param output: the output of the tool
+        :return: the GPU devices with a reported power
+        """
+        powers: Dict[int, float] = {}
+        utilizations: Dict[int, float] = {}
+        uuids: Dict[int, str] = {}
+        names: Dict[int, str] = {}
+        index = 0
+        for line in output.splitlines():
+            index_match = _RE_AMD_GPU_INDEX.match(line)
+            if index_match:
+                index = int(index_match.group(1) or index_match.group(2))
+            if power_match := _RE_POWER_W.search(line) or _RE_POWER_USAGE_W.search(line):
+                if index in powers:
+                    index = max(powers) + 1
+                powers[index] = float(power_match.group(1))
+            elif utilization_match := _RE_AMD_UTILIZATION.search(line):
+                utilizations[index] = float(utilization_match.group(1))
+            elif uuid_match := _RE_AMD_UUID.search(line):
+                uuids[index] = uuid_match.group(1)
+            elif name_match := _RE_AMD_NAME.search(line):
+                names[index] = name_match.group(1)
+        return [
+            GPUDevice.model_construct(
+                index=index,
+                uuid=uuids.get(index),
+                name=names.get(index),
+                power=power,
+                utilization=utilizations.get(index),
+                memory_used=None,
+            )
+            for index, power in sorted(powers.items())
+        ]
+
+    @classmethod
+    def get_gpu_devices(cls) -> List[GPUDevice]:
+        """
+        Get the usage of each AMD GPU.
+
+        :return: the GPU devices
+        """
+        try:
+            sysfs = cls.get_sysfs()
+            if sysfs.cards:
+                return sysfs.get_gpu_devices()
+        except (OSError, ValueError) as exception:
+            logger.debug(f"AMD GPU sysfs read failed, falling back to the AMD GPU tools: {exception}")
+            cls.close_sysfs()
+        gpu_output, return_code = cls.launch_shell_command()
+        if return_code == 0:
+            devices = cls.parse_gpu_devices(output=gpu_output.decode())
+            if sum(device.power for device in devices) > 0:
+                return devices
+        raise HardwareNoGPUDetectedException("No AMD GPU detected or unable to read power.")
+
     @classmethod
     def get_gpu_power_usage(cls) -> float:
         """
@@ -106,17 +665,7 @@ class AMDGPU(BaseModel):
 
         :return: the total gpu power usage in W
         """
-        gpu_output, return_code = cls.launch_shell_command()
-        if return_code == 0:
-            total_power = 0.0
-            output_str = gpu_output.decode()
-            power_matches = _RE_POWER_W.findall(output_str)
-            power_matches += _RE_POWER_USAGE_W.findall(output_str)
-            for power_str in power_matches:
-                total_power += float(power_str)
-            if total_power > 0:
-                return total_power
-        raise HardwareNoGPUDetectedException("No AMD GPU detected or unable to read power.")
+        return sum(device.power for device in cls.get_gpu_devices())
 
 
 class AppleSiliconPowerMetrics(BaseModel):
@@ -127,6 +676,7 @@ class AppleSiliconPowerMetrics(BaseModel):
     """
 
     @classmethod
+    @TELEMETRY.timed(kind="sensor", name="powermetrics")
     def _run_powermetrics(cls, samplers: str) -> Tuple[bytes, int]:
         """
         Run powermetrics with the given samplers.
@@ -267,37 +817,94 @@ class GPUInfo(ABC, BaseModel):
     """
     GPU information with auto-detection and graceful fallback.
     Tries all available GPU types and returns 0.0 if none found.
+
+    The GPU vendor can also be detected once, to only query the tool of this vendor afterwards.
     """
 
+    VENDORS: ClassVar[Dict[str, type[NvidiaGPU] | type[AMDGPU] | type[AppleSiliconGPU]]] = {
+        "apple_silicon": AppleSiliconGPU,
+        "nvidia": NvidiaGPU,
+        "amd": AMDGPU,
+    }
+
     @classmethod
-    def get_gpu_power_usage(cls) -> float:
+    def get_platform_vendors(cls) -> List[str]:
         """
-        Get the GPU power usage in watts.
-        Auto-detects GPU type and falls back to 0.0 if no GPU is found.
+        Get the GPU vendors supported on the platform, in order of preference.
 
-        :return: the gpu power usage in W, or 0.0 if no GPU detected
+        :return: the names of the vendors
         """
         platform_name = platform.system()
-
+        vendors = []
         # Try platform-specific GPU first
         if platform_name == "Darwin":
+            vendors.append("apple_silicon")
+        # Try NVIDIA (works on Linux, Windows, and Intel Macs)
+        vendors.append("nvidia")
+        # Try AMD (Linux)
+        if platform_name == "Linux":
+            vendors.append("amd")
+        return vendors
+
+    @classmethod
+    def detect_gpu_vendor(cls) -> str | None:
+        """
+        Detect the GPU vendor whose tool reports the GPU power usage.
+
+        :return: the name of the vendor, or None if no GPU detected
+        """
+        for vendor in cls.get_platform_vendors():
             try:
-                return AppleSiliconGPU.get_gpu_power_usage()
+                gpu = cls.VENDORS[vendor]
+                if issubclass(gpu, NvidiaGPU):
+                    # The streaming sampler may have no sample yet, the one-shot query is run instead
+                    gpu.query_gpu_devices()
+                else:
+                    gpu.get_gpu_power_usage()
+                logger.debug(f"GPU detected with the {vendor} vendor")
+                return vendor
             except HardwareNoGPUDetectedException:
-                logger.debug("Apple Silicon GPU not available")
+                logger.debug(f"{vendor} GPU not available")
+        return None
 
-        # Try NVIDIA (works on Linux, Windows, and Intel Macs)
-        try:
-            return NvidiaGPU.get_gpu_power_usage()
-        except HardwareNoGPUDetectedException:
-            logger.debug("NVIDIA GPU not available")
+    @classmethod
+    def get_vendor_gpu_power_usage(cls, vendor: str) -> float:
+        """
+        Get the GPU power usage in watts from the tool of a detected vendor.
 
-        # Try AMD (Linux)
-        if platform_name == "Linux":
+        :param vendor: the name of the vendor
+        :return: the gpu power usage in W
+        :raises HardwareNoGPUDetectedException: if the tool of the vendor no longer reports the GPU power usage
+        """
+        return cls.VENDORS[vendor].get_gpu_power_usage()
+
+    @classmethod
+    def get_vendor_gpu_devices(cls, vendor: str) -> List[GPUDevice] | None:
+        """
+        Get the usage of each GPU from the tool of a detected vendor, in a single query.
+
+        :param vendor: the name of the vendor
+        :return: the GPU devices, or None if the tool of the vendor only reports the total power
+        :raises HardwareNoGPUDetectedException: if the tool of the vendor no longer reports the GPU power usage
+        """
+        gpu = cls.VENDORS[vendor]
+        if issubclass(gpu, (NvidiaGPU, AMDGPU)):
+            return gpu.get_gpu_devices()
+        return None
+
+    @classmethod
+    def get_gpu_power_usage(cls) -> float:
+        """
+        Get the GPU power usage in watts.
+        Auto-detects GPU type and falls back to 0.0 if no GPU is found.
+
+        :return: the gpu power usage in W, or 0.0 if no GPU detected
+        """
+        for vendor in cls.get_platform_vendors():
             try:
-                return AMDGPU.get_gpu_power_usage()
+                return cls.VENDORS[vendor].get_gpu_power_usage()
             except HardwareNoGPUDetectedException:
-                logger.debug("AMD GPU not available")
+                logger.debug(f"{vendor} GPU not available")
 
         # No GPU found - return 0.0 (graceful fallback)
         logger.debug("No GPU detected, returning 0.0W")
@@ -4,6 +4,7 @@ import psutil
 from pydantic import BaseModel
 
 from tracarbon.hardwares.gpu import GPUInfo
+from tracarbon.telemetry import TELEMETRY
 
 __all__ = [
     "HardwareInfo",
@@ -35,6 +36,7 @@ class HardwareInfo(BaseModel):
         return psutil.cpu_count(logical=logical)
 
     @staticmethod
+    @TELEMETRY.timed(kind="sensor", name="psutil")
     def get_cpu_usage(interval: float | None = None) -> float:
         """
         Get the CPU load percentage usage.
@@ -45,6 +47,7 @@ class HardwareInfo(BaseModel):
         return psutil.cpu_percent(interval=interval)
 
     @staticmethod
+    @TELEMETRY.timed(kind="sensor", name="psutil")
     def get_memory_usage() -> float:
         """
         Get the local memory usage.
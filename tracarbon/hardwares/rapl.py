@@ -1,21 +1,35 @@
 import os
 import re
+import time
+import weakref
+from array import array
 from datetime import datetime
 from pathlib import Path
+from threading import Event
+from threading import Lock
+from threading import Thread
 from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Tuple
 
-import aiofiles
 from loguru import logger
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from tracarbon.exceptions import HardwareRAPLException
+from tracarbon.hardwares.energy import EnergyBreakdown
 from tracarbon.hardwares.energy import EnergyUsage
 from tracarbon.hardwares.energy import Power
+from tracarbon.hardwares.energy import UsageType
+from tracarbon.hardwares.sysfs import read_sysfs_counter
+from tracarbon.telemetry import TELEMETRY
 
 __all__ = [
     "RAPLResult",
+    "EnergyRingBuffer",
+    "RAPLSampler",
     "RAPL",
 ]
 
@@ -23,23 +37,272 @@ __all__ = [
 class RAPLResult(BaseModel):
     """
     RAPL result after reading the RAPL registry.
+
+    The monotonic timestamp in nanoseconds times the deltas, the wall-clock timestamp is kept for display.
     """
 
     name: str
     energy_uj: float
     max_energy_uj: float
     timestamp: datetime
+    timestamp_ns: int | None = None
+
+
+class RAPLDomain:
+    """
+    RAPL domain discovered once: its constant name, maximum range, classification and socket,
+    and the file descriptor of its energy counter kept open.
+    """
+
+    __slots__ = ("name", "max_energy_uj", "domain", "socket", "fd")
+
+    def __init__(self, name: str, max_energy_uj: float, domain: str, fd: int, socket: str = "") -> None:
+        self.name = name
+        self.max_energy_uj = max_energy_uj
+        self.domain = domain
+        self.socket = socket
+        self.fd = fd
+
+
+def _close_domains(domains: List[RAPLDomain]) -> None:
+    for domain in domains:
+        try:
+            os.close(domain.fd)
+        except OSError:
+            pass
+    domains.clear()
+
+
+class EnergyRingBuffer:
+    """
+    Fixed-size ring buffer of the samples of energy counters: a monotonic timestamp in nanoseconds
+    and the cumulative energy of each counter in microjoules, the oldest samples being overwritten.
+    """
+
+    __slots__ = ("capacity", "width", "timestamps", "energies", "count")
+
+    def __init__(self, capacity: int, width: int) -> None:
+        if capacity < 2:
+            raise ValueError(f"The capacity of the ring buffer must be at least 2, got {capacity}.")
+        self.capacity = capacity
+        self.width = width
+        self.timestamps = array("q", bytes(8 * capacity))
+        self.energies = array("d", bytes(8 * capacity * width))
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, timestamp_ns: int, energies_uj: Iterable[float]) -> None:
+        """
+        Append a sample, overwriting the oldest one when the buffer is full.
+
+        :param timestamp_ns: the monotonic timestamp of the sample in nanoseconds
+        :param energies_uj: the cumulative energy of each counter in microjoules
+        """
+        index = self.count % self.capacity
+        self.timestamps[index] = timestamp_ns
+        offset = index * self.width
+        for position, energy_uj in enumerate(energies_uj):
+            self.energies[offset + position] = energy_uj
+        self.count += 1
+
+    def samples(self) -> List[Tuple[int, List[float]]]:
+        """
+        Get the samples of the buffer, from the oldest to the newest.
+
+        :return: the timestamps in nanoseconds with the cumulative energies in microjoules
+        """
+        start = self.count - len(self)
+        samples = []
+        for sample in range(start, self.count):
+            index = sample % self.capacity
+            offset = index * self.width
+            samples.append((self.timestamps[index], self.energies[offset : offset + self.width].tolist()))
+        return samples
+
+    def power_samples(self) -> List[Tuple[int, List[float]]]:
+        """
+        Get the power between consecutive samples of the buffer, to observe the spikes averaged by the reports.
+
+        :return: the timestamps in nanoseconds with the power of each counter in watts
+        """
+        samples = self.samples()
+        power_samples = []
+        for (previous_timestamp, previous_energies), (timestamp, energies) in zip(samples, samples[1:], strict=False):
+            duration_in_seconds = (timestamp - previous_timestamp) / 1e9
+            if duration_in_seconds <= 0:
+                continue
+            power_samples.append(
+                (
+                    timestamp,
+                    [
+                        Power.watts_from_microjoules((energy - previous_energy) / duration_in_seconds)
+                        for previous_energy, energy in zip(previous_energies, energies, strict=True)
+                    ],
+                )
+            )
+        return power_samples
+
+
+class RAPLSampler:
+    """
+    Background sampler of the RAPL energy counters at a high frequency.
+
+    The wrap-around of the counters is handled on every sample, so the fast-wrapping domains are integrated exactly:
+    the energy of each domain is accumulated since the start of the sampler and kept with its monotonic timestamp
+    in a ring buffer.
+    """
+
+    __slots__ = (
+        "domains",
+        "frequency_in_hz",
+        "buffer",
+        "energies_uj",
+        "counters_uj",
+        "timestamp_ns",
+        "wrap_count",
+        "_lock",
+        "_stopping",
+        "_thread",
+    )
+
+    MINIMUM_FREQUENCY_IN_HZ = 10.0
+    MAXIMUM_FREQUENCY_IN_HZ = 1000.0
+
+    def __init__(self, domains: List[RAPLDomain], frequency_in_hz: float, buffer_size: int = 4096) -> None:
+        if not self.MINIMUM_FREQUENCY_IN_HZ <= frequency_in_hz <= self.MAXIMUM_FREQUENCY_IN_HZ:
+            raise ValueError(
+                f"The RAPL sampling frequency must be between {self.MINIMUM_FREQUENCY_IN_HZ} and "
+                f"{self.MAXIMUM_FREQUENCY_IN_HZ} Hz, got {frequency_in_hz}."
+            )
+        self.domains = domains
+        self.frequency_in_hz = frequency_in_hz
+        self.buffer = EnergyRingBuffer(capacity=buffer_size, width=len(domains))
+        self.energies_uj = [0.0] * len(domains)
+        self.counters_uj: List[float] = []
+        self.timestamp_ns = 0
+        self.wrap_count = 0
+        self._lock = Lock()
+        self._stopping = Event()
+        self._thread: Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the sampler thread is running.
+
+        :return: if the sampler is running
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def sample(self) -> None:
+        """
+        Read the energy counters, accumulate their increase since the previous sample and append it to the buffer.
+        """
+        counters_uj = [float(read_sysfs_counter(domain.fd)) for domain in self.domains]
+        timestamp_ns = time.monotonic_ns()
+        with self._lock:
+            if self.counters_uj:
+                for index, (domain, previous_uj, counter_uj) in enumerate(
+                    zip(self.domains, self.counters_uj, counters_uj, strict=True)
+                ):
+                    increase_uj = counter_uj - previous_uj
+                    if increase_uj < 0:
+                        increase_uj += domain.max_energy_uj
+                        self.wrap_count += 1
+                    self.energies_uj[index] += increase_uj
+            self.counters_uj = counters_uj
+            self.timestamp_ns = timestamp_ns
+            self.buffer.append(timestamp_ns=timestamp_ns, energies_uj=self.energies_uj)
+
+    def snapshot(self) -> Tuple[int, List[float]]:
+        """
+        Get the latest sample.
+
+        :return: the monotonic timestamp in nanoseconds and the cumulative energy of each domain in microjoules
+        """
+        with self._lock:
+            return self.timestamp_ns, list(self.energies_uj)
+
+    def start(self) -> None:
+        """
+        Take the first sample and start sampling in a background thread.
+        """
+        if self.is_running:
+            return
+        self.sample()
+        self._stopping.clear()
+        self._thread = Thread(target=self._run, name="tracarbon-rapl-sampler", daemon=True)
+        self._thread.start()
+        logger.debug(f"The RAPL sampler started at {self.frequency_in_hz} Hz.")
+
+    def stop(self) -> None:
+        """
+        Stop the sampler thread.
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        period = 1 / self.frequency_in_hz
+        deadline = time.monotonic() + period
+        while not self._stopping.wait(max(deadline - time.monotonic(), 0)):
+            try:
+                self.sample()
+            except ValueError:
+                logger.debug("The RAPL sampler skipped an unreadable sample.")
+            except OSError:
+                logger.exception("The RAPL sampler stopped on a read error.")
+                return
+            deadline += period
+            now = time.monotonic()
+            if deadline < now:
+                deadline = now + period
 
 
 class RAPL(BaseModel):
     """
     RAPL to read energy consumption with Intel hardware
+
+    The domains are discovered once: their names and maximum ranges are read once and the energy counters
+    are kept open, so a tick reads all the counters in one pass without opening any file.
+
+    With a sampling frequency, the counters are sampled in the background and a report is the energy integrated
+    exactly between the latest samples of two reports, divided by their exact duration.
+
+    A report carries the breakdown of the power of each domain of each socket, and the energy of each type
+    accumulated from the wrapped counter deltas of every reading since the first one.
     """
 
     path: str = "/sys/class/powercap/intel-rapl"
     rapl_separator: str = ":"
     rapl_results: Dict[str, RAPLResult] = Field(default_factory=dict)
     file_list: List[str] = Field(default_factory=list)
+    sampling_frequency_in_hz: float | None = Field(
+        default=None,
+        ge=RAPLSampler.MINIMUM_FREQUENCY_IN_HZ,
+        le=RAPLSampler.MAXIMUM_FREQUENCY_IN_HZ,
+    )
+    sampling_buffer_size: int = Field(default=4096, ge=2)
+    _domains: List[RAPLDomain] = PrivateAttr(default_factory=list)
+    _domain_types: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _domain_sockets: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _breakdown_labels: Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]] = PrivateAttr(default=((), (), ()))
+    _sampler: RAPLSampler | None = PrivateAttr(default=None)
+    _sampler_snapshot: Tuple[int, List[float]] | None = PrivateAttr(default=None)
+    _energy_totals_uj: Dict[str, float] = PrivateAttr(default_factory=dict)
+
+    @property
+    def sampler(self) -> RAPLSampler | None:
+        """
+        Get the background sampler of the energy counters.
+
+        :return: the sampler or None if it is not started
+        """
+        return self._sampler
 
     def is_rapl_compatible(self) -> bool:
         """
@@ -68,38 +331,79 @@ class RAPL(BaseModel):
                 self.file_list.append(directory_path)
         logger.debug(f"The RAPL file list collected: {self.file_list}.")
 
+    def _discover_domains(self) -> None:
+        """
+        Discover the RAPL domains: read their constant files once and open their energy counters.
+        """
+        if not self.file_list:
+            self.get_rapl_files_list()
+        domains: List[RAPLDomain] = []
+        try:
+            for file_path in self.file_list:
+                name_prefix = Path(file_path).name.replace("intel-rapl", "")
+                with open(f"{file_path}/name") as rapl_name:
+                    name = f"{name_prefix}-{rapl_name.read()}"
+                with open(f"{file_path}/max_energy_range_uj") as rapl_max_energy:
+                    max_energy_uj = float(rapl_max_energy.read())
+                domain = self._classify_domain(name)
+                # The directories are named intel-rapl:<socket>[:<subdomain>]
+                directory_parts = Path(file_path).name.split(self.rapl_separator)
+                socket = directory_parts[1] if len(directory_parts) >= 2 else ""
+                domains.append(
+                    RAPLDomain(
+                        name=name,
+                        max_energy_uj=max_energy_uj,
+                        domain=domain,
+                        fd=os.open(f"{file_path}/energy_uj", os.O_RDONLY),
+                        socket=socket,
+                    )
+                )
+                self._domain_types[name] = domain
+                self._domain_sockets[name] = socket
+        except Exception:
+            _close_domains(domains)
+            raise
+        self._domains = domains
+        weakref.finalize(self, _close_domains, domains)
+        logger.debug(f"The RAPL domains discovered: {[domain.name for domain in domains]}.")
+
+    def close(self) -> None:
+        """
+        Stop the sampler and close the energy counters, they are discovered again on the next read.
+        """
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+            self._sampler_snapshot = None
+        _close_domains(self._domains)
+
     async def get_rapl_power_usage(self) -> List[RAPLResult]:
         """
-        Read the RAPL energy measurements files on paths provided.
+        Read the energy counters of the RAPL domains in one pass.
 
         If energy_uj is greater than max_energy_range_uj, the value is set to 0.
         In this case, max_energy_range_uj contanst must be returned.
 
         :return: a list of the RAPL results.
         """
-        rapl_results = list()
         try:
-            if not self.file_list:
-                self.get_rapl_files_list()
-            for file_path in self.file_list:
-                name_prefix = Path(file_path).name.replace("intel-rapl", "")
-                async with aiofiles.open(f"{file_path}/name") as rapl_name:
-                    name = await rapl_name.read()
-                    name = f"{name_prefix}-{name}"
-                    async with aiofiles.open(f"{file_path}/energy_uj") as rapl_energy:
-                        energy_uj = float(await rapl_energy.read())
-                    async with aiofiles.open(f"{file_path}/max_energy_range_uj") as rapl_max_energy:
-                        max_energy_uj = float(await rapl_max_energy.read())
-                    rapl_results.append(
-                        RAPLResult(
-                            name=name,
-                            energy_uj=energy_uj,
-                            max_energy_uj=max_energy_uj,
-                            timestamp=datetime.now(),
-                        )
-                    )
+            if not self._domains:
+                self._discover_domains()
+            timestamp = datetime.now()
+            timestamp_ns = time.monotonic_ns()
+            rapl_results = [
+                RAPLResult.model_construct(
+                    name=domain.name,
+                    energy_uj=float(read_sysfs_counter(domain.fd)),
+                    max_energy_uj=domain.max_energy_uj,
+                    timestamp=timestamp,
+                    timestamp_ns=timestamp_ns,
+                )
+                for domain in self._domains
+            ]
         except Exception as exception:
             logger.exception("The RAPL read encountered an issue.")
+            self.close()
             raise HardwareRAPLException(exception) from exception
         logger.debug(f"The RAPL results: {rapl_results}.")
         return rapl_results
@@ -123,23 +427,80 @@ class RAPL(BaseModel):
             return "cpu"
         return "unknown"
 
-    async def get_energy_report(self) -> EnergyUsage:
+    def _start_sampler(self) -> RAPLSampler:
         """
-        Get the energy report based on RAPL.
+        Discover the domains and start sampling them in the background.
 
-        :return: the energy usage report of the RAPL measurements
+        :return: the started sampler
+        """
+        if not self._domains:
+            self._discover_domains()
+        sampler = RAPLSampler(
+            domains=self._domains,
+            frequency_in_hz=float(self.sampling_frequency_in_hz or RAPLSampler.MINIMUM_FREQUENCY_IN_HZ),
+            buffer_size=self.sampling_buffer_size,
+        )
+        sampler.start()
+        weakref.finalize(self, sampler.stop)
+        self._sampler = sampler
+        self._sampler_snapshot = sampler.snapshot()
+        return sampler
+
+    def get_sampled_power_usage(self) -> Tuple[List[Tuple[str, float]], float]:
+        """
+        Get the power of the RAPL domains from the energy integrated by the sampler since the previous call.
+
+        :return: the name and the power in watts of each domain, and the duration they were measured over in seconds
+        """
+        try:
+            sampler = self._sampler if self._sampler is not None else self._start_sampler()
+            if not sampler.is_running:
+                raise HardwareRAPLException("The RAPL sampler is not running.")
+        except Exception as exception:
+            logger.exception("The RAPL sampler encountered an issue.")
+            self.close()
+            if isinstance(exception, HardwareRAPLException):
+                raise
+            raise HardwareRAPLException(exception) from exception
+        timestamp_ns, energies_uj = sampler.snapshot()
+        previous_timestamp_ns, previous_energies_uj = self._sampler_snapshot or (timestamp_ns, energies_uj)
+        self._sampler_snapshot = (timestamp_ns, energies_uj)
+        duration_in_seconds = (timestamp_ns - previous_timestamp_ns) / 1e9
+        power_usage = []
+        domains = sampler.domains
+        for domain, previous_energy_uj, energy_uj in zip(domains, previous_energies_uj, energies_uj, strict=True):
+            energy_delta_uj = energy_uj - previous_energy_uj
+            self._energy_totals_uj[domain.name] = self._energy_totals_uj.get(domain.name, 0.0) + energy_delta_uj
+            watts = 0.0
+            if duration_in_seconds > 0:
+                watts = Power.watts_from_microjoules(energy_delta_uj / duration_in_seconds)
+            power_usage.append((domain.name, watts))
+        return power_usage, duration_in_seconds
+
+    async def get_snapshot_power_usage(self) -> Tuple[List[Tuple[str, float]], float]:
+        """
+        Get the power of the RAPL domains from the energy counters read now and at the previous call.
+
+        :return: the name and the power in watts of each domain, and the duration they were measured over in seconds
         """
         rapl_results = await self.get_rapl_power_usage()
-        host_energy_usage_watts = 0.0
-        cpu_energy_usage_watts = 0.0
-        memory_energy_usage_watts = 0.0
-        gpu_energy_usage_watts = 0.0
+        power_usage = []
+        duration_in_seconds = 0.0
         for rapl_result in rapl_results:
-            previous_rapl_result = self.rapl_results.get(rapl_result.name, rapl_result)
-            # Round to the nearest second to make calculation stable over small IO delays
-            time_difference_seconds = round((rapl_result.timestamp - previous_rapl_result.timestamp).total_seconds())
+            previous_rapl_result = self.rapl_results.get(rapl_result.name)
+            self.rapl_results[rapl_result.name] = rapl_result
+            energy_total_uj = self._energy_totals_uj.setdefault(rapl_result.name, 0.0)
+            if previous_rapl_result is None:
+                # The first reading is the baseline: no energy is measured yet
+                power_usage.append((rapl_result.name, 0.0))
+                continue
+            if rapl_result.timestamp_ns is not None and previous_rapl_result.timestamp_ns is not None:
+                time_difference_seconds = (rapl_result.timestamp_ns - previous_rapl_result.timestamp_ns) / 1e9
+            else:
+                time_difference_seconds = (rapl_result.timestamp - previous_rapl_result.timestamp).total_seconds()
             if time_difference_seconds <= 0:
-                time_difference_seconds = 1
+                power_usage.append((rapl_result.name, 0.0))
+                continue
             energy_uj = rapl_result.energy_uj
             if previous_rapl_result.energy_uj > rapl_result.energy_uj:
                 logger.debug(
@@ -148,9 +509,77 @@ class RAPL(BaseModel):
                     f"is lower than previous value ({previous_rapl_result.energy_uj})."
                 )
                 energy_uj = energy_uj + rapl_result.max_energy_uj
+            self._energy_totals_uj[rapl_result.name] = energy_total_uj + energy_uj - previous_rapl_result.energy_uj
             watts = Power.watts_from_microjoules((energy_uj - previous_rapl_result.energy_uj) / time_difference_seconds)
-            self.rapl_results[rapl_result.name] = rapl_result
-            domain = self._classify_domain(rapl_result.name)
+            power_usage.append((rapl_result.name, watts))
+            duration_in_seconds = time_difference_seconds
+        return power_usage, duration_in_seconds
+
+    async def prime(self) -> None:
+        """
+        Take the baseline reading of the energy counters, or start the sampler, so the first report
+        covers the interval since the priming.
+        """
+        if self.sampling_frequency_in_hz is not None:
+            if self._sampler is None:
+                self.get_sampled_power_usage()
+        else:
+            await self.get_snapshot_power_usage()
+
+    def _get_breakdown(self, names: Tuple[str, ...], watts: array) -> EnergyBreakdown:
+        """
+        Get the breakdown of the power of the domains, their labels being built once for the discovered domains.
+
+        :param names: the names of the domains
+        :param watts: the power of the domains in watts
+        :return: the breakdown
+        """
+        labels = self._breakdown_labels
+        if labels[0] != names:
+            labels = (
+                names,
+                tuple(self._domain_types.get(name) or self._classify_domain(name) for name in names),
+                tuple(self._domain_sockets.get(name, "") for name in names),
+            )
+            self._breakdown_labels = labels
+        return EnergyBreakdown(names=labels[0], domains=labels[1], sockets=labels[2], watts=watts)
+
+    def _get_energy_totals(self) -> Dict[UsageType, float]:
+        """
+        Get the energy of each type accumulated since the first reading, of the types of the read domains.
+
+        :return: the energy totals in joules
+        """
+        energy_totals = {UsageType.HOST: 0.0}
+        for name, energy_total_uj in self._energy_totals_uj.items():
+            domain = self._domain_types.get(name) or self._classify_domain(name)
+            joules = Power.watts_from_microjoules(energy_total_uj)
+            if domain in ("package", "memory"):
+                energy_totals[UsageType.HOST] += joules
+            for usage_type in (UsageType.CPU, UsageType.MEMORY, UsageType.GPU):
+                if domain == usage_type.value:
+                    energy_totals[usage_type] = energy_totals.get(usage_type, 0.0) + joules
+        return energy_totals
+
+    @TELEMETRY.timed(kind="sensor", name="rapl")
+    async def get_energy_report(self) -> EnergyUsage:
+        """
+        Get the energy report based on RAPL.
+
+        :return: the energy usage report of the RAPL measurements
+        """
+        if self.sampling_frequency_in_hz is not None:
+            power_usage, duration_in_seconds = self.get_sampled_power_usage()
+        else:
+            power_usage, duration_in_seconds = await self.get_snapshot_power_usage()
+        host_energy_usage_watts = 0.0
+        cpu_energy_usage_watts = 0.0
+        memory_energy_usage_watts = 0.0
+        gpu_energy_usage_watts = 0.0
+        breakdown_watts = array("d")
+        for name, watts in power_usage:
+            breakdown_watts.append(watts)
+            domain = self._domain_types.get(name) or self._classify_domain(name)
             if domain in ("package", "memory"):
                 host_energy_usage_watts += watts
             if domain == "cpu":
@@ -164,6 +593,9 @@ class RAPL(BaseModel):
             cpu_energy_usage=(cpu_energy_usage_watts if cpu_energy_usage_watts > 0 else None),
             memory_energy_usage=(memory_energy_usage_watts if memory_energy_usage_watts > 0 else None),
             gpu_energy_usage=(gpu_energy_usage_watts if gpu_energy_usage_watts > 0 else None),
+            duration_in_seconds=duration_in_seconds,
+            breakdown=self._get_breakdown(names=tuple(name for name, _ in power_usage), watts=breakdown_watts),
+            energy_totals_in_joules=self._get_energy_totals(),
         )
         logger.debug(f"The usage energy report measured with RAPL is {energy_usage_report}.")
         return energy_usage_report
@@ -0,0 +1,95 @@
+import asyncio
+from contextvars import ContextVar
+from contextvars import Token
+from typing import Any
+from typing import Dict
+
+from tracarbon.hardwares.energy import EnergyUsage
+from tracarbon.hardwares.sensors import EnergyConsumption
+
+__all__ = [
+    "TickContext",
+    "SampleBus",
+]
+
+_current_tick: ContextVar["TickContext | None"] = ContextVar("tracarbon_current_tick", default=None)
+
+
+class TickContext:
+    """
+    Context of one tick: every sensor sampled through a SampleBus inside it is read exactly once.
+
+    The context is propagated to the tasks created inside it, so the concurrent metric generators of a tick share it.
+    """
+
+    __slots__ = ("samples", "primings", "_token")
+
+    def __init__(self) -> None:
+        self.samples: Dict[int, asyncio.Future[EnergyUsage]] = {}
+        self.primings: Dict[int, asyncio.Future[None]] = {}
+        self._token: Token[TickContext | None] | None = None
+
+    @staticmethod
+    def current() -> "TickContext | None":
+        """
+        Get the tick context of the running tick.
+
+        :return: the current tick context or None outside a tick
+        """
+        return _current_tick.get()
+
+    def __enter__(self) -> "TickContext":
+        self._token = _current_tick.set(self)
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        if self._token is not None:
+            _current_tick.reset(self._token)
+            self._token = None
+
+
+class SampleBus(EnergyConsumption):
+    """
+    Energy consumption shared by several metric generators.
+
+    Inside a tick, the wrapped sensor is read once and every consumer gets a copy of the same energy usage snapshot,
+    so the generators do not read the hardware several times nor corrupt the RAPL delta windows of each other.
+    Outside a tick, each call reads the wrapped sensor.
+    """
+
+    energy_consumption: EnergyConsumption
+
+    def __init__(self, **data: Any) -> None:
+        if "energy_consumption" not in data:
+            data["energy_consumption"] = EnergyConsumption.from_platform()
+        super().__init__(**data)
+
+    async def get_energy_usage(self) -> EnergyUsage:
+        """
+        Get the energy usage sampled for the current tick.
+
+        :return: a copy of the energy usage snapshot of the tick.
+        """
+        tick = TickContext.current()
+        if tick is None:
+            return await self.energy_consumption.get_energy_usage()
+        sample = tick.samples.get(id(self))
+        if sample is None:
+            sample = asyncio.ensure_future(self.energy_consumption.get_energy_usage())
+            tick.samples[id(self)] = sample
+        energy_usage = await asyncio.shield(sample)
+        return energy_usage.model_copy()
+
+    async def prime(self) -> None:
+        """
+        Prime the wrapped sensor, once per tick for all the consumers.
+        """
+        tick = TickContext.current()
+        if tick is None:
+            await self.energy_consumption.prime()
+            return
+        priming = tick.primings.get(id(self))
+        if priming is None:
+            priming = asyncio.ensure_future(self.energy_consumption.prime())
+            tick.primings[id(self)] = priming
+        await asyncio.shield(priming)
@@ -1,17 +1,22 @@
 import asyncio
 import csv
 import importlib.resources
+import time
 from abc import ABC
 from abc import abstractmethod
 from typing import Any
+from typing import List
+from typing import Tuple
 
 from loguru import logger
 from pydantic import BaseModel
 from pydantic import ConfigDict
+from pydantic import PrivateAttr
 
 from tracarbon.exceptions import AWSSensorException
 from tracarbon.exceptions import AzureSensorException
 from tracarbon.exceptions import GCPSensorException
+from tracarbon.exceptions import HardwareNoGPUDetectedException
 from tracarbon.exceptions import TracarbonException
 from tracarbon.hardwares.amd_rapl import AMDRAPL
 from tracarbon.hardwares.cloud_providers import AWS
@@ -19,13 +24,19 @@ from tracarbon.hardwares.cloud_providers import GCP
 from tracarbon.hardwares.cloud_providers import Azure
 from tracarbon.hardwares.cloud_providers import CloudProviders
 from tracarbon.hardwares.energy import EnergyUsage
+from tracarbon.hardwares.energy import GPUDevice
+from tracarbon.hardwares.energy import UsageType
 from tracarbon.hardwares.gpu import AppleSiliconPowerMetrics
 from tracarbon.hardwares.gpu import GPUInfo
+from tracarbon.hardwares.gpu import NvidiaGPU
 from tracarbon.hardwares.hardware import HardwareInfo
 from tracarbon.hardwares.rapl import RAPL
+from tracarbon.hooks import HOOKS
+from tracarbon.hooks import HookPoint
 
 __all__ = [
     "Sensor",
+    "SensorPlan",
     "EnergyConsumption",
     "MacEnergyConsumption",
     "LinuxEnergyConsumption",
@@ -46,10 +57,17 @@ __all__ = [
 class Sensor(ABC, BaseModel):
     """
     The Sensor contract.
+
+    The get_energy_usage implementations of the subclasses are surrounded by the sensor hooks.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        HOOKS.hook_method(cls=cls, name="get_energy_usage", point=HookPoint.SENSOR)
+
     @abstractmethod
     async def get_energy_usage(self) -> EnergyUsage:
         """
@@ -59,6 +77,13 @@ class Sensor(ABC, BaseModel):
         """
         pass
 
+    async def prime(self) -> None:
+        """
+        Take a baseline reading, so the first energy usage covers the interval since the priming.
+        Nothing is read by default.
+        """
+        pass
+
 
 class EnergyConsumption(Sensor):
     """
@@ -125,11 +150,12 @@ class MacEnergyConsumption(EnergyConsumption):
 
         Tries powermetrics first for per-component breakdown (CPU, GPU, ANE),
         falls back to ioreg AdapterPower + separate GPU query.
+        The blocking queries run in a thread, so they do not block the event loop.
 
         :return: the generated energy usage.
         """
         try:
-            cpu_power, gpu_power, ane_power = AppleSiliconPowerMetrics.get_power_breakdown()
+            cpu_power, gpu_power, ane_power = await asyncio.to_thread(AppleSiliconPowerMetrics.get_power_breakdown)
             if cpu_power is not None or gpu_power is not None:
                 if self._active_sensor != "powermetrics":
                     logger.info("Using powermetrics for energy measurement (CPU + GPU + ANE)")
@@ -153,7 +179,7 @@ class MacEnergyConsumption(EnergyConsumption):
         )
         result, _ = await proc.communicate()
 
-        gpu_power = GPUInfo.get_gpu_power_usage_or_none()
+        gpu_power = await asyncio.to_thread(GPUInfo.get_gpu_power_usage_or_none)
 
         try:
             host_power = float(result)
@@ -164,6 +190,20 @@ class MacEnergyConsumption(EnergyConsumption):
         return EnergyUsage(host_energy_usage=host_power, gpu_energy_usage=gpu_power)
 
 
+class SensorPlan(BaseModel):
+    """
+    The sensors detected on a host: the CPU energy sensor and the GPU vendor, None if not available.
+
+    The plan is immutable: a new plan is probed when it expires or when one of its sensors fails.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    cpu_sensor: str | None = None
+    gpu_vendor: str | None = None
+    probed_at: float = 0.0
+
+
 class LinuxEnergyConsumption(EnergyConsumption):
     """
     Energy Consumption of a Linux device.
@@ -173,45 +213,148 @@ class LinuxEnergyConsumption(EnergyConsumption):
     - AMD (kernel 5.8+): Also uses powercap interface (same path as Intel)
     - AMD (older/alternative): Uses HWMON interface via amd_energy driver
 
+    The sensors are detected once into a sensor plan, probed again every reprobe interval or after a failure,
+    so the ticks only read the sensors known to work. The power of the Nvidia GPUs is streamed by nvidia-smi.
+    After a failure, the last plan is kept until the re-probe, backed off exponentially while the failures persist
+    from the reprobe backoff up to the reprobe interval.
     """
 
     rapl: RAPL = RAPL()
     amd_rapl: AMDRAPL = AMDRAPL()
-    _active_sensor: str = ""
+    reprobe_interval_in_seconds: float = 600.0
+    reprobe_backoff_in_seconds: float = 10.0
+    _plan: SensorPlan | None = PrivateAttr(default=None)
+    _reprobe_at: float | None = PrivateAttr(default=None)
+    _reprobe_backoff: float = PrivateAttr(default=0.0)
+
+    @property
+    def plan(self) -> SensorPlan | None:
+        """
+        Get the current sensor plan.
 
-    async def get_energy_usage(self) -> EnergyUsage:
+        :return: the sensor plan, None before the first probe
         """
-        Run the sensor and generate energy usage.
+        return self._plan
 
-        Tries sensors in order of preference:
+    async def probe(self) -> SensorPlan:
+        """
+        Detect the sensors of the host into a new sensor plan.
+
+        Tries the CPU sensors in order of preference:
         1. Intel RAPL (powercap) - works for Intel and AMD on kernel 5.8+
         2. AMD RAPL (HWMON) - fallback for AMD with amd_energy driver
 
-        GPU power is also queried if available (NVIDIA or AMD GPU).
+        The GPU vendor is detected in a thread, so the one-shot GPU tools do not block the event loop.
 
-        :return: the generated energy usage.
+        :return: the sensor plan
         """
-        energy_usage: EnergyUsage
-        if self.rapl.is_rapl_compatible():
-            if self._active_sensor != "intel_rapl":
-                logger.info("Using Intel RAPL (powercap) for energy measurement")
-                self._active_sensor = "intel_rapl"
-            energy_usage = await self.rapl.get_energy_report()
+        self._reprobe_at = None
+        cpu_sensor = None
+        if await asyncio.to_thread(self.rapl.is_rapl_compatible):
+            cpu_sensor = "intel_rapl"
         elif await self.amd_rapl.is_amd_rapl_compatible():
-            if self._active_sensor != "amd_rapl":
+            cpu_sensor = "amd_rapl"
+        gpu_vendor = await asyncio.to_thread(GPUInfo.detect_gpu_vendor)
+        plan = SensorPlan(cpu_sensor=cpu_sensor, gpu_vendor=gpu_vendor, probed_at=time.monotonic())
+        previous_plan = self._plan
+        if previous_plan is None or previous_plan.cpu_sensor != plan.cpu_sensor:
+            if plan.cpu_sensor == "intel_rapl":
+                logger.info("Using Intel RAPL (powercap) for energy measurement")
+            elif plan.cpu_sensor == "amd_rapl":
                 logger.info("Using AMD RAPL (HWMON) for energy measurement")
-                self._active_sensor = "amd_rapl"
-            energy_usage = await self.amd_rapl.get_energy_report()
-        else:
-            raise TracarbonException(
-                "No supported RAPL interface found. "
-                "Intel RAPL requires /sys/class/powercap/intel-rapl. "
-                "AMD RAPL requires kernel 5.8+ or amd_energy driver."
-            )
+        self._plan = plan
+        if plan.gpu_vendor == "nvidia":
+            NvidiaGPU.start_sampler()
+        return plan
 
-        energy_usage.gpu_energy_usage = GPUInfo.get_gpu_power_usage_or_none()
+    def _schedule_reprobe(self) -> None:
+        """
+        Schedule a re-probe after a failure, unless already scheduled, doubling the backoff since the last success.
+        """
+        if self._reprobe_at is not None:
+            return
+        self._reprobe_backoff = min(
+            max(self._reprobe_backoff * 2, self.reprobe_backoff_in_seconds), self.reprobe_interval_in_seconds
+        )
+        self._reprobe_at = time.monotonic() + self._reprobe_backoff
+
+    async def get_energy_usage(self) -> EnergyUsage:
+        """
+        Run the sensor and generate energy usage.
+
+        The sensors of the sensor plan are read, the plan being probed first if it is missing, expired
+        or if a re-probe is due after a failure.
+        GPU power is also queried if available (NVIDIA or AMD GPU), with the usage of each GPU from the same query,
+        in a thread so the GPU tools do not block the event loop.
+
+        :return: the generated energy usage.
+        """
+        plan = self._plan
+        now = time.monotonic()
+        if (
+            plan is None
+            or now - plan.probed_at >= self.reprobe_interval_in_seconds
+            or (self._reprobe_at is not None and now >= self._reprobe_at)
+        ):
+            plan = await self.probe()
+
+        energy_usage: EnergyUsage
+        try:
+            if plan.cpu_sensor == "intel_rapl":
+                energy_usage = await self.rapl.get_energy_report()
+            elif plan.cpu_sensor == "amd_rapl":
+                energy_usage = await self.amd_rapl.get_energy_report()
+            else:
+                raise TracarbonException(
+                    "No supported RAPL interface found. "
+                    "Intel RAPL requires /sys/class/powercap/intel-rapl. "
+                    "AMD RAPL requires kernel 5.8+ or amd_energy driver."
+                )
+        except Exception:
+            self._schedule_reprobe()
+            raise
+
+        # The GPU power is read from the GPU tools, the energy of the RAPL GPU domains is not accumulated with it
+        energy_usage.gpu_energy_usage = None
+        if energy_usage.energy_totals_in_joules is not None:
+            energy_usage.energy_totals_in_joules.pop(UsageType.GPU, None)
+        if plan.gpu_vendor is not None:
+            try:
+                gpu_devices, gpu_power = await asyncio.to_thread(self._read_gpu_usage, plan.gpu_vendor)
+                if gpu_devices:
+                    energy_usage.gpu_devices = gpu_devices
+                energy_usage.gpu_energy_usage = gpu_power if gpu_power > 0.0 else None
+            except HardwareNoGPUDetectedException:
+                logger.debug(f"{plan.gpu_vendor} GPU no longer available, the sensors will be probed again")
+                self._schedule_reprobe()
+                return energy_usage
+        self._reprobe_at = None
+        self._reprobe_backoff = 0.0
         return energy_usage
 
+    @staticmethod
+    def _read_gpu_usage(vendor: str) -> Tuple[List[GPUDevice] | None, float]:
+        """
+        Read the usage of each GPU of the vendor, or else the total power of its GPUs.
+
+        :param vendor: the GPU vendor
+        :return: the GPU devices, None or empty without devices, and the total GPU power in W
+        """
+        gpu_devices = GPUInfo.get_vendor_gpu_devices(vendor=vendor)
+        if gpu_devices:
+            return gpu_devices, sum(device.power for device in gpu_devices)
+        return gpu_devices, GPUInfo.get_vendor_gpu_power_usage(vendor=vendor)
+
+    async def prime(self) -> None:
+        """
+        Probe the sensors and take a baseline reading of the RAPL energy counters.
+        """
+        plan = await self.probe()
+        if plan.cpu_sensor == "intel_rapl":
+            await self.rapl.prime()
+        elif plan.cpu_sensor == "amd_rapl":
+            await self.amd_rapl.prime()
+
 
 class WindowsEnergyConsumption(EnergyConsumption):
     """
@@ -276,7 +419,7 @@ class AWSEC2EnergyConsumption(EnergyConsumption):
 
         :return: the generated energy usage.
         """
-        cpu_usage = HardwareInfo.get_cpu_usage()
+        cpu_usage = await asyncio.to_thread(HardwareInfo.get_cpu_usage)
         if cpu_usage >= 90:
             cpu_watts = self.cpu_at_100
         elif cpu_usage >= 50:
@@ -287,7 +430,7 @@ class AWSEC2EnergyConsumption(EnergyConsumption):
             cpu_watts = self.cpu_idle
         logger.debug(f"CPU: {cpu_watts}W")
 
-        memory_usage = HardwareInfo.get_memory_usage()
+        memory_usage = await asyncio.to_thread(HardwareInfo.get_memory_usage)
         if memory_usage >= 90:
             memory_watts = self.memory_at_100
         elif memory_usage >= 50:
@@ -300,7 +443,7 @@ class AWSEC2EnergyConsumption(EnergyConsumption):
 
         gpu_watts = 0.0
         if self.has_gpu:
-            gpu_watts = HardwareInfo.get_gpu_power_usage()
+            gpu_watts = await asyncio.to_thread(HardwareInfo.get_gpu_power_usage)
             logger.debug(f"CPU: {gpu_watts}W")
 
         total_watts = cpu_watts + memory_watts + gpu_watts + self.delta_full_machine
@@ -317,6 +460,7 @@ class CloudEnergyConsumption(EnergyConsumption):
     """
     Base class for cloud provider energy consumption.
     Uses linear interpolation between min and max watts based on CPU usage.
+    The power of the Nvidia GPUs is streamed by nvidia-smi once primed.
     """
 
     min_watts: float
@@ -365,6 +509,13 @@ class CloudEnergyConsumption(EnergyConsumption):
             logger.exception(f"Error in the {provider_name}Sensor")
             raise exception_class(exception) from exception
 
+    async def prime(self) -> None:
+        """
+        Detect the GPU vendor and start the streaming sampler of the Nvidia GPUs.
+        """
+        if GPUInfo.detect_gpu_vendor() == "nvidia":
+            NvidiaGPU.start_sampler()
+
     async def get_energy_usage(self) -> EnergyUsage:
         """
         Run the sensor and generate energy usage using linear interpolation.
@@ -372,13 +523,13 @@ class CloudEnergyConsumption(EnergyConsumption):
         :return: the generated energy usage.
         """
         provider_name = self._get_provider_name()
-        cpu_usage = HardwareInfo.get_cpu_usage() / 100.0  # Convert to 0-1 range
+        cpu_usage = await asyncio.to_thread(HardwareInfo.get_cpu_usage) / 100.0  # Convert to 0-1 range
 
         # Linear interpolation: power = min_watts + (max_watts - min_watts) * cpu_usage
         cpu_watts = self.min_watts + (self.max_watts - self.min_watts) * cpu_usage
         logger.debug(f"{provider_name} CPU: {cpu_watts:.2f}W (usage: {cpu_usage * 100:.1f}%)")
 
-        gpu_watts = GPUInfo.get_gpu_power_usage_or_none() or 0.0
+        gpu_watts = await asyncio.to_thread(GPUInfo.get_gpu_power_usage_or_none) or 0.0
         if gpu_watts > 0:
             logger.debug(f"{provider_name} GPU: {gpu_watts:.2f}W")
 
@@ -0,0 +1,18 @@
+import os
+
+__all__ = [
+    "read_sysfs_counter",
+]
+
+
+def read_sysfs_counter(fd: int) -> bytes:
+    """
+    Read a sysfs counter from the start of its open file, the file being regenerated on each read from the start.
+
+    :param fd: the file descriptor of the counter
+    :return: the content of the counter
+    """
+    if hasattr(os, "pread"):
+        return os.pread(fd, 32, 0)
+    os.lseek(fd, 0, os.SEEK_SET)
+    return os.read(fd, 32)
@@ -0,0 +1,172 @@
+import functools
+import time
+from enum import Enum
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import TypeVar
+
+from loguru import logger
+
+__all__ = [
+    "HookPoint",
+    "HookRegistry",
+    "HOOKS",
+]
+
+T = TypeVar("T")
+
+BeforeHook = Callable[["HookPoint", Any, int], None]
+AfterHook = Callable[["HookPoint", Any, int, int, BaseException | None], None]
+
+
+class HookPoint(str, Enum):
+    """
+    Hot paths of Tracarbon where hooks can be attached.
+    """
+
+    SENSOR = "sensor.get_energy_usage"
+    LOCATION = "location.get_latest_co2g_kwh"
+    METRIC_GENERATOR = "metric_generator.generate"
+    EXPORTER = "exporter.launch"
+
+
+class HookRegistry:
+    """
+    Registry of the callbacks run before and after the hot paths of Tracarbon, to attach profilers and tracers.
+
+    A before hook is called with the hook point, the source object and the monotonic start time in nanoseconds.
+    An after hook is also called with the monotonic end time in nanoseconds and the raised exception, if any.
+    The hooked methods are only wrapped while hooks are registered, so the hot paths cost nothing without hooks.
+    The hooks run in the event loop of the scheduler: they must be fast.
+    """
+
+    __slots__ = ("active", "_before", "_after", "_hooked_methods")
+
+    def __init__(self) -> None:
+        self.active = False
+        self._before: Dict[HookPoint, List[BeforeHook]] = {point: [] for point in HookPoint}
+        self._after: Dict[HookPoint, List[AfterHook]] = {point: [] for point in HookPoint}
+        self._hooked_methods: List[Tuple[type, str, HookPoint, Callable[..., Awaitable[Any]]]] = []
+
+    def register(self, point: HookPoint, before: BeforeHook | None = None, after: AfterHook | None = None) -> None:
+        """
+        Register hooks on a hook point.
+
+        :param point: the hook point
+        :param before: the callback run before the hot path
+        :param after: the callback run after the hot path
+        """
+        if before is not None:
+            self._before[point].append(before)
+        if after is not None:
+            self._after[point].append(after)
+        self._update()
+
+    def unregister(self, point: HookPoint, before: BeforeHook | None = None, after: AfterHook | None = None) -> None:
+        """
+        Unregister hooks from a hook point.
+
+        :param point: the hook point
+        :param before: the registered before callback
+        :param after: the registered after callback
+        """
+        if before is not None and before in self._before[point]:
+            self._before[point].remove(before)
+        if after is not None and after in self._after[point]:
+            self._after[point].remove(after)
+        self._update()
+
+    def clear(self) -> None:
+        """
+        Unregister all the hooks.
+        """
+        for point in HookPoint:
+            self._before[point] = []
+            self._after[point] = []
+        self._update()
+
+    def _update(self) -> None:
+        """
+        Install the hooked methods when the first hook is registered and restore them when the last one is removed.
+        """
+        active = any(self._before.values()) or any(self._after.values())
+        if active != self.active:
+            for cls, name, point, function in self._hooked_methods:
+                setattr(cls, name, self._wrap(point=point, function=function) if active else function)
+        self.active = active
+
+    def call(
+        self, point: HookPoint, source: Any, function: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> Awaitable[T]:
+        """
+        Call a coroutine function surrounded by the hooks of a hook point.
+
+        :param point: the hook point
+        :param source: the object running the hot path, passed to the hooks
+        :param function: the coroutine function
+        :return: the awaitable of the result of the function
+        """
+        if not self.active:
+            return function(*args, **kwargs)
+        return self._call(point, source, function, *args, **kwargs)
+
+    async def _call(
+        self, point: HookPoint, source: Any, function: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        start = time.monotonic_ns()
+        for before in self._before[point]:
+            try:
+                before(point, source, start)
+            except Exception:
+                logger.exception(f"Before hook {before} failed on {point.value}.")
+        error: BaseException | None = None
+        try:
+            return await function(*args, **kwargs)
+        except BaseException as exception:
+            error = exception
+            raise
+        finally:
+            end = time.monotonic_ns()
+            for after in self._after[point]:
+                try:
+                    after(point, source, start, end, error)
+                except Exception:
+                    logger.exception(f"After hook {after} failed on {point.value}.")
+
+    def _wrap(self, point: HookPoint, function: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        """
+        Wrap a coroutine method to surround it by the hooks of a hook point, its instance being the source.
+
+        :param point: the hook point
+        :param function: the coroutine method
+        :return: the hooked coroutine method
+        """
+
+        @functools.wraps(function)
+        async def wrapper(source: Any, *args: Any, **kwargs: Any) -> Any:
+            return await self._call(point, source, function, source, *args, **kwargs)
+
+        return wrapper
+
+    def hook_method(self, cls: type, name: str, point: HookPoint) -> None:
+        """
+        Hook the coroutine method of a class if the class implements it, to hook the implementations of an interface.
+        The method is only replaced by its hooked wrapper while hooks are registered.
+
+        :param cls: the class
+        :param name: the name of the method
+        :param point: the hook point
+        """
+        function = cls.__dict__.get(name)
+        if function is None or getattr(function, "__isabstractmethod__", False):
+            return
+        self._hooked_methods.append((cls, name, point, function))
+        if self.active:
+            setattr(cls, name, self._wrap(point=point, function=function))
+
+
+HOOKS = HookRegistry()
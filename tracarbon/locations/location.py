@@ -11,6 +11,9 @@ from loguru import logger
 from pydantic import BaseModel
 from pydantic import Field
 
+from tracarbon.hooks import HOOKS
+from tracarbon.hooks import HookPoint
+
 
 class CarbonIntensitySource(str, Enum):
     FILE = "file"
@@ -42,6 +45,8 @@ class CarbonIntensityMetadata(BaseModel):
 class Location(ABC, BaseModel):
     """
     Generic Location.
+
+    The get_latest_co2g_kwh implementations of the subclasses are surrounded by the location hooks.
     """
 
     name: str
@@ -52,6 +57,11 @@ class Location(ABC, BaseModel):
     emission_factor_type: EmissionFactorType = EmissionFactorType.LIFECYCLE
     carbon_intensity_metadata: CarbonIntensityMetadata = Field(default_factory=CarbonIntensityMetadata)
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        HOOKS.hook_method(cls=cls, name="get_latest_co2g_kwh", point=HookPoint.LOCATION)
+
     @classmethod
     async def request(cls, url: str, headers: Dict[str, str] | None = None) -> Dict[str, Any]:
         """
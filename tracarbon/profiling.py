@@ -0,0 +1,156 @@
+import cProfile
+import os
+import sys
+from collections import Counter
+from enum import Enum
+from threading import Event
+from threading import Thread
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from loguru import logger
+
+from tracarbon.hooks import HOOKS
+from tracarbon.hooks import HookPoint
+from tracarbon.scheduler import Scheduler
+
+__all__ = [
+    "ProfilerMode",
+    "Profiler",
+]
+
+
+class ProfilerMode(str, Enum):
+    """
+    Profiler run on the thread of the scheduler.
+    """
+
+    CPROFILE = "cprofile"
+    SAMPLING = "sampling"
+
+
+class Profiler:
+    """
+    Profile where the time of the agent goes.
+
+    The durations of the hot paths are collected through the hooks, per hook point and source class. The functions run
+    by the scheduler are profiled with cProfile, dumped as pstats, or sampled periodically, dumped as folded stacks
+    for flame graphs.
+    """
+
+    __slots__ = (
+        "mode",
+        "output_path",
+        "sampling_interval_in_seconds",
+        "hook_durations",
+        "stacks",
+        "_profile",
+        "_sampler",
+        "_stopping",
+        "_scheduler",
+    )
+
+    def __init__(
+        self, mode: ProfilerMode, output_path: str | None = None, sampling_interval_in_seconds: float = 0.01
+    ) -> None:
+        self.mode = mode
+        self.output_path = (
+            output_path if output_path else f"tracarbon.{'prof' if mode == ProfilerMode.CPROFILE else 'folded'}"
+        )
+        self.sampling_interval_in_seconds = sampling_interval_in_seconds
+        self.hook_durations: Dict[Tuple[str, str], List[int]] = {}
+        self.stacks: Counter[str] = Counter()
+        self._profile = cProfile.Profile()
+        self._sampler: Thread | None = None
+        self._stopping = Event()
+        self._scheduler: Scheduler | None = None
+
+    def start(self, scheduler: Scheduler) -> None:
+        """
+        Start profiling the hot paths and the thread of the scheduler.
+
+        :param scheduler: the running scheduler to profile
+        """
+        self._scheduler = scheduler
+        for point in HookPoint:
+            HOOKS.register(point=point, after=self._record_hook)
+        if self.mode == ProfilerMode.CPROFILE:
+            scheduler.run(self._enable_profile())
+        else:
+            self._stopping.clear()
+            self._sampler = Thread(
+                target=self._sample, args=(scheduler.thread_id,), name="tracarbon-profiler", daemon=True
+            )
+            self._sampler.start()
+        logger.info(f"Profiler[{self.mode.value}] started.")
+
+    def stop(self) -> None:
+        """
+        Stop profiling, dump the profile to the output path and log the durations of the hot paths.
+        """
+        for point in HookPoint:
+            HOOKS.unregister(point=point, after=self._record_hook)
+        if self.mode == ProfilerMode.CPROFILE:
+            if self._scheduler is not None and self._scheduler.is_running:
+                self._scheduler.run(self._disable_profile())
+            self._profile.dump_stats(self.output_path)
+        else:
+            self._stopping.set()
+            if self._sampler is not None:
+                self._sampler.join()
+                self._sampler = None
+            with open(self.output_path, "w") as file:
+                file.writelines(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+        self._scheduler = None
+        logger.info(f"Profiler[{self.mode.value}] dumped to {self.output_path}.\n{self.summary()}")
+
+    def summary(self) -> str:
+        """
+        Summarize the durations of the hot paths, from the longest total duration.
+
+        :return: one line per hook point and source class
+        """
+        lines = []
+        for (point, source), (count, total, maximum) in sorted(
+            self.hook_durations.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            lines.append(
+                f"{point} {source}: {count} call(s), {total / 1e6:.3f} ms total, "
+                f"{total / count / 1e6:.3f} ms mean, {maximum / 1e6:.3f} ms max"
+            )
+        return "\n".join(lines)
+
+    def _record_hook(self, point: HookPoint, source: Any, start: int, end: int, error: BaseException | None) -> None:
+        duration = end - start
+        durations = self.hook_durations.get((point.value, type(source).__name__))
+        if durations is None:
+            self.hook_durations[(point.value, type(source).__name__)] = [1, duration, duration]
+            return
+        durations[0] += 1
+        durations[1] += duration
+        if duration > durations[2]:
+            durations[2] = duration
+
+    async def _enable_profile(self) -> None:
+        self._profile.enable()
+
+    async def _disable_profile(self) -> None:
+        self._profile.disable()
+
+    def _sample(self, thread_id: int | None) -> None:
+        """
+        Sample the stack of the thread of the scheduler until the profiler stops.
+
+        :param thread_id: the identifier of the thread to sample
+        """
+        while not self._stopping.wait(self.sampling_interval_in_seconds):
+            frame = sys._current_frames().get(thread_id) if thread_id is not None else None
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
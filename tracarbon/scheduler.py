@@ -0,0 +1,296 @@
+import asyncio
+import time
+from enum import Enum
+from functools import partial
+from threading import Event
+from threading import Thread
+from threading import current_thread
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Coroutine
+from typing import List
+from typing import TypeVar
+
+from loguru import logger
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import PrivateAttr
+
+from tracarbon.telemetry import TELEMETRY
+
+__all__ = [
+    "MissedTickPolicy",
+    "JobStatistics",
+    "PeriodicJob",
+    "Scheduler",
+]
+
+T = TypeVar("T")
+
+
+class MissedTickPolicy(str, Enum):
+    """
+    Policy applied when a periodic job misses one or more deadlines.
+    """
+
+    CATCH_UP = "catch_up"
+    SKIP = "skip"
+
+
+class JobStatistics(BaseModel):
+    """
+    Running statistics of a periodic job to measure the scheduling overhead.
+    """
+
+    tick_count: int = 0
+    missed_tick_count: int = 0
+    last_tick_duration_in_seconds: float = 0.0
+    total_tick_duration_in_seconds: float = 0.0
+    maximum_tick_duration_in_seconds: float = 0.0
+    last_tick_lateness_in_seconds: float = 0.0
+    maximum_tick_lateness_in_seconds: float = 0.0
+
+    @property
+    def average_tick_duration_in_seconds(self) -> float:
+        """
+        Get the average duration of a tick.
+
+        :return: the average duration of a tick in seconds
+        """
+        return self.total_tick_duration_in_seconds / self.tick_count if self.tick_count else 0.0
+
+
+class PeriodicJob(BaseModel):
+    """
+    A callback run periodically by the scheduler on monotonic deadlines.
+
+    The deadlines are computed from the start of the job and not from the end of the previous run,
+    so the interval does not drift with the duration of the callback.
+    """
+
+    name: str
+    interval_in_seconds: float
+    missed_tick_policy: MissedTickPolicy = MissedTickPolicy.SKIP
+    max_catch_up_ticks: int = 1
+    delay_in_seconds: float = 0.0
+    statistics: JobStatistics = Field(default_factory=JobStatistics)
+    _callback: Callable[[], Awaitable[None]] | None = PrivateAttr(default=None)
+    _first_run: Event = PrivateAttr(default_factory=Event)
+
+    def wait_for_first_run(self, timeout: float | None = None) -> bool:
+        """
+        Block until the first run of the job is done.
+
+        :param timeout: the maximum time to wait in seconds
+        :return: if the first run is done
+        """
+        return self._first_run.wait(timeout=timeout)
+
+    def _next_deadline(self, deadline: float, now: float) -> float:
+        """
+        Compute the next deadline of the job by applying the missed tick policy.
+
+        :param deadline: the next theoretical deadline
+        :param now: the current monotonic time
+        :return: the deadline of the next run
+        """
+        if now < deadline:
+            return deadline
+        missed_ticks = int((now - deadline) // self.interval_in_seconds) + 1
+        if self.missed_tick_policy == MissedTickPolicy.CATCH_UP:
+            skipped_ticks = max(missed_ticks - self.max_catch_up_ticks, 0)
+        else:
+            skipped_ticks = missed_ticks
+        if skipped_ticks:
+            self.statistics.missed_tick_count += skipped_ticks
+            logger.debug(f"Job[{self.name}] missed {skipped_ticks} tick(s).")
+        return deadline + skipped_ticks * self.interval_in_seconds
+
+    async def run(self) -> None:
+        """
+        Run the job until it is cancelled.
+        """
+        if self._callback is None:
+            raise ValueError(f"Job[{self.name}] has no callback.")
+        deadline = time.monotonic() + self.delay_in_seconds
+        if self.delay_in_seconds > 0:
+            await asyncio.sleep(self.delay_in_seconds)
+        while True:
+            start = time.monotonic()
+            lateness = start - deadline
+            try:
+                await self._callback()
+            except Exception:
+                logger.exception(f"Job[{self.name}] failed.")
+            finally:
+                duration = time.monotonic() - start
+                statistics = self.statistics
+                statistics.tick_count += 1
+                statistics.last_tick_duration_in_seconds = duration
+                statistics.total_tick_duration_in_seconds += duration
+                statistics.maximum_tick_duration_in_seconds = max(statistics.maximum_tick_duration_in_seconds, duration)
+                statistics.last_tick_lateness_in_seconds = lateness
+                statistics.maximum_tick_lateness_in_seconds = max(statistics.maximum_tick_lateness_in_seconds, lateness)
+                TELEMETRY.record(kind="tick", name=self.name, duration_in_seconds=duration)
+                self._first_run.set()
+            deadline = self._next_deadline(deadline=deadline + self.interval_in_seconds, now=time.monotonic())
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+
+class Scheduler(BaseModel):
+    """
+    Long-lived scheduler: one background thread owning one event loop for all the periodic jobs.
+    """
+
+    name: str = "tracarbon-scheduler"
+    startup_duration_in_seconds: float | None = None
+    jobs: List[PeriodicJob] = Field(default_factory=list)
+    _loop: asyncio.AbstractEventLoop | None = PrivateAttr(default=None)
+    _thread: Thread | None = PrivateAttr(default=None)
+    _ready: Event = PrivateAttr(default_factory=Event)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the event loop of the scheduler is running.
+
+        :return: if the scheduler is running
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_current_thread(self) -> bool:
+        """
+        Check if the caller runs in the thread of the scheduler.
+
+        :return: if the current thread is the thread of the scheduler
+        """
+        return self._thread is current_thread()
+
+    @property
+    def thread_id(self) -> int | None:
+        """
+        Get the identifier of the thread of the scheduler, to profile it.
+
+        :return: the identifier of the thread if the scheduler is running
+        """
+        return self._thread.ident if self._thread is not None else None
+
+    def start(self) -> None:
+        """
+        Start the background thread and its event loop.
+        """
+        if self.is_running:
+            return
+        start = time.perf_counter()
+        self._ready.clear()
+        self._loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self._run_loop, name=self.name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        self.startup_duration_in_seconds = time.perf_counter() - start
+        logger.debug(f"Scheduler[{self.name}] started in {self.startup_duration_in_seconds:.6f}s.")
+
+    def _run_loop(self) -> None:
+        """
+        Run the event loop forever and clean it up once stopped.
+        """
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError("Scheduler event loop not initialized")
+        asyncio.set_event_loop(loop)
+        loop.call_soon(self._ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    def schedule(
+        self,
+        callback: Callable[[], Awaitable[None]],
+        interval_in_seconds: float,
+        missed_tick_policy: MissedTickPolicy = MissedTickPolicy.SKIP,
+        max_catch_up_ticks: int = 1,
+        name: str | None = None,
+        delay_in_seconds: float = 0.0,
+    ) -> PeriodicJob:
+        """
+        Schedule a periodic callback on the event loop of the scheduler, starting immediately or after a delay.
+
+        :param callback: the coroutine function to run
+        :param interval_in_seconds: the interval between two deadlines
+        :param missed_tick_policy: the policy to apply when deadlines are missed
+        :param max_catch_up_ticks: the maximum number of missed ticks to run back-to-back with the catch-up policy
+        :param name: the name of the job
+        :param delay_in_seconds: the delay before the first run
+        :return: the scheduled job
+        """
+        if interval_in_seconds <= 0:
+            raise ValueError(f"The interval must be positive, got {interval_in_seconds}.")
+        job = PeriodicJob(
+            name=name if name else f"job-{len(self.jobs)}",
+            interval_in_seconds=interval_in_seconds,
+            missed_tick_policy=missed_tick_policy,
+            max_catch_up_ticks=max_catch_up_ticks,
+            delay_in_seconds=delay_in_seconds,
+        )
+        job._callback = callback
+        self.jobs.append(job)
+        self._get_loop().call_soon_threadsafe(self._create_task, job)
+        return job
+
+    def _create_task(self, job: PeriodicJob) -> None:
+        self._get_loop().create_task(job.run(), name=job.name)
+
+    def spawn(self, coroutine: Coroutine[Any, Any, Any], name: str | None = None) -> None:
+        """
+        Run a long-lived coroutine on the event loop of the scheduler without waiting for it.
+        It is cancelled when the scheduler stops.
+
+        :param coroutine: the coroutine to run
+        :param name: the name of the task
+        """
+        self._get_loop().call_soon_threadsafe(partial(self._get_loop().create_task, coroutine, name=name))
+
+    def run(self, coroutine: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """
+        Run a coroutine on the event loop of the scheduler and wait for its result.
+
+        :param coroutine: the coroutine to run
+        :param timeout: the maximum time to wait in seconds
+        :return: the result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result(timeout=timeout)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop the jobs, the event loop and its thread.
+
+        :param timeout: the maximum time to wait for the thread in seconds
+        """
+        loop = self._loop
+        thread = self._thread
+        if loop is not None and thread is not None and thread.is_alive():
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not current_thread():
+                thread.join(timeout=timeout)
+        self._loop = None
+        self._thread = None
+        self.jobs = []
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None or not self.is_running:
+            raise RuntimeError(f"Scheduler[{self.name}] is not running.")
+        return self._loop
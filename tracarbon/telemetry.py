@@ -0,0 +1,155 @@
+import functools
+import inspect
+import math
+import time
+from array import array
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+from typing import TypeVar
+from typing import cast
+
+__all__ = [
+    "LatencyHistogram",
+    "Telemetry",
+    "TELEMETRY",
+]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class LatencyHistogram:
+    """
+    Histogram of durations in power-of-two buckets of microseconds, recorded in constant time and memory.
+
+    The bucket i counts the durations in [2^(i-1), 2^i) microseconds, so a quantile is estimated within a factor of two.
+    """
+
+    __slots__ = ("counts", "count", "total", "maximum")
+
+    BUCKET_COUNT = 40
+
+    def __init__(self) -> None:
+        self.counts = array("Q", bytes(8 * self.BUCKET_COUNT))
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def record(self, duration_in_seconds: float) -> None:
+        """
+        Record a duration.
+
+        :param duration_in_seconds: the duration in seconds
+        """
+        index = math.frexp(duration_in_seconds * 1e6)[1] if duration_in_seconds > 0 else 0
+        self.counts[min(max(index, 0), self.BUCKET_COUNT - 1)] += 1
+        self.count += 1
+        self.total += duration_in_seconds
+        if duration_in_seconds > self.maximum:
+            self.maximum = duration_in_seconds
+
+    @property
+    def mean(self) -> float | None:
+        """
+        Get the mean duration.
+
+        :return: the mean duration in seconds or None without durations
+        """
+        return self.total / self.count if self.count else None
+
+    def quantile(self, quantile: float) -> float | None:
+        """
+        Estimate a quantile of the durations by the upper bound of its bucket.
+
+        :param quantile: the quantile to estimate, between 0 and 1
+        :return: the estimated quantile in seconds or None without durations
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError(f"The quantile must be between 0 and 1, got {quantile}.")
+        if self.count == 0:
+            return None
+        rank = quantile * (self.count - 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen > rank:
+                return min(2.0**index / 1e6, self.maximum)
+        return self.maximum
+
+
+class Telemetry:
+    """
+    Self-telemetry of Tracarbon: the latency histograms of its ticks, sensor reads and exports.
+
+    Nothing is recorded until it is enabled, so the instrumented code only pays a flag check.
+    """
+
+    __slots__ = ("enabled", "histograms")
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    def record(self, kind: str, name: str, duration_in_seconds: float) -> None:
+        """
+        Record a duration in the histogram of its source.
+
+        :param kind: the kind of the source: tick, sensor or export
+        :param name: the name of the source
+        :param duration_in_seconds: the duration in seconds
+        """
+        if not self.enabled:
+            return
+        histogram = self.histograms.get((kind, name))
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.histograms[(kind, name)] = histogram
+        histogram.record(duration_in_seconds=duration_in_seconds)
+
+    def timed(self, kind: str, name: str) -> Callable[[F], F]:
+        """
+        Decorate a function or a coroutine function to record its durations.
+
+        :param kind: the kind of the source: tick, sensor or export
+        :param name: the name of the source
+        :return: the decorator
+        """
+
+        def decorator(function: F) -> F:
+            if inspect.iscoroutinefunction(function):
+
+                @functools.wraps(function)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    if not self.enabled:
+                        return await function(*args, **kwargs)
+                    start = time.perf_counter()
+                    try:
+                        return await function(*args, **kwargs)
+                    finally:
+                        self.record(kind=kind, name=name, duration_in_seconds=time.perf_counter() - start)
+
+                return cast(F, async_wrapper)
+
+            @functools.wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(kind=kind, name=name, duration_in_seconds=time.perf_counter() - start)
+
+            return cast(F, wrapper)
+
+        return decorator
+
+    def reset(self) -> None:
+        """
+        Clear the histograms.
+        """
+        self.histograms = {}
+
+
+TELEMETRY = Telemetry()